@@ -0,0 +1,106 @@
+"""
+SQL Transfer Tool - Yazma Yolu Karşılaştırması
+Geniş bir tabloda eski (satır başına dict + insert()) yazma yolu ile
+demet tabanlı InsertWriter yolunun CPU süresini ve tepe belleğini ölçer.
+
+Kullanım:
+    python benchmark.py [satır_sayısı] [sütun_sayısı] [parça_boyutu]
+"""
+
+import sys
+import os
+import tempfile
+import time
+import tracemalloc
+
+# Core modüllerini import et
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from sqlalchemy import Table, MetaData, Column, Integer, String, Float, insert
+from core.database_connection import DatabaseConnection
+from core.bulk_writers import InsertWriter
+
+
+def create_target(path: str, column_count: int):
+    """Geniş hedef tabloyu içeren SQLite bağlantısı oluşturur"""
+    conn = DatabaseConnection('sqlite', '', 0, '', '', path)
+    conn.connect()
+    
+    metadata = MetaData()
+    columns = [Column('id', Integer, primary_key=True)]
+    for i in range(column_count):
+        column_type = Float if i % 2 else String(32)
+        columns.append(Column(f'c{i}', column_type))
+    table = Table('wide_table', metadata, *columns)
+    metadata.create_all(conn.engine)
+    return conn, table
+
+
+def make_rows(row_count: int, column_count: int):
+    """Test satırlarını üretir"""
+    rows = []
+    for row_id in range(row_count):
+        values = [row_id]
+        for i in range(column_count):
+            values.append(row_id * 0.5 if i % 2 else f'deger_{row_id}_{i}')
+        rows.append(tuple(values))
+    return rows
+
+
+def write_with_dicts(conn: DatabaseConnection, table: Table, column_names, chunk):
+    """Eski yol: satır başına dict ve SQLAlchemy insert()"""
+    with conn.engine.connect() as target_conn:
+        rows_dict = [dict(zip(column_names, row)) for row in chunk]
+        target_conn.execute(insert(table), rows_dict)
+        target_conn.commit()
+
+
+def measure(name: str, write, rows, chunk_size: int):
+    """Yazma fonksiyonunun CPU süresini ve parça başına tepe belleğini ölçer"""
+    tracemalloc.start()
+    start = time.process_time()
+    
+    for offset in range(0, len(rows), chunk_size):
+        write(rows[offset:offset + chunk_size])
+    
+    elapsed = time.process_time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    print(f"{name:<28} CPU: {elapsed:8.3f} sn   Tepe bellek: {peak / 1024 / 1024:8.2f} MB")
+    return elapsed
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    column_count = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+    chunk_size = int(sys.argv[3]) if len(sys.argv) > 3 else 5000
+    
+    print("=" * 60)
+    print(f"{row_count} satır, {column_count + 1} sütun, parça boyutu {chunk_size}")
+    print("=" * 60)
+    
+    rows = make_rows(row_count, column_count)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        before_conn, before_table = create_target(os.path.join(temp_dir, 'before.db'), column_count)
+        after_conn, after_table = create_target(os.path.join(temp_dir, 'after.db'), column_count)
+        column_names = [column.name for column in before_table.columns]
+        
+        before = measure(
+            "Önce (dict + insert())",
+            lambda chunk: write_with_dicts(before_conn, before_table, column_names, chunk),
+            rows, chunk_size
+        )
+        
+        writer = InsertWriter(after_conn, after_table, column_names)
+        after = measure("Sonra (demet + executemany)", writer.write, rows, chunk_size)
+        
+        before_conn.close()
+        after_conn.close()
+    
+    if after > 0:
+        print(f"\nHızlanma: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
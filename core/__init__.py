@@ -6,6 +6,8 @@ Veritabanı bağlantısı, veri aktarımı ve güvenli depolama işlevlerini iç
 from .database_connection import DatabaseConnection, ConnectionManager
 from .transfer_engine import DataTransferEngine, TransferOptions, TransferProgress
 from .connection_storage import ConnectionStorage, create_connection_dict
+from .file_target import FileTarget
+from .file_source import FileSource
 
 __all__ = [
     'DatabaseConnection',
@@ -14,5 +16,7 @@ __all__ = [
     'TransferOptions',
     'TransferProgress',
     'ConnectionStorage',
-    'create_connection_dict'
+    'create_connection_dict',
+    'FileTarget',
+    'FileSource'
 ]
@@ -0,0 +1,270 @@
+"""
+Arrow Parça Modülü
+Bu modül, aktarım hattında satırları Python nesneleri yerine sütun bazlı
+pyarrow.RecordBatch olarak taşıyan isteğe bağlı yolu içerir.
+
+pyarrow kurulu değilse ARROW_AVAILABLE False olur ve motor satır tabanlı
+yolu kullanır. PostgreSQL için ADBC sürücüsü (adbc-driver-postgresql)
+kuruluysa okuma doğrudan Arrow olarak yapılır ve yazma adbc_ingest ile binary
+COPY üzerinden gerçekleştirilir; diğer durumlarda SQLAlchemy ile okunan
+parçalar RecordBatch'e çevrilir ve mevcut yazıcılar kullanılır.
+"""
+
+from sqlalchemy import Table
+from sqlalchemy.types import (
+    Boolean, SmallInteger, Integer, BigInteger, Numeric, Float,
+    String, DateTime, Date, Time, LargeBinary
+)
+from typing import List, Optional
+from urllib.parse import quote
+import importlib
+import logging
+import threading
+from .database_connection import DatabaseConnection
+from .type_mapping import ConversionPlan
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+ARROW_AVAILABLE = pa is not None
+
+# Dialect -> ADBC DBAPI modülü. SQLite sürücüsü sütun tiplerini değerlerden
+# çıkardığı (tarihler metin olarak döner) ve tek yazıcılı olduğu için kullanılmaz.
+_ADBC_MODULES = {
+    'postgresql': 'adbc_driver_postgresql.dbapi',
+}
+
+
+def _adbc_dbapi(db_type: str):
+    """Dialect için kurulu ADBC DBAPI modülünü döndürür, yoksa None"""
+    module_name = _ADBC_MODULES.get(db_type)
+    if module_name is None:
+        return None
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+
+def adbc_available(connection: DatabaseConnection) -> bool:
+    """Bağlantının dialect'i için ADBC sürücüsü kurulu mu"""
+    return _adbc_dbapi(connection.db_type) is not None
+
+
+def _adbc_connect(connection: DatabaseConnection, dbapi):
+    """Bağlantı bilgileriyle yeni bir ADBC bağlantısı açar"""
+    uri = (
+        f"postgresql://{quote(connection.username or '', safe='')}:"
+        f"{quote(connection.password or '', safe='')}@{connection.host}:{connection.port}/"
+        f"{quote(connection.database, safe='')}"
+    )
+    return dbapi.connect(uri)
+
+
+def arrow_type(column_type) -> Optional['pa.DataType']:
+    """SQLAlchemy tipinin Arrow karşılığı; belirlenemiyorsa None (tip çıkarılır)"""
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, SmallInteger):
+        return pa.int16()
+    if isinstance(column_type, BigInteger):
+        return pa.int64()
+    if isinstance(column_type, Integer):
+        return pa.int32()
+    if isinstance(column_type, Float):
+        return pa.float64()
+    if isinstance(column_type, Numeric):
+        if column_type.precision is not None and column_type.precision <= 38:
+            return pa.decimal128(column_type.precision, column_type.scale or 0)
+        return None
+    if isinstance(column_type, DateTime):
+        return pa.timestamp('us', tz='UTC' if column_type.timezone else None)
+    if isinstance(column_type, Date):
+        return pa.date32()
+    if isinstance(column_type, Time):
+        return pa.time64('us')
+    if isinstance(column_type, LargeBinary):
+        return pa.binary()
+    if isinstance(column_type, String):
+        return pa.string()
+    return None
+
+
+def rows_to_record_batch(rows, column_names: List[str], types: List[Optional['pa.DataType']]) -> 'pa.RecordBatch':
+    """Satır parçasını sütunlara ayırıp RecordBatch'e çevirir"""
+    columns = list(zip(*rows)) if rows else [()] * len(column_names)
+    arrays = []
+    for values, value_type in zip(columns, types):
+        try:
+            arrays.append(pa.array(values, type=value_type))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Sürücü farklı bir Python tipi döndürdüyse tip çıkarımına bırak
+            arrays.append(pa.array(values))
+    return pa.RecordBatch.from_arrays(arrays, names=column_names)
+
+
+def record_batch_to_rows(batch: 'pa.RecordBatch') -> list:
+    """RecordBatch'i satır tabanlı yazıcılar için demet listesine çevirir"""
+    return list(zip(*[column.to_pylist() for column in batch.columns]))
+
+
+def read_arrow_batches(connection: DatabaseConnection,
+                       table: Table,
+                       select_stmt,
+                       chunk_sizer):
+    """
+    Sorgu sonucunu RecordBatch parçaları halinde okur
+    
+    Args:
+        connection: Kaynak bağlantı
+        table: Kaynak tablo (ADBC yoksa Arrow tipleri buradan alınır)
+        select_stmt: Çalıştırılacak SELECT (sütunları tablo sırasında)
+        chunk_sizer: Parça başına en fazla satır sayısını veren boyutlandırıcı
+    """
+    column_names = [column.name for column in select_stmt.selected_columns]
+    dbapi = _adbc_dbapi(connection.db_type)
+    
+    if dbapi is not None:
+        select_sql = str(select_stmt.compile(
+            dialect=connection.engine.dialect,
+            compile_kwargs={"literal_binds": True}
+        ))
+        adbc_conn = _adbc_connect(connection, dbapi)
+        try:
+            cursor = adbc_conn.cursor()
+            try:
+                cursor.execute(select_sql)
+                for batch in cursor.fetch_record_batch():
+                    offset = 0
+                    while offset < batch.num_rows:
+                        batch_size = chunk_sizer.next_size()
+                        yield batch.slice(offset, batch_size)
+                        offset += batch_size
+            finally:
+                cursor.close()
+        finally:
+            adbc_conn.close()
+        return
+    
+    types = [arrow_type(table.columns[name].type) for name in column_names]
+    with connection.engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=chunk_sizer.next_size()).execute(select_stmt)
+        while True:
+            rows = result.fetchmany(chunk_sizer.next_size())
+            if not rows:
+                break
+            yield rows_to_record_batch(rows, column_names, types)
+
+
+def apply_plan(plan: ConversionPlan, batch: 'pa.RecordBatch') -> 'pa.RecordBatch':
+    """
+    Dönüştürme planını sütunlara uygular. Karşılığı olan dönüştürücüler
+    (bool, str, bytes) Arrow cast ile vektörel çalışır, diğerleri yalnızca
+    kendi sütunlarında Python'a çıkar.
+    """
+    if plan.is_noop() or batch.num_rows == 0:
+        return batch
+    
+    casts = {bool: pa.bool_(), str: pa.string(), bytes: pa.binary()}
+    arrays = list(batch.columns)
+    for index, convert in plan.converters:
+        column = arrays[index]
+        if convert in casts:
+            try:
+                arrays[index] = pc.cast(column, casts[convert])
+                continue
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                pass
+        arrays[index] = pa.array([None if value is None else convert(value) for value in column.to_pylist()])
+    return pa.RecordBatch.from_arrays(arrays, names=batch.schema.names)
+
+
+class ArrowWriter:
+    """
+    RecordBatch parçalarını hedefe yazan yazıcı.
+    
+    Hedef için ADBC sürücüsü varsa ve ekleme modundaysa parça, hedef tablo
+    tiplerine cast edilip adbc_ingest ile yazılır (PostgreSQL'de binary
+    COPY). Aksi halde parça demetlere çevrilip satır tabanlı yazıcıya verilir.
+    ADBC bağlantıları thread başına açılır ve close() ile kapatılır.
+    """
+    
+    def __init__(self,
+                 connection: DatabaseConnection,
+                 table: Table,
+                 column_names: List[str],
+                 row_writer,
+                 ingest: bool = True):
+        """
+        Args:
+            connection: Hedef veritabanı bağlantısı
+            table: Hedef tablo
+            column_names: Parçalardaki sütun sırası
+            row_writer: ADBC kullanılamadığında kullanılacak satır yazıcısı
+            ingest: False ise (ör. upsert) her zaman row_writer kullanılır
+        """
+        self.connection = connection
+        self.table = table
+        self.row_writer = row_writer
+        self.dbapi = _adbc_dbapi(connection.db_type) if ingest else None
+        self.schema = pa.schema([
+            pa.field(name, arrow_type(table.columns[name].type) or pa.null())
+            for name in column_names
+        ])
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+    
+    def _get_connection(self):
+        adbc_conn = getattr(self._local, 'connection', None)
+        if adbc_conn is None:
+            adbc_conn = _adbc_connect(self.connection, self.dbapi)
+            self._local.connection = adbc_conn
+            with self._lock:
+                self._connections.append(adbc_conn)
+        return adbc_conn
+    
+    def _cast_to_target(self, batch: 'pa.RecordBatch') -> 'pa.RecordBatch':
+        arrays = []
+        for column, field in zip(batch.columns, self.schema):
+            if pa.types.is_null(field.type) or column.type == field.type:
+                arrays.append(column)
+            else:
+                arrays.append(pc.cast(column, field.type))
+        return pa.RecordBatch.from_arrays(arrays, names=self.schema.names)
+    
+    def write(self, batch: 'pa.RecordBatch'):
+        """Bir parçayı hedef tabloya ekler ve commit eder"""
+        if batch.num_rows == 0:
+            return
+        
+        if self.dbapi is None:
+            self.row_writer.write(record_batch_to_rows(batch))
+            return
+        
+        adbc_conn = self._get_connection()
+        cursor = adbc_conn.cursor()
+        try:
+            cursor.adbc_ingest(self.table.name, self._cast_to_target(batch), mode='append')
+            adbc_conn.commit()
+        except Exception:
+            adbc_conn.rollback()
+            raise
+        finally:
+            cursor.close()
+    
+    def close(self):
+        """Açılan ADBC bağlantılarını kapatır"""
+        with self._lock:
+            for adbc_conn in self._connections:
+                try:
+                    adbc_conn.close()
+                except Exception as e:
+                    logger.warning(f"ADBC bağlantısı kapatılamadı: {str(e)}")
+            self._connections = []
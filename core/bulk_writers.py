@@ -0,0 +1,659 @@
+"""
+Toplu Yazma Modülü
+Bu modül, hedef veritabanına parça parça satır yazan yazıcı sınıflarını içerir.
+Hedefin dialect'ine göre en hızlı yükleme yöntemi seçilir, desteklenmeyen
+durumlarda standart INSERT yoluna geri dönülür.
+"""
+
+from sqlalchemy import Table, MetaData, Column, insert, text
+from sqlalchemy.types import JSON
+from sqlalchemy.sql import sqltypes
+from typing import List, Optional, Callable
+from datetime import date, datetime, time, timedelta
+import io
+import json
+import logging
+import os
+import tempfile
+from .database_connection import DatabaseConnection
+
+logger = logging.getLogger(__name__)
+
+
+# DBAPI paramstyle -> konumsal yer tutucu
+_POSITIONAL_PLACEHOLDERS = {
+    'qmark': '?',
+    'format': '%s',
+    'pyformat': '%s',
+}
+
+
+class InsertWriter:
+    """
+    Önceden derlenmiş INSERT ve DBAPI executemany ile yazan varsayılan yazıcı.
+    
+    Sütun sırası sabit olduğu için satırlar dictionary'e çevrilmeden demet
+    olarak sürücüye verilir. Dialect'in bind processor'ü olan sütunlar
+    (ör. SQLite'ta Decimal/DateTime) parça başına sütun sütun işlenir,
+    diğer sütunlara dokunulmaz.
+    """
+    
+    def __init__(self, connection: DatabaseConnection, table: Table, column_names: List[str]):
+        """
+        Args:
+            connection: Hedef veritabanı bağlantısı
+            table: Hedef tablo
+            column_names: Satırlardaki değerlerin sütun sırası
+        """
+        self.connection = connection
+        self.table = table
+        self.column_names = column_names
+        
+        dialect = connection.engine.dialect
+        preparer = dialect.identifier_preparer
+        columns_sql = ', '.join(preparer.quote(name) for name in column_names)
+        table_sql = preparer.format_table(table)
+        
+        self.use_execute_values = connection.db_type == 'postgresql'
+        placeholder = _POSITIONAL_PLACEHOLDERS.get(dialect.paramstyle)
+        
+        if self.use_execute_values:
+            # psycopg2 executemany satır satır çalışır; execute_values çok satırlı VALUES üretir
+            self.insert_sql = f"INSERT INTO {table_sql} ({columns_sql}) VALUES %s"
+        elif placeholder:
+            placeholders = ', '.join([placeholder] * len(column_names))
+            self.insert_sql = f"INSERT INTO {table_sql} ({columns_sql}) VALUES ({placeholders})"
+        else:
+            self.insert_sql = None
+        
+        self.processors = []
+        for i, name in enumerate(column_names):
+            column_type = table.columns[name].type
+            processor = column_type.dialect_impl(dialect).bind_processor(dialect)
+            if processor is not None:
+                self.processors.append((i, processor))
+    
+    def _prepare_rows(self, rows) -> list:
+        """Satırları sürücünün kabul ettiği demetlere çevirir, bind processor'leri uygular"""
+        if not self.processors:
+            if isinstance(rows[0], tuple):
+                return rows
+            return [tuple(row) for row in rows]
+        
+        prepared = [list(row) for row in rows]
+        for i, processor in self.processors:
+            for row in prepared:
+                value = row[i]
+                if value is not None:
+                    row[i] = processor(value)
+        return prepared
+    
+    def write(self, rows):
+        """Bir parça satırı hedef tabloya ekler ve commit eder"""
+        if not rows:
+            return
+        
+        if self.insert_sql is None:
+            # Konumsal parametre desteklemeyen sürücüler için SQLAlchemy yolu
+            with self.connection.engine.connect() as target_conn:
+                rows_dict = [dict(zip(self.column_names, row)) for row in rows]
+                target_conn.execute(insert(self.table), rows_dict)
+                target_conn.commit()
+            return
+        
+        raw_conn = self.connection.engine.raw_connection()
+        try:
+            self._load(raw_conn, rows)
+            raw_conn.commit()
+        except Exception:
+            raw_conn.rollback()
+            raise
+        finally:
+            raw_conn.close()
+    
+    def write_in_transaction(self, raw_conn, rows):
+        """
+        Parçayı çağıranın açık transaction'ında yazar; commit/rollback
+        çağırana bırakılır (ör. aralığı silip yeniden yazarken)
+        """
+        if rows:
+            self._load(raw_conn, rows)
+    
+    def _load(self, raw_conn, rows):
+        """Parçayı ham DBAPI bağlantısı üzerinden yazar (commit etmez)"""
+        prepared = self._prepare_rows(rows)
+        cursor = raw_conn.cursor()
+        try:
+            if self.use_execute_values:
+                from psycopg2.extras import execute_values
+                execute_values(cursor, self.insert_sql, prepared, page_size=len(prepared))
+            else:
+                cursor.executemany(self.insert_sql, prepared)
+        finally:
+            cursor.close()
+
+
+
+class UpsertWriter(InsertWriter):
+    """
+    Anahtar çakışmasında mevcut satırı güncelleyen yazıcı.
+    
+    InsertWriter'ın derlenmiş INSERT ifadesine dialect'in çakışma cümlesi
+    eklenir, böylece yazma yine parça başına tek bir executemany (PostgreSQL'de
+    execute_values) ile yapılır:
+    
+    - PostgreSQL / SQLite: INSERT ... ON CONFLICT (anahtar) DO UPDATE SET c = excluded.c
+    - MySQL: INSERT ... ON DUPLICATE KEY UPDATE c = VALUES(c)
+    
+    staging_rows verilirse bu boyuttaki ve daha büyük parçalar önce oturuma
+    özel geçici bir tabloya toplu yükleme yöntemiyle (COPY / LOAD DATA)
+    yüklenir, ardından tek bir INSERT ... SELECT ... ON CONFLICT /
+    ON DUPLICATE KEY ile hedefe birleştirilir.
+    """
+    
+    STAGING_SUFFIX = "__sqt_stage"
+    
+    def __init__(self,
+                 connection: DatabaseConnection,
+                 table: Table,
+                 column_names: List[str],
+                 key_columns: List[str],
+                 bulk_load: bool = True,
+                 staging_rows: int = 0):
+        """
+        Args:
+            connection: Hedef veritabanı bağlantısı
+            table: Hedef tablo
+            column_names: Satırlardaki değerlerin sütun sırası
+            key_columns: Çakışmanın belirlendiği birincil anahtar/unique sütunlar
+            bulk_load: Geçici tabloya yüklerken toplu yükleme yöntemlerini kullan
+            staging_rows: Geçici tablo üzerinden yazılacak en küçük parça
+                boyutu (0 ise geçici tablo kullanılmaz)
+        """
+        super().__init__(connection, table, column_names)
+        self.key_columns = key_columns
+        self.update_columns = [name for name in column_names if name not in key_columns]
+        self.staging_rows = staging_rows
+        self.staging_loader = None
+        
+        if self.insert_sql is not None:
+            self.insert_sql += ' ' + self._conflict_clause()
+            if staging_rows > 0:
+                self._init_staging(bulk_load)
+    
+    def _init_staging(self, bulk_load: bool):
+        """Geçici tablo DDL'ini, yükleyicisini ve birleştirme ifadesini hazırlar"""
+        preparer = self.connection.engine.dialect.identifier_preparer
+        staging_name = self.table.name[:63 - len(self.STAGING_SUFFIX)] + self.STAGING_SUFFIX
+        staging_table = Table(
+            staging_name, MetaData(),
+            *[Column(name, self.table.columns[name].type) for name in self.column_names]
+        )
+        
+        loader = create_writer(self.connection, staging_table, self.column_names, bulk_load)
+        if isinstance(loader, BulkWriter) and loader.use_fallback:
+            loader = loader.fallback
+        self.staging_loader = loader
+        
+        quoted_staging = preparer.quote(staging_name)
+        table_sql = preparer.format_table(self.table)
+        columns_sql = ', '.join(preparer.quote(name) for name in self.column_names)
+        
+        if self.connection.db_type == 'postgresql':
+            self.staging_setup = [
+                f"DROP TABLE IF EXISTS pg_temp.{quoted_staging}",
+                f"CREATE TEMP TABLE {quoted_staging} AS SELECT {columns_sql} FROM {table_sql} WITH NO DATA",
+            ]
+            self.staging_cleanup = f"DROP TABLE pg_temp.{quoted_staging}"
+        elif self.connection.db_type == 'mysql':
+            self.staging_setup = [
+                f"DROP TEMPORARY TABLE IF EXISTS {quoted_staging}",
+                f"CREATE TEMPORARY TABLE {quoted_staging} AS SELECT {columns_sql} FROM {table_sql} LIMIT 0",
+            ]
+            self.staging_cleanup = f"DROP TEMPORARY TABLE {quoted_staging}"
+        else:
+            self.staging_setup = [
+                f"DROP TABLE IF EXISTS temp.{quoted_staging}",
+                f"CREATE TEMP TABLE {quoted_staging} AS SELECT {columns_sql} FROM {table_sql} WHERE 0",
+            ]
+            self.staging_cleanup = f"DROP TABLE temp.{quoted_staging}"
+        
+        # SQLite'ta INSERT ... SELECT ile ON CONFLICT ayrıştırma belirsizliği için WHERE gerekir
+        where_sql = " WHERE true" if self.connection.db_type == 'sqlite' else ""
+        self.merge_sql = (
+            f"INSERT INTO {table_sql} ({columns_sql}) "
+            f"SELECT {columns_sql} FROM {quoted_staging}{where_sql} {self._conflict_clause()}"
+        )
+    
+    def _conflict_clause(self) -> str:
+        """Dialect'e göre ON CONFLICT / ON DUPLICATE KEY cümlesini üretir"""
+        quote = self.connection.engine.dialect.identifier_preparer.quote
+        
+        if self.connection.db_type == 'mysql':
+            # Güncellenecek sütun yoksa anahtarı kendisine atayarak satırı değiştirmeden bırak
+            names = self.update_columns or self.key_columns[:1]
+            assignments = ', '.join(f"{quote(name)} = VALUES({quote(name)})" for name in names)
+            return f"ON DUPLICATE KEY UPDATE {assignments}"
+        
+        keys_sql = ', '.join(quote(name) for name in self.key_columns)
+        if not self.update_columns:
+            return f"ON CONFLICT ({keys_sql}) DO NOTHING"
+        assignments = ', '.join(f"{quote(name)} = excluded.{quote(name)}" for name in self.update_columns)
+        return f"ON CONFLICT ({keys_sql}) DO UPDATE SET {assignments}"
+    
+    def _dialect_upsert(self):
+        """Konumsal parametre desteklemeyen sürücüler için SQLAlchemy upsert ifadesi"""
+        if self.connection.db_type == 'mysql':
+            from sqlalchemy.dialects.mysql import insert as mysql_insert
+            stmt = mysql_insert(self.table)
+            names = self.update_columns or self.key_columns[:1]
+            return stmt.on_duplicate_key_update({name: stmt.inserted[name] for name in names})
+        
+        if self.connection.db_type == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        stmt = dialect_insert(self.table)
+        if not self.update_columns:
+            return stmt.on_conflict_do_nothing(index_elements=self.key_columns)
+        return stmt.on_conflict_do_update(
+            index_elements=self.key_columns,
+            set_={name: stmt.excluded[name] for name in self.update_columns}
+        )
+    
+    def _write_staged(self, rows):
+        """Parçayı geçici tabloya yükleyip tek ifadeyle hedefe birleştirir"""
+        raw_conn = self.connection.engine.raw_connection()
+        try:
+            cursor = raw_conn.cursor()
+            try:
+                for statement in self.staging_setup:
+                    cursor.execute(statement)
+                self.staging_loader._load(raw_conn, rows)
+                cursor.execute(self.merge_sql)
+                cursor.execute(self.staging_cleanup)
+            finally:
+                cursor.close()
+            raw_conn.commit()
+        except Exception:
+            raw_conn.rollback()
+            raise
+        finally:
+            raw_conn.close()
+    
+    def write(self, rows):
+        """Bir parça satırı hedef tabloya ekler/günceller ve commit eder"""
+        if not rows:
+            return
+        
+        if self.staging_loader is not None and len(rows) >= self.staging_rows:
+            self._write_staged(rows)
+            return
+        
+        if self.insert_sql is None:
+            with self.connection.engine.connect() as target_conn:
+                rows_dict = [dict(zip(self.column_names, row)) for row in rows]
+                target_conn.execute(self._dialect_upsert(), rows_dict)
+                target_conn.commit()
+            return
+        
+        super().write(rows)
+
+# COPY text formatında özel anlamı olan karakterler
+_COPY_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '\t': '\\t',
+    '\n': '\\n',
+    '\r': '\\r',
+})
+
+
+def _format_pg_array(values) -> str:
+    """Python listesini PostgreSQL dizi literal'ine çevirir: {"a","b",NULL}"""
+    items = []
+    for value in values:
+        if value is None:
+            items.append('NULL')
+        elif isinstance(value, (list, tuple)):
+            items.append(_format_pg_array(value))
+        else:
+            text_value = _format_copy_value(value, escape=False)
+            items.append('"' + text_value.replace('\\', '\\\\').replace('"', '\\"') + '"')
+    return '{' + ','.join(items) + '}'
+
+
+def _format_copy_value(value, escape: bool = True) -> str:
+    """Tek bir değeri COPY text formatına çevirir (NULL hariç)"""
+    if isinstance(value, str):
+        text_value = value
+    elif isinstance(value, bool):
+        text_value = 't' if value else 'f'
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        # bytea hex formatı: \x0a0b...
+        text_value = '\\x' + bytes(value).hex()
+    elif isinstance(value, (datetime, date, time)):
+        text_value = value.isoformat()
+    elif isinstance(value, timedelta):
+        text_value = f"{value.days} days {value.seconds} seconds {value.microseconds} microseconds"
+    elif isinstance(value, (list, tuple)):
+        text_value = _format_pg_array(value)
+    elif isinstance(value, dict):
+        text_value = json.dumps(value)
+    else:
+        text_value = str(value)
+    
+    if escape:
+        return text_value.translate(_COPY_ESCAPES)
+    return text_value
+
+
+def _format_copy_json(value) -> str:
+    """JSON/JSONB sütunları için değeri JSON metnine çevirir"""
+    if isinstance(value, str):
+        return value.translate(_COPY_ESCAPES)
+    return json.dumps(value).translate(_COPY_ESCAPES)
+
+
+class _PartialLoadError(Exception):
+    """
+    Toplu yükleme çalıştı ama parçanın tamamını hatasız yazmadı (ör. LOAD DATA
+    LOCAL çakışan anahtarları atladı veya değerleri kırparak uyarı verdi)
+    """
+
+
+class BulkWriter:
+    """
+    Dialect'e özel toplu yükleme yazıcıları için temel sınıf.
+    
+    Alt sınıflar _load() metodunu ham DBAPI bağlantısı üzerinde uygular.
+    Yöntem hedefte kullanılamıyorsa (_is_unsupported) parça INSERT ile
+    yeniden denenir ve tablo için INSERT yoluna geçilir; veri hataları
+    olduğu gibi yükseltilir. Yükleme parçayı eksik yazdıysa yalnızca o parça
+    INSERT ile yeniden yazılır; asıl hata INSERT'ten yükselir.
+    """
+    
+    method_name = "bulk load"
+    
+    def __init__(self, connection: DatabaseConnection, table: Table, column_names: List[str]):
+        """
+        Args:
+            connection: Hedef veritabanı bağlantısı
+            table: Hedef tablo
+            column_names: Satırlardaki değerlerin sütun sırası
+        """
+        self.connection = connection
+        self.table = table
+        self.column_names = column_names
+        self.fallback = InsertWriter(connection, table, column_names)
+        self.use_fallback = False
+    
+    def _load(self, raw_conn, rows):
+        """Parçayı ham DBAPI bağlantısı üzerinden yükler (commit etmez)"""
+        raise NotImplementedError
+    
+    def _is_unsupported(self, error: Exception) -> bool:
+        """Hata, verinin değil yöntemin hedefte kullanılamadığını mı gösteriyor"""
+        # Sürücüde yöntem yok (ör. copy_expert) veya DBAPI NotSupportedError
+        return (isinstance(error, (AttributeError, NotImplementedError)) or
+                type(error).__name__ == 'NotSupportedError')
+    
+    def write_in_transaction(self, raw_conn, rows):
+        """
+        Parçayı çağıranın açık transaction'ında yazar. Başarısız yükleme
+        transaction'ı bozabileceği için burada INSERT'e geçilmez, hata
+        çağırana iletilir.
+        """
+        if not rows:
+            return
+        if self.use_fallback:
+            self.fallback.write_in_transaction(raw_conn, rows)
+            return
+        self._load(raw_conn, rows)
+    
+    def write(self, rows):
+        """Bir parça satırı toplu yükleme ile hedef tabloya yazar ve commit eder"""
+        if not rows:
+            return
+        
+        if self.use_fallback:
+            self.fallback.write(rows)
+            return
+        
+        raw_conn = self.connection.engine.raw_connection()
+        try:
+            self._load(raw_conn, rows)
+            raw_conn.commit()
+        except _PartialLoadError as e:
+            raw_conn.rollback()
+            logger.warning(f"{self.table.name}: {str(e)}, parça INSERT ile yeniden yazılıyor")
+            self.fallback.write(rows)
+        except Exception as e:
+            raw_conn.rollback()
+            if not self._is_unsupported(e):
+                raise
+            logger.warning(f"{self.table.name} için {self.method_name} kullanılamıyor, INSERT'e geçiliyor: {str(e)}")
+            self.use_fallback = True
+            self.fallback.write(rows)
+        finally:
+            raw_conn.close()
+
+
+class PostgresCopyWriter(BulkWriter):
+    """
+    PostgreSQL hedefleri için COPY ... FROM STDIN ile yazan yazıcı.
+    
+    Her parça bellekteki bir metin tamponuna COPY text formatında yazılır ve
+    psycopg2'nin copy_expert'i ile tek seferde sunucuya gönderilir.
+    """
+    
+    method_name = "COPY"
+    
+    def __init__(self, connection: DatabaseConnection, table: Table, column_names: List[str]):
+        super().__init__(connection, table, column_names)
+        
+        preparer = connection.engine.dialect.identifier_preparer
+        columns_sql = ', '.join(preparer.quote(name) for name in column_names)
+        self.copy_sql = f"COPY {preparer.format_table(table)} ({columns_sql}) FROM STDIN"
+        self.formatters = [self._get_formatter(table.columns[name].type) for name in column_names]
+    
+    @staticmethod
+    def _get_formatter(column_type) -> Callable:
+        """Hedef sütun tipine göre değer biçimleyicisini seçer"""
+        if isinstance(column_type, JSON):
+            return _format_copy_json
+        return _format_copy_value
+    
+    def _build_buffer(self, rows) -> io.StringIO:
+        """Satırları COPY text formatında bir tampona yazar"""
+        formatters = self.formatters
+        lines = []
+        for row in rows:
+            lines.append('\t'.join(
+                '\\N' if value is None else formatter(value)
+                for formatter, value in zip(formatters, row)
+            ))
+        lines.append('')
+        return io.StringIO('\n'.join(lines))
+    
+    def _is_unsupported(self, error: Exception) -> bool:
+        # feature_not_supported: ör. hedef COPY ile yazılamayan bir görünüm
+        return super()._is_unsupported(error) or getattr(error, 'pgcode', None) == '0A000'
+    
+    def _load(self, raw_conn, rows):
+        cursor = raw_conn.cursor()
+        try:
+            cursor.copy_expert(self.copy_sql, self._build_buffer(rows))
+        finally:
+            cursor.close()
+
+
+# LOAD DATA varsayılan (ESCAPED BY '\\') formatında özel anlamı olan karakterler
+_LOAD_DATA_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '\t': '\\t',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\0': '\\0',
+    '\x1a': '\\Z',
+})
+
+
+# LOAD DATA LOCAL'in istemci veya sunucu tarafında kapalı olduğunu gösteren hata kodları
+_LOCAL_INFILE_DISABLED_ERRNOS = {
+    1148,  # ER_NOT_ALLOWED_COMMAND
+    2068,  # CR_LOAD_DATA_LOCAL_INFILE_REJECTED
+    3948,  # ER_CLIENT_LOCAL_FILES_DISABLED
+}
+
+
+def _format_load_data_value(value) -> str:
+    """Tek bir değeri LOAD DATA metin formatına çevirir (NULL hariç)"""
+    if isinstance(value, str):
+        text_value = value
+    elif isinstance(value, bool):
+        text_value = '1' if value else '0'
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        text_value = bytes(value).decode('utf-8')
+    elif isinstance(value, datetime):
+        text_value = value.isoformat(sep=' ')
+    elif isinstance(value, (date, time)):
+        text_value = value.isoformat()
+    elif isinstance(value, timedelta):
+        hours, remainder = divmod(value.seconds, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        text_value = f"{value.days} {hours:02d}:{minutes:02d}:{seconds:02d}.{value.microseconds:06d}"
+    elif isinstance(value, (dict, list, tuple)):
+        text_value = json.dumps(value)
+    else:
+        text_value = str(value)
+    return text_value.translate(_LOAD_DATA_ESCAPES)
+
+
+def _format_load_data_binary(value) -> str:
+    """İkili sütunlar hex olarak yazılır, sunucuda UNHEX() ile çözülür"""
+    if isinstance(value, str):
+        value = value.encode('utf-8')
+    return bytes(value).hex()
+
+
+class MySQLLoadDataWriter(BulkWriter):
+    """
+    MySQL hedefleri için LOAD DATA LOCAL INFILE ile yazan yazıcı.
+    
+    Her parça geçici bir TSV dosyasına yazılıp tek komutla yüklenir. İkili
+    sütunlar hex kodlanır ve SET sütun = UNHEX(@değişken) ile çözülür.
+    Sunucuda local_infile kapalıysa baştan INSERT yoluna geçilir.
+    
+    LOCAL ile MySQL çakışan anahtarları IGNORE gibi atlar ve dönüştürme
+    hatalarını uyarıya düşürür; bu yüzden yüklenen satır sayısı ve uyarılar
+    kontrol edilir, fark varsa parça INSERT ile yeniden yazılır.
+    """
+    
+    method_name = "LOAD DATA LOCAL INFILE"
+    
+    def __init__(self, connection: DatabaseConnection, table: Table, column_names: List[str]):
+        super().__init__(connection, table, column_names)
+        
+        preparer = connection.engine.dialect.identifier_preparer
+        targets = []
+        assignments = []
+        self.formatters = []
+        for i, name in enumerate(column_names):
+            # _Binary; LargeBinary'nin yanında MySQL BLOB türevlerini ve VARBINARY/BINARY'yi de kapsar
+            if isinstance(table.columns[name].type, sqltypes._Binary):
+                targets.append(f"@c{i}")
+                assignments.append(f"{preparer.quote(name)} = UNHEX(@c{i})")
+                self.formatters.append(_format_load_data_binary)
+            else:
+                targets.append(preparer.quote(name))
+                self.formatters.append(_format_load_data_value)
+        
+        self.load_sql_template = (
+            "LOAD DATA LOCAL INFILE '<path>' INTO TABLE " + preparer.format_table(table) +
+            " CHARACTER SET utf8mb4"
+            " FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'"
+            " LINES TERMINATED BY '\\n'"
+            " (" + ', '.join(targets) + ")"
+        )
+        if assignments:
+            self.load_sql_template += " SET " + ', '.join(assignments)
+        
+        if not self._local_infile_enabled():
+            logger.warning(f"Sunucuda local_infile kapalı, {table.name} için INSERT kullanılacak")
+            self.use_fallback = True
+    
+    def _local_infile_enabled(self) -> bool:
+        """Sunucunun LOAD DATA LOCAL kabul edip etmediğini kontrol eder"""
+        try:
+            with self.connection.engine.connect() as conn:
+                return bool(int(conn.execute(text("SELECT @@local_infile")).scalar()))
+        except Exception as e:
+            logger.warning(f"local_infile ayarı okunamadı: {str(e)}")
+            return False
+    
+    def _is_unsupported(self, error: Exception) -> bool:
+        return super()._is_unsupported(error) or getattr(error, 'errno', None) in _LOCAL_INFILE_DISABLED_ERRNOS
+    
+    def _load(self, raw_conn, rows):
+        formatters = self.formatters
+        temp_file = tempfile.NamedTemporaryFile(
+            mode='w', encoding='utf-8', newline='', suffix='.tsv', delete=False
+        )
+        try:
+            with temp_file:
+                for row in rows:
+                    temp_file.write('\t'.join(
+                        '\\N' if value is None else formatter(value)
+                        for formatter, value in zip(formatters, row)
+                    ))
+                    temp_file.write('\n')
+            
+            path = temp_file.name.replace('\\', '\\\\').replace("'", "\\'")
+            cursor = raw_conn.cursor()
+            try:
+                cursor.execute(self.load_sql_template.replace('<path>', path, 1))
+                loaded = cursor.rowcount
+                cursor.execute("SHOW WARNINGS")
+                warnings = [row for row in cursor.fetchall() if row[0] != 'Note']
+            finally:
+                cursor.close()
+        finally:
+            os.remove(temp_file.name)
+        
+        if loaded != len(rows) or warnings:
+            details = '; '.join(f"{code}: {message}" for _, code, message in warnings[:3])
+            raise _PartialLoadError(
+                f"LOAD DATA {len(rows)} satırdan {loaded} satır yükledi, {len(warnings)} uyarı"
+                + (f" ({details})" if details else "")
+            )
+
+
+def create_writer(connection: DatabaseConnection,
+                  table: Table,
+                  column_names: List[str],
+                  bulk_load: bool = True,
+                  upsert_keys: Optional[List[str]] = None,
+                  upsert_staging_rows: int = 0):
+    """
+    Hedef bağlantının tipine göre uygun yazıcıyı oluşturur
+    
+    Args:
+        connection: Hedef veritabanı bağlantısı
+        table: Hedef tablo
+        column_names: Satırlardaki değerlerin sütun sırası
+        bulk_load: Dialect'e özel toplu yükleme yöntemlerini kullan
+        upsert_keys: Verilirse satırlar bu anahtara göre eklenir/güncellenir
+            (toplu yükleme yöntemleri yalnızca geçici tabloya yüklerken kullanılır)
+        upsert_staging_rows: Upsert'te geçici tablo üzerinden yazılacak en
+            küçük parça boyutu (0 ise kullanılmaz)
+    
+    Returns:
+        write(rows) metoduna sahip yazıcı nesnesi
+    """
+    if upsert_keys:
+        return UpsertWriter(connection, table, column_names, upsert_keys, bulk_load, upsert_staging_rows)
+    if bulk_load and connection.db_type == 'postgresql':
+        return PostgresCopyWriter(connection, table, column_names)
+    if bulk_load and connection.db_type == 'mysql':
+        return MySQLLoadDataWriter(connection, table, column_names)
+    return InsertWriter(connection, table, column_names)
@@ -0,0 +1,178 @@
+"""
+Sağlama Toplamı Modülü
+Bu modül, bir tablonun (veya anahtar aralığının) satır sayısını ve satır
+sırasından bağımsız içerik özetini hesaplayan fonksiyonları içerir.
+
+Özet, her satırın 64 bitlik hash'lerinin 2^64 modunda toplamıdır; bu yüzden
+satırlar hangi sırayla okunursa okunsun aynı sonucu verir ve parçalar
+halinde biriktirilebilir.
+"""
+
+from sqlalchemy import Table, select, func, literal_column
+from sqlalchemy.types import LargeBinary
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Iterable, List, Optional, Tuple
+import hashlib
+import logging
+import math
+from .database_connection import DatabaseConnection
+from .type_mapping import ConversionPlan
+
+logger = logging.getLogger(__name__)
+
+
+HASH_MODULUS = 2 ** 64
+
+# SQL ile özet hesaplanabilen dialect'ler (iki taraf aynı dialect olmalıdır)
+SQL_CHECKSUM_DIALECTS = ('postgresql', 'mysql')
+
+
+def _normalize_value(value: Any) -> str:
+    """
+    Değeri dialect'ten bağımsız bir metne çevirir; böylece farklı
+    veritabanlarından okunan aynı değer aynı hash'i üretir
+    """
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float) and not math.isfinite(value):
+        return repr(value)
+    if isinstance(value, Decimal) and not value.is_finite():
+        return str(value)
+    if isinstance(value, (float, Decimal)):
+        if value == int(value):
+            return str(int(value))
+        if isinstance(value, Decimal):
+            return str(value.normalize())
+        return repr(value)
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        # Aynı anı gösteren farklı offset'li değerler aynı metne çevrilir
+        return value.astimezone(timezone.utc).replace(tzinfo=None).isoformat()
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return str(value.total_seconds())
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex()
+    return str(value)
+
+
+def row_hash(row: Iterable[Any]) -> int:
+    """Bir satırın 64 bitlik hash'i"""
+    payload = '\x1f'.join(_normalize_value(value) for value in row)
+    return int.from_bytes(hashlib.md5(payload.encode('utf-8')).digest()[:8], 'big')
+
+
+class RowChecksum:
+    """
+    Satırları akış halinde özetleyen biriktirici.
+    Satır sayısını ve sıradan bağımsız içerik özetini tutar.
+    """
+    
+    def __init__(self):
+        self.row_count = 0
+        self.checksum = 0
+    
+    def add_rows(self, rows):
+        """Bir parça satırı özete ekler"""
+        total = self.checksum
+        for row in rows:
+            total += row_hash(row)
+        self.checksum = total % HASH_MODULUS
+        self.row_count += len(rows)
+    
+    def merge(self, other: 'RowChecksum'):
+        """Başka bir biriktiricinin (ör. farklı bir aralığın) sonucunu ekler"""
+        self.row_count += other.row_count
+        self.checksum = (self.checksum + other.checksum) % HASH_MODULUS
+    
+    def result(self) -> Tuple[int, int]:
+        """(satır sayısı, özet)"""
+        return self.row_count, self.checksum
+
+
+def supports_sql_checksum(source: DatabaseConnection, target: DatabaseConnection) -> bool:
+    """Özetin iki tarafta da SQL ile hesaplanıp karşılaştırılabilir olup olmadığı"""
+    return source.db_type == target.db_type and source.db_type in SQL_CHECKSUM_DIALECTS
+
+
+def _sql_hash_expression(connection: DatabaseConnection, table: Table, column_names: List[str]):
+    """
+    Satır hash'lerinin toplamını veritabanında hesaplayan ifade.
+    
+    PostgreSQL: md5(ROW(...)::text) ilk 64 biti, bigint toplamı (numeric döner).
+    MySQL: MD5(CONCAT_WS(...)) ilk 64 biti, unsigned toplamı (DECIMAL döner).
+    """
+    preparer = connection.engine.dialect.identifier_preparer
+    
+    if connection.db_type == 'postgresql':
+        columns_sql = ', '.join(preparer.quote(name) for name in column_names)
+        return literal_column(
+            f"COALESCE(SUM(('x' || SUBSTR(MD5(ROW({columns_sql})::text), 1, 16))::bit(64)::bigint), 0)"
+        )
+    
+    parts = []
+    for name in column_names:
+        quoted = preparer.quote(name)
+        if isinstance(table.columns[name].type, LargeBinary):
+            value_sql = f"HEX({quoted})"
+        else:
+            value_sql = f"CAST({quoted} AS CHAR)"
+        # NULL ile boş metni ayırt etmek için ISNULL öneki eklenir
+        parts.append(f"CONCAT(ISNULL({quoted}), IFNULL({value_sql}, ''))")
+    return literal_column(
+        f"COALESCE(SUM(CAST(CONV(SUBSTRING(MD5(CONCAT_WS('|', {', '.join(parts)})), 1, 16), 16, 10) "
+        f"AS UNSIGNED)), 0)"
+    )
+
+
+def compute_checksum(connection: DatabaseConnection,
+                     table: Table,
+                     column_names: List[str],
+                     condition=None,
+                     use_sql: bool = False,
+                     chunk_size: int = 10000,
+                     plan: Optional[ConversionPlan] = None) -> Tuple[int, int]:
+    """
+    Tablonun (koşul verilirse yalnızca o satırların) sayısını ve özetini hesaplar
+    
+    Args:
+        connection: Veritabanı bağlantısı
+        table: Tablo
+        column_names: Özete katılacak sütunlar (iki tarafta aynı sırayla)
+        condition: Ek WHERE koşulu (ör. anahtar aralığı)
+        use_sql: Özeti veritabanında SQL ile hesapla; False ise satırlar
+            akış halinde okunup Python'da hash'lenir
+        chunk_size: Python'da hesaplarken bir seferde okunacak satır sayısı
+        plan: Kaynak satırlarını hedefe yazılan değerlere çeviren plan; özet
+            hedefteki değerlerle aynı olsun diye hash'lemeden önce uygulanır
+            (column_names tablonun tüm sütunları, tablodaki sırayla olmalıdır)
+    
+    Returns:
+        (satır sayısı, özet)
+    """
+    if use_sql:
+        stmt = select(func.count(), _sql_hash_expression(connection, table, column_names)).select_from(table)
+        if condition is not None:
+            stmt = stmt.where(condition)
+        with connection.engine.connect() as conn:
+            row_count, checksum = conn.execute(stmt).one()
+        return int(row_count), int(checksum) % HASH_MODULUS
+    
+    stmt = select(*[table.columns[name] for name in column_names])
+    if condition is not None:
+        stmt = stmt.where(condition)
+    
+    accumulator = RowChecksum()
+    with connection.engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=chunk_size).execute(stmt)
+        while True:
+            rows = result.fetchmany(chunk_size)
+            if not rows:
+                break
+            accumulator.add_rows(plan.apply(rows) if plan is not None else rows)
+    return accumulator.result()
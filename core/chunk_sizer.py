@@ -0,0 +1,185 @@
+"""
+Parça Boyutu Ayarlama Modülü
+Bu modül, aktarımda kullanılan parça (batch) boyutunu belirleyen sınıfları içerir.
+Sabit boyut varsayılandır; uyarlamalı modda boyut tahmini satır genişliğinden
+başlatılır ve ölçülen yazma hızına göre çalışma sırasında ayarlanır.
+"""
+
+from sqlalchemy import Table
+from sqlalchemy.types import (
+    Integer, BigInteger, SmallInteger, Float, Numeric, Boolean,
+    Date, DateTime, Time, Interval, String, Text, JSON, Uuid
+)
+from sqlalchemy.sql import sqltypes
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Uzunluğu bilinmeyen metin/ikili ve tanınmayan tipteki sütunlar için varsayılan bayt tahmini
+DEFAULT_VARIABLE_WIDTH = 1024
+
+
+def estimate_column_width(column_type) -> int:
+    """Sütun tipinden bir değerin yaklaşık bayt genişliğini tahmin eder"""
+    if isinstance(column_type, Boolean):
+        return 1
+    if isinstance(column_type, SmallInteger):
+        return 2
+    if isinstance(column_type, (BigInteger, Float, DateTime, Interval)):
+        return 8
+    if isinstance(column_type, (Integer, Date, Time)):
+        return 4
+    if isinstance(column_type, (Numeric, Uuid)):
+        return 16
+    if isinstance(column_type, (Text, JSON)):
+        return DEFAULT_VARIABLE_WIDTH
+    # _Binary; LargeBinary'nin yanında MySQL BLOB türevlerini ve VARBINARY/BINARY'yi de kapsar
+    if isinstance(column_type, (String, sqltypes._Binary)):
+        return column_type.length or DEFAULT_VARIABLE_WIDTH
+    return DEFAULT_VARIABLE_WIDTH
+
+
+def estimate_row_width(table: Table) -> int:
+    """Yansıtılmış tablo sütunlarından bir satırın yaklaşık bayt genişliği"""
+    return max(1, sum(estimate_column_width(column.type) for column in table.columns))
+
+
+def measure_row_width(rows, sample_size: int = 50) -> int:
+    """Parçanın ilk satırlarından ortalama satır genişliğini ölçer"""
+    sample = rows[:sample_size]
+    if not sample:
+        return 0
+    
+    total = 0
+    for row in sample:
+        for value in row:
+            if value is None:
+                total += 1
+            elif isinstance(value, (str, bytes, bytearray)):
+                total += len(value)
+            else:
+                total += 8
+    return max(1, total // len(sample))
+
+
+class FixedChunkSizer:
+    """Her parça için aynı boyutu kullanan boyutlandırıcı"""
+    
+    def __init__(self, chunk_size: int):
+        self.chunk_size = chunk_size
+    
+    def next_size(self) -> int:
+        """Sonraki parçanın satır sayısı"""
+        return self.chunk_size
+    
+    def record(self, rows, elapsed: float):
+        """Sabit modda ölçüm kullanılmaz"""
+        pass
+
+    def record_measured(self, row_count: int, row_width: int, elapsed: float):
+        """Sabit modda ölçüm kullanılmaz"""
+        pass
+
+
+class AdaptiveChunkSizer:
+    """
+    Parça boyutunu bayt bütçesine ve ölçülen hıza göre ayarlayan boyutlandırıcı.
+    
+    Başlangıç boyutu, yansıtılmış sütun tiplerinden tahmin edilen satır
+    genişliğiyle bayt bütçesinin bölümüdür. Her parçadan sonra gerçek satır
+    genişliği ve yazma süresi ölçülür:
+    
+    - Parça süresi max_batch_seconds'ı aşarsa boyut yarıya iner.
+    - Satır/saniye artıyor veya aynı kalıyorsa boyut büyütülür.
+    - Satır/saniye belirgin biçimde düşerse boyut küçültülür.
+    
+    Boyut her zaman bayt bütçesinin izin verdiği satır sayısıyla sınırlıdır,
+    böylece BLOB/TEXT ağırlıklı tablolarda bellek kullanımı kontrol altında
+    kalır. Birden fazla thread aynı nesneyi paylaşabilir.
+    """
+    
+    GROWTH_FACTOR = 1.5
+    SHRINK_FACTOR = 0.75
+    
+    def __init__(self,
+                 table: Table,
+                 target_batch_bytes: int = 8 * 1024 * 1024,
+                 min_chunk_size: int = 100,
+                 max_chunk_size: int = 100000,
+                 max_batch_seconds: float = 5.0):
+        """
+        Args:
+            table: Kaynak tablo (satır genişliği tahmini için)
+            target_batch_bytes: Bir parçanın hedeflenen yaklaşık bayt boyutu
+            min_chunk_size: En küçük parça boyutu
+            max_chunk_size: En büyük parça boyutu
+            max_batch_seconds: Bir parçanın yazılması için kabul edilen en uzun süre
+        """
+        self.table_name = table.name
+        self.target_batch_bytes = target_batch_bytes
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.max_batch_seconds = max_batch_seconds
+        self.row_width = estimate_row_width(table)
+        self.best_rate = 0.0
+        self.lock = threading.Lock()
+        self.chunk_size = self._clamp(self._byte_limit())
+    
+    def _byte_limit(self) -> int:
+        """Bayt bütçesine sığan satır sayısı"""
+        return max(1, self.target_batch_bytes // self.row_width)
+    
+    def _clamp(self, size: float) -> int:
+        upper = max(self.min_chunk_size, min(self.max_chunk_size, self._byte_limit()))
+        return int(max(self.min_chunk_size, min(upper, size)))
+    
+    def next_size(self) -> int:
+        """Sonraki parçanın satır sayısı"""
+        with self.lock:
+            return self.chunk_size
+    
+    def record(self, rows, elapsed: float):
+        """
+        Yazılan bir parçanın ölçümlerine göre boyutu günceller
+        
+        Args:
+            rows: Yazılan satırlar
+            elapsed: Parçanın yazılma süresi (saniye)
+        """
+        if not rows:
+            return
+        self.record_measured(len(rows), measure_row_width(rows), elapsed)
+        
+    def record_measured(self, row_count: int, row_width: int, elapsed: float):
+        """
+        Satırları elde olmayan (ör. Arrow RecordBatch) parçalar için record();
+        satır genişliği çağıran tarafından ölçülür
+        
+        Args:
+            row_count: Yazılan satır sayısı
+            row_width: Ölçülen ortalama satır genişliği (bayt)
+            elapsed: Parçanın yazılma süresi (saniye)
+        """
+        if not row_count:
+            return
+        
+        with self.lock:
+            # Ölçülen genişliği yumuşatarak tahmine kat
+            self.row_width = max(1, int(self.row_width * 0.5 + row_width * 0.5))
+            rate = row_count / elapsed if elapsed > 0 else float('inf')
+            previous = self.chunk_size
+            
+            if elapsed > self.max_batch_seconds:
+                size = self.chunk_size * 0.5
+            elif rate >= self.best_rate * 0.95:
+                size = self.chunk_size * self.GROWTH_FACTOR
+            else:
+                size = self.chunk_size * self.SHRINK_FACTOR
+            
+            self.best_rate = max(self.best_rate, rate) if rate != float('inf') else self.best_rate
+            self.chunk_size = self._clamp(size)
+            
+            if self.chunk_size != previous:
+                logger.debug(f"{self.table_name}: parça boyutu {previous} -> {self.chunk_size}")
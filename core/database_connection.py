@@ -3,10 +3,13 @@ Veritabanı Bağlantı Yöneticisi
 Bu modül, farklı SQL veritabanlarına bağlantı kurma ve yönetme işlemlerini sağlar.
 """
 
-from sqlalchemy import create_engine, inspect, MetaData, Table, text
+from sqlalchemy import create_engine, inspect, MetaData, Table, text, select, func
 from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
 from typing import Dict, List, Optional, Tuple
 import logging
+import os
+import threading
 
 # Logging yapılandırması
 logging.basicConfig(level=logging.INFO)
@@ -35,6 +38,13 @@ class DatabaseConnection:
         self.database = database
         self.engine: Optional[Engine] = None
         self.metadata = MetaData()
+        # Yansıtma önbelleği: tablolar self.metadata içinde tutulur
+        self._table_names: Optional[List[str]] = None
+        self._cache_lock = threading.RLock()
+        # Havuz büyütülürken değiştirilen engine'ler; boştaki bağlantıları hemen
+        # kapatılır, kullanımdaki bağlantılar iade edildiğinde kapanır
+        self._pool_lock = threading.Lock()
+        self._retired_engines: List[Engine] = []
         
     def get_connection_string(self) -> str:
         """Veritabanı tipine göre bağlantı string'i oluşturur"""
@@ -48,11 +58,17 @@ class DatabaseConnection:
         else:
             raise ValueError(f"Desteklenmeyen veritabanı tipi: {self.db_type}")
     
+    def get_identity(self) -> str:
+        """Bağlantıyı şifre içermeden tanımlayan kimlik (durum kayıtları için)"""
+        if self.db_type == 'sqlite':
+            return f"sqlite:///{os.path.abspath(self.database)}"
+        return f"{self.db_type}://{self.username}@{self.host}:{self.port}/{self.database}"
+    
     def connect(self) -> bool:
         """Veritabanına bağlantı kurar"""
         try:
-            connection_string = self.get_connection_string()
-            self.engine = create_engine(connection_string, echo=False)
+            self.engine = self._create_engine()
+            self.invalidate()
             
             # Bağlantı testini yap
             with self.engine.connect() as conn:
@@ -65,6 +81,45 @@ class DatabaseConnection:
             logger.error(f"Bağlantı hatası: {str(e)}")
             return False
     
+    def _create_engine(self, pool_size: Optional[int] = None) -> Engine:
+        """Bağlantı havuzu ayarlarıyla SQLAlchemy engine oluşturur"""
+        engine_kwargs = {'echo': False}
+        if self.db_type == 'mysql':
+            # LOAD DATA LOCAL INFILE ile toplu yükleme için gerekli
+            engine_kwargs['connect_args'] = {'allow_local_infile': True}
+        if pool_size is not None:
+            engine_kwargs['pool_size'] = pool_size
+        return create_engine(self.get_connection_string(), **engine_kwargs)
+    
+    def ensure_pool_size(self, pool_size: int):
+        """
+        Bağlantı havuzunun en az pool_size eşzamanlı bağlantı verebilmesini
+        sağlar. Mevcut havuz (taşma payı dahil) küçükse engine daha büyük bir
+        havuzla yeniden oluşturulur. Eski engine'in boştaki bağlantıları hemen
+        kapatılır; başka thread'lerde kullanımda olan bağlantılar etkilenmez ve
+        iade edildiklerinde kapanır. QueuePool dışındaki havuzlar (ör. SQLite
+        :memory: için SingletonThreadPool) boyutlandırılmaz.
+        
+        Args:
+            pool_size: Gereken eşzamanlı bağlantı sayısı
+        """
+        if not self.engine:
+            self.connect()
+        
+        with self._pool_lock:
+            pool = self.engine.pool
+            if not isinstance(pool, QueuePool):
+                return
+            max_overflow = pool._max_overflow
+            if max_overflow < 0 or pool.size() + max_overflow >= pool_size:
+                return
+        
+            retired = self.engine
+            self.engine = self._create_engine(pool_size=pool_size)
+            self._retired_engines.append(retired)
+            retired.dispose()
+        logger.info(f"Bağlantı havuzu {pool_size} bağlantıya büyütüldü")
+    
     def test_connection(self) -> Tuple[bool, str]:
         """
         Bağlantıyı test eder
@@ -80,14 +135,116 @@ class DatabaseConnection:
         except Exception as e:
             return False, f"Hata: {str(e)}"
     
+    def get_table_names(self, refresh: bool = False) -> List[str]:
+        """
+        Veritabanındaki tablo isimlerini önbellekten döndürür
+        
+        Args:
+            refresh: Önbelleği yok sayıp isimleri yeniden oku
+        """
+        if not self.engine:
+            self.connect()
+        
+        with self._cache_lock:
+            if self._table_names is None or refresh:
+                self._table_names = inspect(self.engine).get_table_names()
+            return list(self._table_names)
+    
+    def reflect_tables(self, table_names: List[str]):
+        """
+        Önbellekte olmayan tabloları tek bir MetaData.reflect(only=...)
+        çağrısıyla toplu olarak yansıtır
+        
+        Args:
+            table_names: Yansıtılacak tablo isimleri
+        """
+        if not self.engine:
+            self.connect()
+        
+        with self._cache_lock:
+            missing = [name for name in table_names if name not in self.metadata.tables]
+            if missing:
+                self.metadata.reflect(bind=self.engine, only=missing)
+                logger.info(f"{len(missing)} tablo yansıtıldı")
+    
+    def get_table(self, table_name: str) -> Table:
+        """
+        Tablonun önbellekteki Table nesnesini döndürür, yoksa yansıtır.
+        Hata durumunda istisna fırlatır.
+        """
+        self.reflect_tables([table_name])
+        return self.metadata.tables[table_name]
+    
+    def invalidate(self, table_name: Optional[str] = None):
+        """
+        Yansıtma önbelleğini geçersiz kılar. DDL işlemlerinden sonra
+        çağrılmalıdır.
+        
+        Args:
+            table_name: Yalnızca bu tabloyu düşür; None ise tüm önbelleği temizle
+        """
+        with self._cache_lock:
+            self._table_names = None
+            if table_name is None:
+                self.metadata.clear()
+            elif table_name in self.metadata.tables:
+                self.metadata.remove(self.metadata.tables[table_name])
+    
+    def count_rows(self, table_name: str) -> int:
+        """Tablodaki satır sayısını COUNT(*) ile tam olarak sayar"""
+        table = self.get_table(table_name)
+        with self.engine.connect() as conn:
+            return conn.execute(select(func.count()).select_from(table)).scalar()
+    
+    def estimate_row_count(self, table_name: str) -> Optional[int]:
+        """
+        Satır sayısını tabloyu taramadan katalog istatistiklerinden tahmin eder
+        
+        PostgreSQL için pg_class.reltuples, MySQL için information_schema.TABLES.TABLE_ROWS,
+        SQLite için sqlite_stat1 (ANALYZE çalıştırılmışsa) kullanılır.
+        
+        Returns:
+            Tahmini satır sayısı veya istatistik yoksa None
+        """
+        if not self.engine:
+            self.connect()
+        
+        if self.db_type == 'postgresql':
+            query = text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)")
+            params = {'name': self.engine.dialect.identifier_preparer.quote(table_name)}
+        elif self.db_type == 'mysql':
+            query = text(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :name"
+            )
+            params = {'name': table_name}
+        elif self.db_type == 'sqlite':
+            query = text("SELECT stat FROM sqlite_stat1 WHERE tbl = :name LIMIT 1")
+            params = {'name': table_name}
+        else:
+            return None
+        
+        try:
+            with self.engine.connect() as conn:
+                value = conn.execute(query, params).scalar()
+        except Exception as e:
+            logger.info(f"Satır tahmini alınamadı ({table_name}): {str(e)}")
+            return None
+        
+        if value is None:
+            return None
+        if self.db_type == 'sqlite':
+            # stat sütunu "satır_sayısı indeks_istatistikleri..." biçimindedir
+            value = str(value).split()[0]
+        
+        estimate = int(value)
+        # PostgreSQL hiç ANALYZE edilmemiş tablolar için -1 döndürür
+        return estimate if estimate >= 0 else None
+    
     def get_tables(self) -> List[str]:
         """Veritabanındaki tüm tabloları listeler"""
         try:
-            if not self.engine:
-                self.connect()
-            
-            inspector = inspect(self.engine)
-            tables = inspector.get_table_names()
+            tables = self.get_table_names()
             logger.info(f"{len(tables)} tablo bulundu")
             return sorted(tables)
             
@@ -106,12 +263,7 @@ class DatabaseConnection:
             SQLAlchemy Table nesnesi
         """
         try:
-            if not self.engine:
-                self.connect()
-            
-            metadata = MetaData()
-            table = Table(table_name, metadata, autoload_with=self.engine)
-            return table
+            return self.get_table(table_name)
             
         except Exception as e:
             logger.error(f"Tablo şeması alınamadı ({table_name}): {str(e)}")
@@ -119,6 +271,10 @@ class DatabaseConnection:
     
     def close(self):
         """Bağlantıyı kapatır"""
+        with self._pool_lock:
+            for engine in self._retired_engines:
+                engine.dispose()
+            self._retired_engines = []
         if self.engine:
             self.engine.dispose()
             logger.info("Bağlantı kapatıldı")
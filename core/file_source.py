@@ -0,0 +1,236 @@
+"""
+Dosya Kaynağı Modülü
+Bu modül, Parquet veya CSV dosyalarını (glob desenleriyle birden fazla dosya)
+veritabanına yüklemek için aktarım kaynağını içerir. Dosyalar pyarrow'un
+çok thread'li, sütun bazlı okuyucularıyla parça parça okunur.
+"""
+
+from sqlalchemy import Table, MetaData, Column
+from sqlalchemy.types import (
+    TypeEngine, Boolean, SmallInteger, Integer, BigInteger, Numeric, Float,
+    Text, DateTime, Date, Time, LargeBinary, JSON
+)
+from typing import Dict, List, Optional, Union
+import glob
+import logging
+import threading
+from . import arrow_batches
+
+logger = logging.getLogger(__name__)
+
+
+def sqlalchemy_type(arrow_type) -> TypeEngine:
+    """Arrow tipinin SQLAlchemy karşılığı"""
+    pa = arrow_batches.pa
+    types = pa.types
+    if types.is_boolean(arrow_type):
+        return Boolean()
+    if types.is_int8(arrow_type) or types.is_int16(arrow_type) or types.is_uint8(arrow_type):
+        return SmallInteger()
+    if types.is_int32(arrow_type) or types.is_uint16(arrow_type):
+        return Integer()
+    if types.is_int64(arrow_type) or types.is_uint32(arrow_type):
+        return BigInteger()
+    if types.is_uint64(arrow_type):
+        return Numeric(20, 0)
+    if types.is_floating(arrow_type):
+        return Float()
+    if types.is_decimal(arrow_type):
+        return Numeric(arrow_type.precision, arrow_type.scale)
+    if types.is_timestamp(arrow_type):
+        return DateTime(timezone=arrow_type.tz is not None)
+    if types.is_date(arrow_type):
+        return Date()
+    if types.is_time(arrow_type):
+        return Time()
+    if types.is_binary(arrow_type) or types.is_large_binary(arrow_type) or types.is_fixed_size_binary(arrow_type):
+        return LargeBinary()
+    if types.is_nested(arrow_type):
+        return JSON()
+    return Text()
+
+
+class FileSource:
+    """
+    Parquet/CSV dosyalarını tablo olarak sunan aktarım kaynağı.
+    
+    DataTransferEngine'e kaynak olarak DatabaseConnection yerine verilir.
+    Her tablo bir veya daha fazla glob deseniyle eşleşen dosyalardan oluşur;
+    şema ilk dosyadan çıkarılır veya column_types ile verilir ve hedefte
+    _transfer_schema ile oluşturulur.
+    """
+    
+    FORMAT_PARQUET = "parquet"
+    FORMAT_CSV = "csv"
+    
+    def __init__(self,
+                 tables: Dict[str, Union[str, List[str]]],
+                 file_format: Optional[str] = None,
+                 column_types: Optional[Dict[str, Dict[str, TypeEngine]]] = None,
+                 delimiter: str = ',',
+                 block_size: int = 16 * 1024 * 1024):
+        """
+        Args:
+            tables: {tablo adı: glob deseni veya desen listesi}
+            file_format: Dosya biçimi (parquet, csv); None ise uzantıdan
+                belirlenir (.csv.gz ve .csv.zst sıkıştırılmış CSV'dir)
+            column_types: {tablo adı: {sütun adı: SQLAlchemy tipi}}; verilen
+                sütunlarda çıkarılan tip yerine bu tip kullanılır
+            delimiter: CSV ayırıcı karakteri
+            block_size: CSV okuyucusunun bir seferde işlediği bayt sayısı
+        """
+        if not arrow_batches.ARROW_AVAILABLE:
+            raise Exception("Dosya kaynağı için pyarrow kurulu olmalıdır")
+        if file_format not in (None, self.FORMAT_PARQUET, self.FORMAT_CSV):
+            raise ValueError(f"Desteklenmeyen dosya biçimi: {file_format}")
+        
+        self.db_type = 'file'
+        self.tables = {
+            name: [patterns] if isinstance(patterns, str) else list(patterns)
+            for name, patterns in tables.items()
+        }
+        self.file_format = file_format
+        self.column_types = column_types or {}
+        self.delimiter = delimiter
+        self.block_size = block_size
+        self._schemas: Dict[str, object] = {}
+        self._sql_tables: Dict[str, Table] = {}
+        self._lock = threading.RLock()
+    
+    def connect(self) -> bool:
+        """Uyumluluk için; dosyaların varlığı okuma sırasında denetlenir"""
+        return True
+    
+    def close(self):
+        """Uyumluluk için; dosya kaynağında açık kaynak tutulmaz"""
+        pass
+    
+    def get_identity(self) -> str:
+        """Kaynağı tanımlayan kimlik (durum kayıtları için)"""
+        patterns = ';'.join(
+            f"{name}={','.join(patterns)}" for name, patterns in sorted(self.tables.items())
+        )
+        return f"file://{patterns}"
+    
+    def get_table_names(self) -> List[str]:
+        return list(self.tables)
+    
+    def get_files(self, table_name: str) -> List[str]:
+        """Tablonun desenleriyle eşleşen dosyalar (sıralı, tekrarsız)"""
+        files = []
+        for pattern in self.tables[table_name]:
+            matches = sorted(glob.glob(pattern, recursive=True))
+            if not matches:
+                logger.warning(f"{table_name}: '{pattern}' ile eşleşen dosya yok")
+            files.extend(path for path in matches if path not in files)
+        return files
+    
+    def _file_format(self, path: str) -> str:
+        if self.file_format:
+            return self.file_format
+        name = path.lower()
+        if name.endswith('.parquet') or name.endswith('.parq'):
+            return self.FORMAT_PARQUET
+        if name.endswith(('.csv', '.csv.gz', '.csv.zst', '.tsv')):
+            return self.FORMAT_CSV
+        raise ValueError(f"Dosya biçimi belirlenemedi: {path}")
+    
+    def get_schema(self, table_name: str):
+        """
+        Tablonun Arrow şeması. İlk dosyadan çıkarılır (CSV'de ilk blok
+        okunarak); column_types ile verilen sütunlar bu tiplere çevrilir.
+        """
+        with self._lock:
+            if table_name in self._schemas:
+                return self._schemas[table_name]
+            
+            pa = arrow_batches.pa
+            files = self.get_files(table_name)
+            if not files:
+                raise Exception(f"{table_name} için dosya bulunamadı")
+            
+            first = files[0]
+            if self._file_format(first) == self.FORMAT_PARQUET:
+                import pyarrow.parquet as pq
+                schema = pq.read_schema(first)
+            else:
+                reader = self._open_csv(first, None)
+                schema = reader.schema
+                reader.close()
+            
+            overrides = self.column_types.get(table_name, {})
+            fields = []
+            for field in schema:
+                if field.name in overrides:
+                    field_type = arrow_batches.arrow_type(overrides[field.name]) or pa.string()
+                elif pa.types.is_null(field.type):
+                    # İlk blokta yalnızca boş değer olan sütunlar metin kabul edilir
+                    field_type = pa.string()
+                else:
+                    field_type = field.type
+                fields.append(pa.field(field.name, field_type))
+            self._schemas[table_name] = pa.schema(fields)
+            return self._schemas[table_name]
+    
+    def get_table(self, table_name: str) -> Table:
+        """Tablonun şemasından oluşturulan SQLAlchemy Table nesnesi"""
+        with self._lock:
+            if table_name not in self._sql_tables:
+                overrides = self.column_types.get(table_name, {})
+                columns = [
+                    Column(field.name, overrides.get(field.name) or sqlalchemy_type(field.type))
+                    for field in self.get_schema(table_name)
+                ]
+                self._sql_tables[table_name] = Table(table_name, MetaData(), *columns)
+            return self._sql_tables[table_name]
+    
+    def estimate_row_count(self, table_name: str) -> Optional[int]:
+        """Parquet dosyalarında satır sayısı metadata'dan okunur; CSV için None"""
+        import pyarrow.parquet as pq
+        total = 0
+        for path in self.get_files(table_name):
+            if self._file_format(path) != self.FORMAT_PARQUET:
+                return None
+            total += pq.ParquetFile(path).metadata.num_rows
+        return total
+    
+    def _open_csv(self, path: str, schema):
+        import pyarrow.csv as pacsv
+        pa = arrow_batches.pa
+        delimiter = '\t' if path.lower().endswith('.tsv') else self.delimiter
+        convert_options = pacsv.ConvertOptions(
+            column_types=schema,
+            strings_can_be_null=True
+        )
+        return pacsv.open_csv(
+            pa.input_stream(path, compression='detect'),
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=self.block_size),
+            parse_options=pacsv.ParseOptions(delimiter=delimiter),
+            convert_options=convert_options
+        )
+    
+    def iter_batches(self, table_name: str, path: str, batch_size: int):
+        """
+        Bir dosyayı tablo şemasındaki RecordBatch parçaları halinde okur
+        
+        Args:
+            table_name: Tablo adı (şema için)
+            path: Dosya yolu
+            batch_size: Parça başına en fazla satır sayısı
+        """
+        schema = self.get_schema(table_name)
+        
+        if self._file_format(path) == self.FORMAT_PARQUET:
+            import pyarrow.parquet as pq
+            parquet_file = pq.ParquetFile(path)
+            for batch in parquet_file.iter_batches(batch_size=batch_size, columns=schema.names, use_threads=True):
+                yield batch.cast(schema) if not batch.schema.equals(schema) else batch
+            return
+        
+        reader = self._open_csv(path, schema)
+        try:
+            for batch in reader:
+                for offset in range(0, batch.num_rows, batch_size):
+                    yield batch.slice(offset, batch_size)
+        finally:
+            reader.close()
@@ -0,0 +1,233 @@
+"""
+Dosya Hedefi Modülü
+Bu modül, tabloları veritabanı yerine bir dizindeki Parquet veya CSV
+dosyalarına akış halinde yazan aktarım hedefini içerir. Arşivleme ve
+analitik sistemlere veri aktarımı için kullanılır; pyarrow gerektirir.
+"""
+
+from sqlalchemy import Table
+from typing import List, Optional
+import json
+import logging
+import os
+from . import arrow_batches
+
+logger = logging.getLogger(__name__)
+
+
+class FileTarget:
+    """
+    Tabloları dosyalara yazan aktarım hedefi.
+    
+    DataTransferEngine'e hedef olarak DatabaseConnection yerine verilir; her
+    tablo dizinde <tablo>.parquet, <tablo>.csv, <tablo>.csv.gz veya
+    <tablo>.csv.zst dosyasına yazılır. Dosya önce geçici adla oluşturulur ve
+    yalnızca tablo başarıyla bittiğinde yerine taşınır.
+    """
+    
+    FORMAT_PARQUET = "parquet"
+    FORMAT_CSV = "csv"
+    
+    # CSV sıkıştırması -> dosya uzantısı
+    CSV_EXTENSIONS = {None: '.csv', 'gzip': '.csv.gz', 'zstd': '.csv.zst'}
+    
+    def __init__(self,
+                 directory: str,
+                 file_format: str = FORMAT_PARQUET,
+                 compression: Optional[str] = None,
+                 row_group_size: int = 128 * 1024):
+        """
+        Args:
+            directory: Dosyaların yazılacağı dizin (yoksa oluşturulur)
+            file_format: Dosya biçimi (parquet, csv)
+            compression: Parquet için snappy (varsayılan), zstd, gzip, none;
+                CSV için gzip, zstd veya None (sıkıştırmasız)
+            row_group_size: Parquet row group başına satır sayısı; bellekte en
+                fazla bu kadar satır tamponlanır
+        """
+        if not arrow_batches.ARROW_AVAILABLE:
+            raise Exception("Dosya hedefi için pyarrow kurulu olmalıdır")
+        if file_format not in (self.FORMAT_PARQUET, self.FORMAT_CSV):
+            raise ValueError(f"Desteklenmeyen dosya biçimi: {file_format}")
+        if file_format == self.FORMAT_CSV and compression not in self.CSV_EXTENSIONS:
+            raise ValueError(f"Desteklenmeyen CSV sıkıştırması: {compression}")
+        
+        self.db_type = 'file'
+        self.directory = directory
+        self.file_format = file_format
+        self.compression = compression
+        self.row_group_size = row_group_size
+    
+    @property
+    def extension(self) -> str:
+        if self.file_format == self.FORMAT_PARQUET:
+            return '.parquet'
+        return self.CSV_EXTENSIONS[self.compression]
+    
+    def connect(self) -> bool:
+        """Hedef dizini oluşturur"""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            return True
+        except Exception as e:
+            logger.error(f"Hedef dizin oluşturulamadı: {str(e)}")
+            return False
+    
+    def get_identity(self) -> str:
+        """Hedefi tanımlayan kimlik (durum kayıtları için)"""
+        return f"file://{os.path.abspath(self.directory)}?format={self.file_format}"
+    
+    def get_path(self, table_name: str) -> str:
+        return os.path.join(self.directory, table_name + self.extension)
+    
+    def get_table_names(self) -> List[str]:
+        """Dizinde bu biçimde yazılmış tablo isimleri"""
+        if not os.path.isdir(self.directory):
+            return []
+        extension = self.extension
+        return sorted(
+            name[:-len(extension)] for name in os.listdir(self.directory)
+            if name.endswith(extension)
+        )
+    
+    def arrow_schema(self, table: Table):
+        """Kaynak tablonun dosyada kullanılacak Arrow şeması"""
+        pa = arrow_batches.pa
+        fields = []
+        for column in table.columns:
+            # Karşılığı olmayan tipler (JSON, UUID vb.) metin olarak yazılır
+            field_type = arrow_batches.arrow_type(column.type) or pa.string()
+            if self.file_format == self.FORMAT_CSV and pa.types.is_binary(field_type):
+                # CSV ikili veri taşıyamaz; onaltılık metin olarak yazılır
+                field_type = pa.string()
+            fields.append(pa.field(column.name, field_type, column.nullable))
+        return pa.schema(fields)
+    
+    def open_table(self, table: Table) -> 'TableFileWriter':
+        """Tablo için yeni bir dosya yazıcısı açar"""
+        self.connect()
+        return TableFileWriter(
+            self.get_path(table.name), self.file_format, self.compression,
+            self.row_group_size, self.arrow_schema(table)
+        )
+    
+    def close(self):
+        """Uyumluluk için; dosya hedefinde açık kaynak tutulmaz"""
+        pass
+
+
+def _to_text(value) -> str:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex()
+    return str(value)
+
+
+class TableFileWriter:
+    """Tek bir tablonun RecordBatch parçalarını dosyaya yazan yazıcı"""
+    
+    def __init__(self, path: str, file_format: str, compression: Optional[str], row_group_size: int, schema):
+        """
+        Args:
+            path: Son dosya yolu (yazım sırasında <path>.tmp kullanılır)
+            file_format: parquet veya csv
+            compression: Sıkıştırma (bkz. FileTarget)
+            row_group_size: Parquet row group başına satır sayısı
+            schema: Dosyanın Arrow şeması
+        """
+        pa = arrow_batches.pa
+        self.path = path
+        self.temp_path = path + '.tmp'
+        self.file_format = file_format
+        self.row_group_size = row_group_size
+        self.schema = schema
+        self.rows_written = 0
+        self._buffer: List = []
+        self._buffered_rows = 0
+        self._stream = None
+        
+        if file_format == FileTarget.FORMAT_PARQUET:
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(self.temp_path, schema, compression=compression or 'snappy')
+        else:
+            import pyarrow.csv as pacsv
+            self._stream = pa.OSFile(self.temp_path, 'wb')
+            if compression:
+                self._stream = pa.CompressedOutputStream(self._stream, compression)
+            self._writer = pacsv.CSVWriter(self._stream, schema)
+    
+    def _conform(self, batch):
+        """Parçayı dosya şemasına uydurur (farklı çıkarılmış tipler cast edilir)"""
+        if batch.schema.equals(self.schema):
+            return batch
+        pa = arrow_batches.pa
+        arrays = []
+        for column, field in zip(batch.columns, self.schema):
+            if column.type == field.type:
+                arrays.append(column)
+                continue
+            try:
+                arrays.append(column.cast(field.type))
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                if not pa.types.is_string(field.type):
+                    raise
+                arrays.append(pa.array(
+                    [None if value is None else _to_text(value) for value in column.to_pylist()],
+                    type=field.type
+                ))
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+    
+    def write(self, batch):
+        """Bir parçayı yazar; Parquet'te row group dolana kadar tamponlanır"""
+        if batch.num_rows == 0:
+            return
+        batch = self._conform(batch)
+        self.rows_written += batch.num_rows
+        
+        if self.file_format != FileTarget.FORMAT_PARQUET:
+            self._writer.write_batch(batch)
+            return
+        
+        self._buffer.append(batch)
+        self._buffered_rows += batch.num_rows
+        if self._buffered_rows >= self.row_group_size:
+            self._flush(complete_groups_only=True)
+    
+    def _flush(self, complete_groups_only: bool = False):
+        """
+        Tampondaki satırları row group olarak yazar. complete_groups_only ise
+        yalnızca tam row group'lar yazılır, artan satırlar tamponda kalır.
+        """
+        if not self._buffer:
+            return
+        pa = arrow_batches.pa
+        buffered = pa.Table.from_batches(self._buffer, schema=self.schema)
+        write_rows = buffered.num_rows
+        if complete_groups_only:
+            write_rows -= write_rows % self.row_group_size
+        
+        self._writer.write_table(buffered.slice(0, write_rows), row_group_size=self.row_group_size)
+        remainder = buffered.slice(write_rows)
+        self._buffer = remainder.to_batches()
+        self._buffered_rows = remainder.num_rows
+    
+    def close(self):
+        """Kalan satırları yazar, dosyayı kapatır ve son adına taşır"""
+        if self.file_format == FileTarget.FORMAT_PARQUET:
+            self._flush()
+        self._writer.close()
+        if self._stream is not None:
+            self._stream.close()
+        os.replace(self.temp_path, self.path)
+    
+    def abort(self):
+        """Yazımı iptal eder ve geçici dosyayı siler"""
+        try:
+            self._writer.close()
+            if self._stream is not None:
+                self._stream.close()
+        except Exception as e:
+            logger.warning(f"{self.temp_path} kapatılamadı: {str(e)}")
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
@@ -0,0 +1,347 @@
+"""
+Aktarım Durumu Saklama Modülü
+Bu modül, artımlı aktarımların watermark (en yüksek değer) bilgisini ve
+devam ettirilebilir aktarımların tablo kontrol noktalarını yerel bir SQLite
+dosyasında kaynak/hedef/tablo üçlüsü başına saklar.
+"""
+
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import sqlite3
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _encode_value(value: Any) -> Tuple[str, str]:
+    """Watermark değerini (tip, metin) çiftine çevirir"""
+    if isinstance(value, bool):
+        return 'int', str(int(value))
+    if isinstance(value, int):
+        return 'int', str(value)
+    if isinstance(value, float):
+        return 'float', repr(value)
+    if isinstance(value, Decimal):
+        return 'decimal', str(value)
+    if isinstance(value, datetime):
+        return 'datetime', value.isoformat()
+    if isinstance(value, date):
+        return 'date', value.isoformat()
+    if isinstance(value, time):
+        return 'time', value.isoformat()
+    return 'str', str(value)
+
+
+def _decode_value(value_type: str, value: str) -> Any:
+    """_encode_value çıktısını orijinal Python tipine geri çevirir"""
+    if value_type == 'int':
+        return int(value)
+    if value_type == 'float':
+        return float(value)
+    if value_type == 'decimal':
+        return Decimal(value)
+    if value_type == 'datetime':
+        return datetime.fromisoformat(value)
+    if value_type == 'date':
+        return date.fromisoformat(value)
+    if value_type == 'time':
+        return time.fromisoformat(value)
+    return value
+
+
+class TransferStateStore:
+    """Aktarım durumunu yerel SQLite dosyasında saklayan sınıf"""
+    
+    def __init__(self, storage_file: str = "transfer_state.db"):
+        """
+        Args:
+            storage_file: Durum bilgisinin saklanacağı SQLite dosyası
+                (varsayılan olarak connections.enc ile aynı dizinde)
+        """
+        self.storage_file = storage_file
+        self.lock = threading.Lock()
+        self._create_tables()
+    
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.storage_file, timeout=30)
+    
+    def _create_tables(self):
+        with self.lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS watermarks ("
+                    "source TEXT NOT NULL, "
+                    "target TEXT NOT NULL, "
+                    "table_name TEXT NOT NULL, "
+                    "column_name TEXT NOT NULL, "
+                    "value_type TEXT NOT NULL, "
+                    "value TEXT NOT NULL, "
+                    "updated_at TEXT NOT NULL, "
+                    "PRIMARY KEY (source, target, table_name))"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS checkpoints ("
+                    "source TEXT NOT NULL, "
+                    "target TEXT NOT NULL, "
+                    "table_name TEXT NOT NULL, "
+                    "state TEXT NOT NULL, "
+                    "updated_at TEXT NOT NULL, "
+                    "PRIMARY KEY (source, target, table_name))"
+                )
+                conn.commit()
+            finally:
+                conn.close()
+    
+    def get_watermark(self, source: str, target: str, table_name: str) -> Optional[Tuple[str, Any]]:
+        """
+        Kayıtlı watermark'ı getirir
+        
+        Args:
+            source: Kaynak bağlantı kimliği
+            target: Hedef bağlantı kimliği
+            table_name: Tablo adı
+        
+        Returns:
+            (sütun adı, değer) veya kayıt yoksa None
+        """
+        with self.lock:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT column_name, value_type, value FROM watermarks "
+                    "WHERE source = ? AND target = ? AND table_name = ?",
+                    (source, target, table_name)
+                ).fetchone()
+            finally:
+                conn.close()
+        
+        if row is None:
+            return None
+        return row[0], _decode_value(row[1], row[2])
+    
+    def set_watermark(self, source: str, target: str, table_name: str, column_name: str, value: Any):
+        """
+        Watermark'ı kaydeder veya günceller
+        
+        Args:
+            source: Kaynak bağlantı kimliği
+            target: Hedef bağlantı kimliği
+            table_name: Tablo adı
+            column_name: Watermark sütunu
+            value: Aktarılan en yüksek değer
+        """
+        value_type, encoded = _encode_value(value)
+        with self.lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO watermarks "
+                    "(source, target, table_name, column_name, value_type, value, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (source, target, table_name, column_name, value_type, encoded,
+                     datetime.now().isoformat())
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        logger.info(f"{table_name} watermark güncellendi: {column_name} = {encoded}")
+    
+    def clear_watermark(self, source: str, target: str, table_name: str):
+        """Watermark'ı siler; sonraki artımlı aktarım tablonun tamamını kopyalar"""
+        with self.lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "DELETE FROM watermarks WHERE source = ? AND target = ? AND table_name = ?",
+                    (source, target, table_name)
+                )
+                conn.commit()
+            finally:
+                conn.close()
+    
+    def get_checkpoint(self, source: str, target: str, table_name: str) -> Optional[Dict]:
+        """
+        Tablonun kayıtlı kontrol noktasını getirir
+        
+        Returns:
+            Kontrol noktası durumu (dict) veya kayıt yoksa None
+        """
+        with self.lock:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT state FROM checkpoints WHERE source = ? AND target = ? AND table_name = ?",
+                    (source, target, table_name)
+                ).fetchone()
+            finally:
+                conn.close()
+        return json.loads(row[0]) if row else None
+    
+    def save_checkpoint(self, source: str, target: str, table_name: str, state: Dict):
+        """Tablonun kontrol noktasını kaydeder veya günceller"""
+        with self.lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO checkpoints (source, target, table_name, state, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (source, target, table_name, json.dumps(state), datetime.now().isoformat())
+                )
+                conn.commit()
+            finally:
+                conn.close()
+    
+    def clear_checkpoint(self, source: str, target: str, table_name: str):
+        """Tablonun kontrol noktasını siler"""
+        with self.lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "DELETE FROM checkpoints WHERE source = ? AND target = ? AND table_name = ?",
+                    (source, target, table_name)
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+
+def _encode_key(key: Optional[Tuple[Any, ...]]) -> Optional[List[List[str]]]:
+    if key is None:
+        return None
+    return [list(_encode_value(value)) for value in key]
+
+
+def _decode_key(encoded: Optional[List[List[str]]]) -> Optional[Tuple[Any, ...]]:
+    if encoded is None:
+        return None
+    return tuple(_decode_value(value_type, value) for value_type, value in encoded)
+
+
+class TableCheckpoint:
+    """
+    Bir tablonun aktarım ilerlemesini durum deposuna yazan yardımcı sınıf.
+    
+    Anahtar aralıkları ve her aralık için son commit edilen anahtar saklanır;
+    aktarım yarıda kalırsa aynı aralıklarla, son anahtardan sonrasından devam
+    edilebilir. Birden fazla thread aynı nesneyi kullanabilir.
+    """
+    
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    
+    def __init__(self,
+                 store: TransferStateStore,
+                 source: str,
+                 target: str,
+                 table_name: str,
+                 saved: Optional[Dict] = None):
+        """
+        Args:
+            store: Durum deposu
+            source: Kaynak bağlantı kimliği
+            target: Hedef bağlantı kimliği
+            table_name: Tablo adı
+            saved: Depodan okunan önceki durum (devam ettirirken)
+        """
+        self.store = store
+        self.source = source
+        self.target = target
+        self.table_name = table_name
+        self.lock = threading.Lock()
+        self.status = None
+        self.resumable = False
+        self.rows = 0
+        self.key_ranges: Optional[List[Tuple[Any, Any]]] = None
+        self.partitions: List[Dict] = []
+        
+        if saved:
+            self.status = saved.get('status')
+            self.resumable = saved.get('resumable', False)
+            self.rows = saved.get('rows', 0)
+            if saved.get('key_ranges') is not None:
+                self.key_ranges = [
+                    (_decode_key(lower), _decode_key(upper)) for lower, upper in saved['key_ranges']
+                ]
+            self.partitions = [
+                {'last_key': _decode_key(partition['last_key']), 'done': partition['done']}
+                for partition in saved.get('partitions', [])
+            ]
+    
+    def is_done(self) -> bool:
+        """Tablo önceki çalıştırmada tamamlandı mı"""
+        return self.status == self.STATUS_DONE
+    
+    def can_resume(self) -> bool:
+        """Yarıda kalan tablo son anahtardan devam ettirilebilir mi"""
+        return self.status == self.STATUS_RUNNING and self.resumable and self.key_ranges is not None
+    
+    def reset(self):
+        """Önceki ilerlemeyi yok sayar (tablo baştan aktarılacak)"""
+        with self.lock:
+            self.status = None
+            self.resumable = False
+            self.rows = 0
+            self.key_ranges = None
+            self.partitions = []
+    
+    def begin(self, key_ranges: List[Tuple[Any, Any]], resumable: bool):
+        """
+        Aktarımın başladığını kaydeder
+        
+        Args:
+            key_ranges: Tablonun bölündüğü anahtar aralıkları
+            resumable: Parça bazında son anahtar kaydedilebiliyor mu
+        """
+        with self.lock:
+            if not self.can_resume():
+                self.rows = 0
+                self.partitions = [{'last_key': None, 'done': False} for _ in key_ranges]
+            self.key_ranges = list(key_ranges)
+            self.resumable = resumable
+            self.status = self.STATUS_RUNNING
+            self._save()
+    
+    def last_key(self, partition: int) -> Optional[Tuple[Any, ...]]:
+        """Aralıkta son commit edilen anahtar"""
+        return self.partitions[partition]['last_key']
+    
+    def is_partition_done(self, partition: int) -> bool:
+        return self.partitions[partition]['done']
+    
+    def record(self, partition: int, last_key: Optional[Tuple[Any, ...]], row_count: int):
+        """Commit edilen bir parçadan sonra son anahtarı kaydeder"""
+        with self.lock:
+            self.rows += row_count
+            self.partitions[partition]['last_key'] = last_key
+            self._save()
+    
+    def finish_partition(self, partition: int):
+        with self.lock:
+            self.partitions[partition]['done'] = True
+            self._save()
+    
+    def finish(self, rows: int):
+        """Tablonun tamamlandığını kaydeder"""
+        with self.lock:
+            self.status = self.STATUS_DONE
+            self.rows = rows
+            self._save()
+    
+    def _save(self):
+        state = {
+            'status': self.status,
+            'resumable': self.resumable,
+            'rows': self.rows,
+            'key_ranges': None if self.key_ranges is None else [
+                [_encode_key(lower), _encode_key(upper)] for lower, upper in self.key_ranges
+            ],
+            'partitions': [
+                {'last_key': _encode_key(partition['last_key']), 'done': partition['done']}
+                for partition in self.partitions
+            ],
+        }
+        self.store.save_checkpoint(self.source, self.target, self.table_name, state)
@@ -0,0 +1,573 @@
+"""
+Tablo İşlemleri Modülü
+Bu modül, hedef tabloyu yükleme öncesinde temizleme, gölge tablo üzerinden
+atomik değiştirme (swap) ve toplu yükleme sırasında indeks/kısıtları
+erteleme gibi dialect'e özel DDL işlemlerini içerir.
+"""
+
+from sqlalchemy import (
+    Table, MetaData, Index, PrimaryKeyConstraint, UniqueConstraint, CheckConstraint, text, inspect
+)
+from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+import re
+import logging
+from .database_connection import DatabaseConnection
+
+logger = logging.getLogger(__name__)
+
+
+SHADOW_SUFFIX = "__sqt_shadow"
+OLD_SUFFIX = "__sqt_old"
+TEMP_INDEX_SUFFIX = "__sqt"
+
+# PostgreSQL tanımlayıcı uzunluk sınırı
+PG_MAX_IDENTIFIER = 63
+
+
+def _quote(connection: DatabaseConnection, name: str) -> str:
+    return connection.engine.dialect.identifier_preparer.quote(name)
+
+
+def _temp_name(connection: DatabaseConnection, name: str, suffix: str) -> str:
+    """Geçici tablo/indeks adı üretir (PostgreSQL uzunluk sınırına uyarak)"""
+    if connection.db_type == 'postgresql':
+        return name[:PG_MAX_IDENTIFIER - len(suffix)] + suffix
+    return name + suffix
+
+
+def truncate_table(connection: DatabaseConnection, table_name: str):
+    """
+    Hedef tabloyu dialect'e özel en hızlı yöntemle boşaltır.
+    
+    PostgreSQL ve MySQL'de TRUNCATE TABLE kullanılır. Tablo başka tablolarca
+    foreign key ile referans ediliyorsa TRUNCATE reddedilir; bu durumda
+    DELETE FROM'a geri dönülür. SQLite'ta koşulsuz DELETE FROM zaten
+    truncate optimizasyonunu kullanır.
+    """
+    quoted = _quote(connection, table_name)
+    
+    if connection.db_type in ('postgresql', 'mysql'):
+        try:
+            with connection.engine.connect() as conn:
+                conn.execute(text(f"TRUNCATE TABLE {quoted}"))
+                conn.commit()
+            return
+        except Exception as e:
+            logger.warning(f"{table_name} için TRUNCATE başarısız, DELETE kullanılıyor: {str(e)}")
+    
+    delete_rows(connection, table_name)
+
+
+def delete_rows(connection: DatabaseConnection, table_name: str):
+    """Hedef tablodaki tüm satırları DELETE FROM ile siler"""
+    with connection.engine.connect() as conn:
+        conn.execute(text(f"DELETE FROM {_quote(connection, table_name)}"))
+        conn.commit()
+
+
+def is_referenced_by_foreign_keys(connection: DatabaseConnection, table_name: str) -> bool:
+    """
+    Tabloya (kendisi dahil) herhangi bir tablodan foreign key ile referans
+    verilip verilmediğini kontrol eder. Referans verilen tablolar swap ile
+    değiştirilemez, çünkü referanslar eski tabloya bağlı kalır.
+    """
+    with connection.engine.connect() as conn:
+        if connection.db_type == 'postgresql':
+            row = conn.execute(
+                text("SELECT 1 FROM pg_constraint WHERE contype = 'f' "
+                     "AND confrelid = to_regclass(:name) LIMIT 1"),
+                {'name': _quote(connection, table_name)}
+            ).first()
+            return row is not None
+        
+        if connection.db_type == 'mysql':
+            row = conn.execute(
+                text("SELECT 1 FROM information_schema.KEY_COLUMN_USAGE "
+                     "WHERE REFERENCED_TABLE_SCHEMA = DATABASE() AND REFERENCED_TABLE_NAME = :name LIMIT 1"),
+                {'name': table_name}
+            ).first()
+            return row is not None
+    
+    for other_table in connection.get_table_names():
+        for foreign_key in connection.get_table(other_table).foreign_keys:
+            if foreign_key.column.table.name == table_name:
+                return True
+    return False
+
+
+def create_shadow_table(connection: DatabaseConnection, table: Table) -> Table:
+    """
+    Hedef tablonun sütunları, birincil anahtarı ve kısıtlarıyla boş bir gölge
+    tablo oluşturur.
+    
+    SQLite'ta gölge tablo orijinal CREATE TABLE ifadesinden yalnızca ad
+    değiştirilerek kurulur; böylece UNIQUE, CHECK ve foreign key kısıtları
+    aynen korunur. PostgreSQL ve MySQL'de UNIQUE ve CHECK kısıtları gölge
+    tabloya kopyalanır (şema genelinde benzersiz olması gereken adlar geçici
+    adla kurulur ve swap sırasında düzeltilir); tablonun tanımladığı foreign
+    key'ler ise okunup swap sonrasında yeniden eklenir.
+    
+    İkincil indeksler yükleme bitene kadar oluşturulmaz (bkz. build_shadow_indexes),
+    böylece yükleme sırasında indeks bakımı yapılmaz.
+    
+    Returns:
+        Gölge tablonun Table nesnesi
+    """
+    shadow_name = _temp_name(connection, table.name, SHADOW_SUFFIX)
+    drop_table(connection, shadow_name)
+    connection.invalidate(shadow_name)
+    
+    columns = [column._copy() for column in table.columns]
+    for column in columns:
+        column.primary_key = False
+    
+    args = list(columns)
+    primary_key_columns = [column.name for column in table.primary_key.columns]
+    if primary_key_columns:
+        primary_key_name = None
+        if connection.db_type == 'postgresql' and table.primary_key.name:
+            primary_key_name = _temp_name(connection, table.primary_key.name, TEMP_INDEX_SUFFIX)
+        args.append(PrimaryKeyConstraint(*primary_key_columns, name=primary_key_name))
+    
+    deferred_checks = []
+    if connection.db_type != 'sqlite':
+        # Kısıtlar sütun adlarıyla yeniden kurulur; _copy() kopyayı yansıtılan
+        # tabloya da bağlayacağı için kullanılmaz
+        for constraint in list(table.constraints):
+            if isinstance(constraint, UniqueConstraint):
+                name = constraint.name
+                # PostgreSQL'de UNIQUE kısıtın indeksi şema genelinde benzersiz adla kurulur
+                if connection.db_type == 'postgresql' and name:
+                    name = _temp_name(connection, name, TEMP_INDEX_SUFFIX)
+                shadow_constraint = UniqueConstraint(*[column.name for column in constraint.columns], name=name)
+                if name != constraint.name:
+                    shadow_constraint.info['original_name'] = constraint.name
+                args.append(shadow_constraint)
+            elif isinstance(constraint, CheckConstraint):
+                # MySQL'de CHECK adları şema genelinde benzersizdir ve yeniden
+                # adlandırılamaz; bu kısıtlar swap sonrasında eklenir
+                if connection.db_type == 'mysql' and constraint.name:
+                    deferred_checks.append(constraint)
+                else:
+                    args.append(CheckConstraint(constraint.sqltext, name=constraint.name))
+    
+    shadow = Table(shadow_name, MetaData(), *args)
+    if connection.db_type == 'sqlite':
+        _create_sqlite_shadow(connection, table.name, shadow_name)
+        shadow.info['foreign_keys'] = None
+    else:
+        shadow.create(connection.engine)
+        shadow.info['foreign_keys'] = capture_foreign_keys(connection, table.name)
+    shadow.info['deferred_checks'] = deferred_checks
+    logger.info(f"{table.name} için gölge tablo oluşturuldu: {shadow_name}")
+    return shadow
+
+
+def _create_sqlite_shadow(connection: DatabaseConnection, table_name: str, shadow_name: str):
+    """Tablonun sqlite_master'daki CREATE TABLE ifadesini gölge tablo adıyla çalıştırır"""
+    with connection.engine.connect() as conn:
+        create_sql = conn.execute(
+            text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {'name': table_name}
+        ).scalar()
+        match = re.match(
+            r'\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?'
+            r'(?:"(?:[^"]|"")*"|`[^`]*`|\[[^\]]*\]|[^\s(]+)\s*\(',
+            create_sql or '', re.IGNORECASE
+        )
+        if match is None:
+            raise Exception(f"{table_name} tablosunun CREATE TABLE ifadesi okunamadı")
+        conn.execute(text(
+            f"CREATE TABLE {_quote(connection, shadow_name)} (" + create_sql[match.end():]
+        ))
+        conn.commit()
+
+
+def build_shadow_indexes(connection: DatabaseConnection, table: Table, shadow: Table) -> List[Index]:
+    """
+    Orijinal tablonun ikincil indekslerini yüklenmiş gölge tablo üzerinde kurar.
+    
+    İndeks adları MySQL'de tabloya özeldir ve aynen kullanılır; PostgreSQL'de
+    şema genelinde benzersiz olmaları gerektiğinden geçici adla kurulur ve
+    swap sırasında yeniden adlandırılır. SQLite indeks yeniden adlandırmayı
+    desteklemediğinden indeksler burada kurulmaz, swap sırasında orijinal
+    adlarıyla bir kez kurulur.
+    
+    Returns:
+        Gölge tablo için tanımlanan Index nesneleri
+    """
+    created = []
+    for index in table.indexes:
+        column_names = [column.name for column in index.columns]
+        if not column_names or len(column_names) != len(index.expressions):
+            logger.warning(f"{index.name} ifade tabanlı indeks olduğu için gölge tabloya kopyalanmadı")
+            continue
+        
+        if connection.db_type == 'postgresql':
+            name = _temp_name(connection, index.name, TEMP_INDEX_SUFFIX)
+        else:
+            name = index.name
+        
+        shadow_index = Index(name, *[shadow.c[column_name] for column_name in column_names],
+                             unique=index.unique)
+        shadow_index.info['original_name'] = index.name
+        if connection.db_type != 'sqlite':
+            shadow_index.create(connection.engine)
+        created.append(shadow_index)
+    return created
+
+
+def swap_shadow_table(connection: DatabaseConnection,
+                      table: Table,
+                      shadow: Table,
+                      shadow_indexes: Optional[List[Index]] = None):
+    """
+    Yüklenmiş gölge tabloyu atomik olarak hedef tablonun yerine koyar.
+    
+    MySQL'de tek bir RENAME TABLE ifadesi, PostgreSQL ve SQLite'ta tek bir
+    transaction içinde ALTER TABLE ... RENAME kullanılır. Okuyucular swap
+    anına kadar eski veriyi görmeye devam eder. Eski tablo silindikten sonra
+    tablonun tanımladığı foreign key'ler ve (MySQL'de) CHECK kısıtları
+    orijinal adlarıyla yeniden eklenir.
+    """
+    table_name = table.name
+    old_name = _temp_name(connection, table_name, OLD_SUFFIX)
+    quoted_table = _quote(connection, table_name)
+    quoted_shadow = _quote(connection, shadow.name)
+    quoted_old = _quote(connection, old_name)
+    
+    if connection.db_type == 'mysql':
+        with connection.engine.connect() as conn:
+            conn.execute(text(f"RENAME TABLE {quoted_table} TO {quoted_old}, {quoted_shadow} TO {quoted_table}"))
+            conn.execute(text(f"DROP TABLE {quoted_old}"))
+            for constraint in shadow.info.get('deferred_checks', []):
+                conn.execute(text(
+                    f"ALTER TABLE {quoted_table} ADD CONSTRAINT {_quote(connection, constraint.name)} "
+                    f"CHECK ({constraint.sqltext})"
+                ))
+            conn.commit()
+        _restore_shadow_foreign_keys(connection, table_name, shadow)
+        return
+    
+    if connection.db_type == 'sqlite':
+        _swap_sqlite(connection, quoted_table, quoted_shadow, quoted_old, shadow_indexes or [])
+        return
+    
+    with connection.engine.begin() as conn:
+        conn.execute(text(f"ALTER TABLE {quoted_table} RENAME TO {quoted_old}"))
+        conn.execute(text(f"ALTER TABLE {quoted_shadow} RENAME TO {quoted_table}"))
+        _move_sequence_ownership(connection, conn, table, table_name)
+        conn.execute(text(f"DROP TABLE {quoted_old}"))
+        
+        for shadow_index in shadow_indexes or []:
+            conn.execute(text(
+                f"ALTER INDEX {_quote(connection, shadow_index.name)} "
+                f"RENAME TO {_quote(connection, shadow_index.info['original_name'])}"
+            ))
+        if table.primary_key.name and shadow.primary_key.name:
+            conn.execute(text(
+                f"ALTER TABLE {quoted_table} RENAME CONSTRAINT "
+                f"{_quote(connection, shadow.primary_key.name)} TO {_quote(connection, table.primary_key.name)}"
+            ))
+        for constraint in shadow.constraints:
+            if isinstance(constraint, UniqueConstraint) and 'original_name' in constraint.info:
+                conn.execute(text(
+                    f"ALTER TABLE {quoted_table} RENAME CONSTRAINT "
+                    f"{_quote(connection, constraint.name)} TO {_quote(connection, constraint.info['original_name'])}"
+                ))
+    
+    _restore_shadow_foreign_keys(connection, table_name, shadow)
+
+
+def _restore_shadow_foreign_keys(connection: DatabaseConnection, table_name: str, shadow: Table):
+    """create_shadow_table sırasında okunan foreign key'leri yeni tabloya ekler"""
+    captured = shadow.info.get('foreign_keys')
+    if captured and captured['foreign_keys']:
+        restore_deferrable_objects(connection, table_name, captured)
+
+
+def _swap_sqlite(connection: DatabaseConnection,
+                 quoted_table: str,
+                 quoted_shadow: str,
+                 quoted_old: str,
+                 shadow_indexes: List[Index]):
+    """
+    SQLite'ta swap'ı tek bir açık transaction içinde çalıştırır. Python sqlite3
+    modülü DDL öncesinde otomatik BEGIN açmadığı için executescript kullanılır.
+    SQLite indeks yeniden adlandırmayı desteklemediğinden gölge tabloda
+    önceden kurulmayan indeksler, eski tablo (ve indeksleri) silindikten
+    sonra orijinal adlarıyla kurulur.
+    """
+    statements = [
+        # Görünüm/trigger referanslarının eski tabloya yeniden yazılmasını engelle
+        "PRAGMA legacy_alter_table = ON",
+        "BEGIN",
+        f"ALTER TABLE {quoted_table} RENAME TO {quoted_old}",
+        f"ALTER TABLE {quoted_shadow} RENAME TO {quoted_table}",
+        f"DROP TABLE {quoted_old}",
+    ]
+    for shadow_index in shadow_indexes:
+        columns_sql = ', '.join(_quote(connection, column.name) for column in shadow_index.columns)
+        unique_sql = "UNIQUE " if shadow_index.unique else ""
+        statements.append(
+            f"CREATE {unique_sql}INDEX {_quote(connection, shadow_index.info['original_name'])} "
+            f"ON {quoted_table} ({columns_sql})"
+        )
+    statements.append("COMMIT")
+    statements.append("PRAGMA legacy_alter_table = OFF")
+    
+    raw_conn = connection.engine.raw_connection()
+    try:
+        cursor = raw_conn.cursor()
+        cursor.executescript(';\n'.join(statements) + ';')
+        cursor.close()
+    except Exception:
+        raw_conn.rollback()
+        raise
+    finally:
+        raw_conn.close()
+
+
+def _move_sequence_ownership(connection: DatabaseConnection, conn, table: Table, table_name: str):
+    """
+    PostgreSQL'de serial sütunların sequence'larını yeni tabloya devreder, aksi
+    halde eski tablo silinirken sequence de silinir. Identity sütunlarının
+    yeni sequence'ı yüklenen en büyük değere ilerletilir.
+    """
+    quoted_table = _quote(connection, table_name)
+    for column in table.columns:
+        if getattr(column, 'identity', None) is not None:
+            quoted_column = _quote(connection, column.name)
+            conn.execute(text(
+                f"SELECT setval(pg_get_serial_sequence(:table, :column), "
+                f"COALESCE(MAX({quoted_column}), 1)) FROM {quoted_table}"
+            ), {'table': quoted_table, 'column': column.name})
+            continue
+        
+        default = column.server_default
+        default_sql = str(getattr(default, 'arg', '')) if default is not None else ''
+        match = re.search(r"nextval\('([^']+)'", default_sql)
+        if match:
+            conn.execute(text(
+                f"ALTER SEQUENCE {match.group(1)} OWNED BY "
+                f"{quoted_table}.{_quote(connection, column.name)}"
+            ))
+
+
+def drop_table(connection: DatabaseConnection, table_name: str):
+    """Tablo varsa siler"""
+    with connection.engine.connect() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {_quote(connection, table_name)}"))
+        conn.commit()
+    connection.invalidate(table_name)
+
+
+def capture_deferrable_objects(connection: DatabaseConnection, table_name: str) -> Dict:
+    """
+    Yükleme süresince kaldırılabilecek ikincil indeksleri ve foreign key'leri okur.
+    
+    PostgreSQL ve SQLite'ta indeks tanımları katalogdan olduğu gibi alınır;
+    böylece ifade tabanlı ve kısmi (WHERE) indeksler de aynen geri kurulur.
+    MySQL'de tanım inspector çıktısından üretilir. Birincil anahtar, kısıt
+    tarafından oluşturulan indeksler ve adsız foreign key'ler (SQLite)
+    dokunulmadan bırakılır.
+    
+    Returns:
+        {'indexes': [...], 'foreign_keys': [...], 'disable_keys': bool}
+    """
+    inspector = inspect(connection.engine)
+    
+    if connection.db_type in ('postgresql', 'sqlite'):
+        if connection.db_type == 'postgresql':
+            query = text(
+                "SELECT i.relname, pg_get_indexdef(i.oid) FROM pg_index x "
+                "JOIN pg_class i ON i.oid = x.indexrelid "
+                "WHERE x.indrelid = to_regclass(:name) AND NOT x.indisprimary "
+                "AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.oid)"
+            )
+            params = {'name': _quote(connection, table_name)}
+        else:
+            query = text("SELECT name, sql FROM sqlite_master "
+                         "WHERE type = 'index' AND tbl_name = :name AND sql IS NOT NULL")
+            params = {'name': table_name}
+        with connection.engine.connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        indexes = [{'name': row[0], 'definition': row[1]} for row in rows]
+    else:
+        indexes = []
+        for index in inspector.get_indexes(table_name):
+            if any(column is None for column in index.get('column_names', [])):
+                logger.info(f"{index['name']} ifade tabanlı olduğu için ertelenmiyor")
+                continue
+            indexes.append(index)
+    
+    foreign_keys = []
+    if connection.db_type != 'sqlite':
+        foreign_keys = [fk for fk in inspector.get_foreign_keys(table_name) if fk.get('name')]
+    
+    disable_keys = False
+    if connection.db_type == 'mysql':
+        with connection.engine.connect() as conn:
+            storage_engine = conn.execute(
+                text("SELECT ENGINE FROM information_schema.TABLES "
+                     "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :name"),
+                {'name': table_name}
+            ).scalar()
+        # MyISAM'da DISABLE KEYS benzersiz olmayan indeksleri yükleme sonrasına erteler
+        disable_keys = (storage_engine or '').upper() == 'MYISAM'
+        if disable_keys:
+            indexes = [index for index in indexes if index.get('unique')]
+    
+    return {'indexes': indexes, 'foreign_keys': foreign_keys, 'disable_keys': disable_keys}
+
+
+def capture_foreign_keys(connection: DatabaseConnection,
+                         table_name: str,
+                         referred_tables: Optional[List[str]] = None) -> Dict:
+    """
+    Yalnızca foreign key'leri, drop/restore_deferrable_objects ile
+    kullanılabilecek biçimde okur.
+    
+    Args:
+        referred_tables: Verilirse sadece bu tablolara işaret eden foreign key'ler
+    
+    Returns:
+        {'indexes': [], 'foreign_keys': [...], 'disable_keys': False}
+    """
+    foreign_keys = []
+    if connection.db_type != 'sqlite':
+        foreign_keys = [
+            fk for fk in inspect(connection.engine).get_foreign_keys(table_name)
+            if fk.get('name') and (referred_tables is None or fk['referred_table'] in referred_tables)
+        ]
+    return {'indexes': [], 'foreign_keys': foreign_keys, 'disable_keys': False}
+
+
+def drop_deferrable_objects(connection: DatabaseConnection, table_name: str, captured: Dict):
+    """
+    Yakalanan foreign key'leri ve ardından indeksleri kaldırır. MySQL'de
+    indeksler foreign key'lere bağlı olabileceği için sıra önemlidir.
+    """
+    quoted_table = _quote(connection, table_name)
+    
+    with connection.engine.connect() as conn:
+        for foreign_key in captured['foreign_keys']:
+            quoted_name = _quote(connection, foreign_key['name'])
+            if connection.db_type == 'mysql':
+                conn.execute(text(f"ALTER TABLE {quoted_table} DROP FOREIGN KEY {quoted_name}"))
+            else:
+                conn.execute(text(f"ALTER TABLE {quoted_table} DROP CONSTRAINT {quoted_name}"))
+        
+        for index in captured['indexes']:
+            quoted_name = _quote(connection, index['name'])
+            if connection.db_type == 'mysql':
+                conn.execute(text(f"DROP INDEX {quoted_name} ON {quoted_table}"))
+            else:
+                conn.execute(text(f"DROP INDEX {quoted_name}"))
+        
+        if captured['disable_keys']:
+            conn.execute(text(f"ALTER TABLE {quoted_table} DISABLE KEYS"))
+        
+        conn.commit()
+    
+    connection.invalidate(table_name)
+    logger.info(
+        f"{table_name}: {len(captured['indexes'])} indeks ve "
+        f"{len(captured['foreign_keys'])} foreign key yükleme sonrasına ertelendi"
+    )
+
+
+def _index_columns_sql(connection: DatabaseConnection, index: Dict) -> str:
+    lengths = index.get('dialect_options', {}).get('mysql_length', {})
+    columns = []
+    for column_name in index['column_names']:
+        column_sql = _quote(connection, column_name)
+        if column_name in lengths:
+            column_sql += f"({lengths[column_name]})"
+        columns.append(column_sql)
+    return ', '.join(columns)
+
+
+def _add_foreign_key_sql(connection: DatabaseConnection, table_name: str, foreign_key: Dict) -> str:
+    """Inspector'dan okunan foreign key tanımı için ALTER TABLE ... ADD ifadesi üretir"""
+    columns = ', '.join(_quote(connection, column) for column in foreign_key['constrained_columns'])
+    referred_columns = ', '.join(_quote(connection, column) for column in foreign_key['referred_columns'])
+    referred_table = _quote(connection, foreign_key['referred_table'])
+    if foreign_key.get('referred_schema'):
+        referred_table = f"{_quote(connection, foreign_key['referred_schema'])}.{referred_table}"
+    
+    sql = (
+        f"ALTER TABLE {_quote(connection, table_name)} "
+        f"ADD CONSTRAINT {_quote(connection, foreign_key['name'])} "
+        f"FOREIGN KEY ({columns}) REFERENCES {referred_table} ({referred_columns})"
+    )
+    options = foreign_key.get('options', {})
+    if options.get('ondelete'):
+        sql += f" ON DELETE {options['ondelete']}"
+    if options.get('onupdate'):
+        sql += f" ON UPDATE {options['onupdate']}"
+    if connection.db_type == 'postgresql':
+        if options.get('deferrable'):
+            sql += " DEFERRABLE"
+            if options.get('initially'):
+                sql += f" INITIALLY {options['initially']}"
+        # Kısıt önce doğrulamadan eklenir, VALIDATE daha zayıf bir kilitle ayrıca çalışır
+        sql += " NOT VALID"
+    return sql
+
+
+def restore_deferrable_objects(connection: DatabaseConnection,
+                               table_name: str,
+                               captured: Dict,
+                               workers: int = 1):
+    """
+    Yükleme bittikten sonra ertelenen indeksleri ve foreign key'leri yeniden kurar.
+    
+    PostgreSQL'de indeksler workers kadar paralel bağlantıda kurulur.
+    MySQL'de tüm indeksler tek bir ALTER TABLE ile, tablo bir kez taranarak
+    eklenir. Foreign key'ler indekslerden sonra eklenir; PostgreSQL'de önce
+    NOT VALID olarak eklenip ardından VALIDATE CONSTRAINT ile doğrulanır.
+    """
+    quoted_table = _quote(connection, table_name)
+    indexes = captured['indexes']
+    
+    def run(sql: str):
+        with connection.engine.connect() as conn:
+            conn.execute(text(sql))
+            conn.commit()
+    
+    if captured['disable_keys']:
+        run(f"ALTER TABLE {quoted_table} ENABLE KEYS")
+    
+    if indexes and connection.db_type == 'mysql':
+        clauses = []
+        for index in indexes:
+            options = index.get('dialect_options', {})
+            kind = "UNIQUE " if index.get('unique') else ""
+            if options.get('mysql_prefix'):
+                kind = options['mysql_prefix'] + " "
+            clauses.append(
+                f"ADD {kind}INDEX {_quote(connection, index['name'])} ({_index_columns_sql(connection, index)})"
+            )
+        run(f"ALTER TABLE {quoted_table} " + ', '.join(clauses))
+    elif indexes and connection.db_type == 'postgresql' and workers > 1:
+        connection.ensure_pool_size(workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"index-{table_name}") as executor:
+            futures = [
+                executor.submit(run, index['definition'])
+                for index in indexes
+            ]
+            for future in futures:
+                future.result()
+    else:
+        for index in indexes:
+            run(index['definition'])
+    
+    for foreign_key in captured['foreign_keys']:
+        run(_add_foreign_key_sql(connection, table_name, foreign_key))
+        if connection.db_type == 'postgresql':
+            run(f"ALTER TABLE {quoted_table} VALIDATE CONSTRAINT {_quote(connection, foreign_key['name'])}")
+    
+    connection.invalidate(table_name)
+    logger.info(f"{table_name}: ertelenen indeks ve foreign key'ler yeniden kuruldu")
@@ -0,0 +1,208 @@
+"""
+Tablo Zamanlama Modülü
+Bu modül, aktarılacak tabloları foreign key bağımlılıklarına göre sıralayan
+ve birbirinden bağımsız dalları paralel çalıştıran zamanlayıcıyı içerir.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import List, Dict, Set, Tuple, Callable
+import logging
+from .database_connection import DatabaseConnection
+
+logger = logging.getLogger(__name__)
+
+
+def collect_dependencies(connections: List[DatabaseConnection],
+                         table_names: List[str]) -> Dict[str, Set[str]]:
+    """
+    Yansıtılmış tabloların foreign key'lerinden bağımlılık grafiğini çıkarır.
+    
+    Her tablo, foreign key ile işaret ettiği (ve aktarım listesinde bulunan)
+    tablolara bağımlıdır. Birden fazla bağlantı verilirse (kaynak ve hedef)
+    kenarlar birleştirilir.
+    
+    Args:
+        connections: Foreign key'leri okunacak bağlantılar
+        table_names: Aktarılacak tablo isimleri
+    
+    Returns:
+        {tablo: {bağımlı olduğu tablolar}}
+    """
+    selected = set(table_names)
+    dependencies = {name: set() for name in table_names}
+    
+    for connection in connections:
+        existing = set(connection.get_table_names())
+        for table_name in table_names:
+            if table_name not in existing:
+                continue
+            try:
+                table = connection.get_table(table_name)
+            except Exception as e:
+                logger.warning(f"{table_name} foreign key'leri okunamadı: {str(e)}")
+                continue
+            for constraint in table.foreign_key_constraints:
+                referred = constraint.referred_table.name
+                if referred in selected:
+                    dependencies[table_name].add(referred)
+    
+    return dependencies
+
+
+class TableScheduler:
+    """
+    Tabloları foreign key bağımlılıklarına göre çalıştıran zamanlayıcı.
+    
+    Bir tablo, bağımlı olduğu tüm tablolar bittikten sonra başlatılır;
+    bağımlılıkları tamamlanmış tablolar aynı anda çalışabilir. Döngüye giren
+    tablolar (karşılıklı veya kendine referans veren foreign key'ler) güçlü
+    bağlı bileşenler olarak bulunur; bileşen içindeki kenarlar sıralamadan
+    çıkarılır ve cyclic_edges içinde raporlanır. Bu kenarlara karşılık gelen
+    kısıtların yükleme boyunca ertelenmesi çağıranın sorumluluğundadır.
+    """
+    
+    def __init__(self, table_names: List[str], dependencies: Dict[str, Set[str]]):
+        """
+        Args:
+            table_names: Tablolar (eşit durumda bu sıra korunur)
+            dependencies: {tablo: {bağımlı olduğu tablolar}}
+        """
+        self.table_names = list(table_names)
+        selected = set(self.table_names)
+        graph = {
+            name: {parent for parent in dependencies.get(name, ()) if parent in selected}
+            for name in self.table_names
+        }
+        
+        self.components = self._strongly_connected_components(graph)
+        component_of = {}
+        for index, component in enumerate(self.components):
+            for name in component:
+                component_of[name] = index
+        
+        # Aynı bileşen içindeki kenarlar döngü oluşturur; bunlar ertelenecek
+        self.cyclic_edges: Set[Tuple[str, str]] = set()
+        self.dependencies: Dict[str, Set[str]] = {}
+        for name, parents in graph.items():
+            self.dependencies[name] = set()
+            for parent in parents:
+                if component_of[parent] == component_of[name]:
+                    self.cyclic_edges.add((name, parent))
+                else:
+                    self.dependencies[name].add(parent)
+        
+        if self.cyclic_edges:
+            logger.info(
+                "Foreign key döngüsü bulundu, şu kısıtlar ertelenecek: " +
+                ", ".join(f"{child} -> {parent}" for child, parent in sorted(self.cyclic_edges))
+            )
+    
+    def _strongly_connected_components(self, graph: Dict[str, Set[str]]) -> List[List[str]]:
+        """Tarjan algoritmasıyla güçlü bağlı bileşenleri bulur (özyinelemesiz)"""
+        index_of: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components: List[List[str]] = []
+        counter = 0
+        
+        for root in self.table_names:
+            if root in index_of:
+                continue
+            
+            work = [(root, iter(sorted(graph[root])))]
+            index_of[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            
+            while work:
+                node, parents = work[-1]
+                advanced = False
+                for parent in parents:
+                    if parent not in index_of:
+                        index_of[parent] = lowlink[parent] = counter
+                        counter += 1
+                        stack.append(parent)
+                        on_stack.add(parent)
+                        work.append((parent, iter(sorted(graph[parent]))))
+                        advanced = True
+                        break
+                    if parent in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[parent])
+                
+                if advanced:
+                    continue
+                
+                work.pop()
+                if work:
+                    caller = work[-1][0]
+                    lowlink[caller] = min(lowlink[caller], lowlink[node])
+                
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+        
+        return components
+    
+    def order(self) -> List[str]:
+        """
+        Bağımlılıkları önce gelecek şekilde topolojik sıra döndürür.
+        Aynı anda hazır olan tablolar orijinal sırayla dizilir.
+        """
+        remaining = {name: set(parents) for name, parents in self.dependencies.items()}
+        ordered = []
+        while remaining:
+            ready = [name for name in self.table_names if name in remaining and not remaining[name]]
+            for name in ready:
+                del remaining[name]
+                ordered.append(name)
+            for parents in remaining.values():
+                parents.difference_update(ready)
+        return ordered
+    
+    def run(self, worker: Callable[[str], None], max_workers: int = 1):
+        """
+        Her tablo için worker'ı bağımlılık sırasına uyarak çalıştırır.
+        
+        Args:
+            worker: Tablo ismini alan fonksiyon
+            max_workers: Aynı anda çalışabilecek en fazla tablo sayısı
+        """
+        if max_workers <= 1:
+            for table_name in self.order():
+                worker(table_name)
+            return
+        
+        remaining = {name: set(parents) for name, parents in self.dependencies.items()}
+        dependents: Dict[str, List[str]] = {name: [] for name in self.table_names}
+        for name, parents in self.dependencies.items():
+            for parent in parents:
+                dependents[parent].append(name)
+        
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix="transfer-table") as executor:
+            running = {}
+            
+            def submit_ready():
+                for name in self.table_names:
+                    if name in remaining and not remaining[name]:
+                        del remaining[name]
+                        running[executor.submit(worker, name)] = name
+            
+            submit_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finished = running.pop(future)
+                    future.result()
+                    for child in dependents[finished]:
+                        if child in remaining:
+                            remaining[child].discard(finished)
+                submit_ready()
@@ -3,11 +3,26 @@ Veri Aktarım Motor Modülü
 Bu modül, kaynak ve hedef veritabanları arasında veri aktarımı yapar.
 """
 
-from sqlalchemy import Table, MetaData, text, insert
-from sqlalchemy.schema import CreateTable
-from typing import List, Optional, Callable
+from sqlalchemy import Table, MetaData, Column, Integer, DateTime, Date, insert, select, func, and_, or_
+from sqlalchemy.schema import UniqueConstraint
+from typing import List, Dict, Optional, Callable, Tuple, Any, Iterable, Union
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import os
+import queue
+import threading
+import time
 from .database_connection import DatabaseConnection
+from .bulk_writers import create_writer
+from .chunk_sizer import FixedChunkSizer, AdaptiveChunkSizer
+from . import table_operations
+from .table_scheduler import TableScheduler, collect_dependencies
+from .state_store import TransferStateStore, TableCheckpoint
+from .checksum import RowChecksum, compute_checksum, supports_sql_checksum
+from .type_mapping import ConversionPlan, compile_plan
+from . import arrow_batches
+from .file_target import FileTarget
+from .file_source import FileSource
 
 logger = logging.getLogger(__name__)
 
@@ -18,47 +33,263 @@ class TransferOptions:
     SCHEMA_ONLY = "schema_only"
     SCHEMA_AND_DATA = "schema_and_data"
     DATA_ONLY = "data_only"
+    INCREMENTAL = "incremental"
+    DIFF = "diff"
+    
+    # Sayfalama stratejileri
+    PAGINATION_KEYSET = "keyset"
+    PAGINATION_OFFSET = "offset"
+    
+    # Satır sayısı belirleme yöntemleri
+    ROW_COUNT_ESTIMATE = "estimate"
+    ROW_COUNT_EXACT = "exact"
+    
+    # Hedef tabloyu temizleme stratejileri
+    CLEAR_TRUNCATE = "truncate"
+    CLEAR_DELETE = "delete"
+    CLEAR_SWAP = "swap"
+    
+    # Okuma stratejileri
+    READ_CHUNKED = "chunked"
+    READ_STREAM = "stream"
+    
+    # Yazma modları
+    WRITE_INSERT = "insert"
+    WRITE_UPSERT = "upsert"
+    
+    # Aktarım sonrası doğrulama yöntemleri
+    VERIFY_NONE = "none"
+    VERIFY_COUNT = "count"
+    VERIFY_CHECKSUM = "checksum"
     
     def __init__(self, mode: str = SCHEMA_AND_DATA, 
                  chunk_size: int = 1000,
-                 truncate_before_insert: bool = True):
+                 truncate_before_insert: bool = True,
+                 pagination: str = PAGINATION_KEYSET,
+                 read_strategy: str = READ_CHUNKED,
+                 pipelined: bool = False,
+                 queue_depth: int = 4,
+                 writer_threads: int = 1,
+                 max_workers: int = 1,
+                 table_partitions: int = 1,
+                 bulk_load: bool = True,
+                 adaptive_chunk_size: bool = False,
+                 target_batch_bytes: int = 8 * 1024 * 1024,
+                 max_chunk_size: int = 100000,
+                 row_count_mode: str = ROW_COUNT_ESTIMATE,
+                 clear_strategy: str = CLEAR_TRUNCATE,
+                 defer_indexes: bool = False,
+                 index_rebuild_workers: int = 1,
+                 order_by_foreign_keys: bool = True,
+                 watermark_columns: Optional[Dict[str, str]] = None,
+                 state_file: str = "transfer_state.db",
+                 diff_ranges: int = 16,
+                 diff_min_rows: int = 10000,
+                 write_mode: str = WRITE_INSERT,
+                 upsert_staging_rows: int = 0,
+                 checkpoint: bool = False,
+                 verify: str = VERIFY_NONE,
+                 use_arrow: bool = False,
+                 same_server: bool = True):
         """
         Args:
-            mode: Aktarım modu (schema_only, schema_and_data, data_only)
+            mode: Aktarım modu (schema_only, schema_and_data, data_only, incremental, diff).
+                incremental modunda yalnızca watermark sütunu son kayıtlı
+                değerden büyük olan satırlar okunur ve hedefe upsert edilir.
+                diff modunda anahtar aralıklarının özetleri iki tarafta
+                karşılaştırılır ve yalnızca farklı aralıklar yeniden kopyalanır.
             chunk_size: Veri aktarımında kullanılacak parça boyutu
             truncate_before_insert: Veri eklemeden önce hedef tabloyu temizle
+            pagination: Sayfalama stratejisi (keyset, offset). Keyset modunda
+                anahtarı olmayan tablolar otomatik olarak offset'e düşer.
+            read_strategy: Okuma stratejisi (chunked, stream). Stream modunda
+                tablo tek bir sunucu taraflı cursor ile baştan sona okunur.
+            pipelined: Okuma ve yazmayı ayrı thread'lerde eşzamanlı çalıştır
+            queue_depth: Okuyucu ile yazıcılar arasındaki kuyrukta bekleyebilecek
+                en fazla parça sayısı (geri basınç sınırı)
+            writer_threads: Pipeline modunda hedefe yazan thread sayısı
+            max_workers: Aynı anda aktarılacak tablo sayısı. Her tablo kendi
+                kaynak/hedef bağlantılarını motorların havuzundan alır.
+            table_partitions: Anahtarlı tek bir tablonun bölüneceği anahtar
+                aralığı sayısı. Aralıklar ayrı bağlantılarla eşzamanlı aktarılır.
+                Dosya kaynağında aynı tabloya eşzamanlı yüklenecek dosya sayısıdır.
+            bulk_load: Dialect destekliyorsa toplu yükleme yöntemini kullan
+                (PostgreSQL için COPY, MySQL için LOAD DATA LOCAL INFILE; iki
+                taraf da PostgreSQL ise COPY TO STDOUT -> COPY FROM STDIN).
+                False ise her zaman SELECT + INSERT.
+            adaptive_chunk_size: Parça boyutunu satır genişliği ve ölçülen
+                yazma hızına göre tablo bazında otomatik ayarla (chunk_size
+                yok sayılır)
+            target_batch_bytes: Uyarlamalı modda bir parçanın hedef bayt boyutu
+            max_chunk_size: Uyarlamalı modda en büyük parça boyutu
+            row_count_mode: İlerleme için toplam satır sayısının nasıl
+                alınacağı (estimate, exact). estimate modunda katalog
+                istatistikleri kullanılır ve aktarım sırasında düzeltilir;
+                COUNT(*) yalnızca exact modunda çalıştırılır.
+            clear_strategy: truncate_before_insert açıkken hedefin nasıl
+                temizleneceği (truncate, delete, swap). swap modunda veri
+                gölge tabloya yüklenir ve bitince atomik olarak yer
+                değiştirilir; hedef tablo yükleme boyunca okunabilir kalır.
+            defer_indexes: Hedefin ikincil indekslerini ve foreign key'lerini
+                yükleme öncesinde kaldırıp yükleme sonrasında yeniden kur
+                (MyISAM tablolarında ALTER TABLE ... DISABLE KEYS)
+            index_rebuild_workers: İndekslerin yeniden kurulmasında kullanılacak
+                paralel bağlantı sayısı
+            order_by_foreign_keys: Tabloları foreign key bağımlılıklarına göre
+                sırala (önce referans verilen tablolar); False ise verilen
+                sıra kullanılır
+            watermark_columns: incremental modunda tablo -> watermark sütunu
+                eşlemesi. Verilmeyen tablolarda tek sütunlu otomatik artan
+                tamsayı birincil anahtar veya updated_at benzeri bir zaman
+                damgası sütunu kullanılır.
+            state_file: Watermark'ların saklandığı SQLite dosyası
+            diff_ranges: diff modunda tablonun (ve farklı çıkan her aralığın)
+                bölüneceği aralık sayısı
+            diff_min_rows: diff modunda bu kadar veya daha az satırlı farklı
+                aralıklar daha fazla bölünmeden yeniden kopyalanır
+            write_mode: Yazma modu (insert, upsert). upsert modunda hedefte
+                anahtarı zaten bulunan satırlar hata vermek yerine güncellenir
+                (ON CONFLICT DO UPDATE / ON DUPLICATE KEY UPDATE).
+            upsert_staging_rows: Upsert'te bu boyuttaki ve daha büyük parçalar
+                önce geçici tabloya toplu yüklenip oradan birleştirilir
+                (0 ise geçici tablo kullanılmaz)
+            checkpoint: Her commit edilen parçadan sonra tablo durumunu ve son
+                anahtarı state_file'a kaydet; yarıda kalan aktarım
+                resume_transfer ile devam ettirilebilir
+            verify: Aktarım sonrası doğrulama (none, count, checksum). count
+                iki taraftaki kesin satır sayılarını, checksum ayrıca satır
+                sırasından bağımsız içerik özetlerini karşılaştırır.
+                Uyuşmazlıklar TransferProgress'e yazılır.
+            use_arrow: Parçaları pyarrow.RecordBatch olarak taşı (pyarrow
+                gerekir). Yalnızca kaynak veya hedef için ADBC sürücüsü
+                kuruluysa kullanılır; okuma ve/veya yazma ADBC ile yapılır.
+                Sürücü yoksa satır tabanlı yola geri dönülür.
+            same_server: Kaynak ve hedef aynı sunucudaysa (MySQL'de aynı
+                sunucu ve kullanıcı, SQLite'ta iki yerel dosya) satırları
+                Python'a çekmeden INSERT ... SELECT ile sunucu içinde,
+                anahtar aralıklarıyla parça parça kopyala
         """
         self.mode = mode
         self.chunk_size = chunk_size
         self.truncate_before_insert = truncate_before_insert
+        self.pagination = pagination
+        self.read_strategy = read_strategy
+        self.pipelined = pipelined
+        self.queue_depth = queue_depth
+        self.writer_threads = writer_threads
+        self.max_workers = max_workers
+        self.table_partitions = table_partitions
+        self.bulk_load = bulk_load
+        self.adaptive_chunk_size = adaptive_chunk_size
+        self.target_batch_bytes = target_batch_bytes
+        self.max_chunk_size = max_chunk_size
+        self.row_count_mode = row_count_mode
+        self.clear_strategy = clear_strategy
+        self.defer_indexes = defer_indexes
+        self.index_rebuild_workers = index_rebuild_workers
+        self.order_by_foreign_keys = order_by_foreign_keys
+        self.watermark_columns = watermark_columns or {}
+        self.state_file = state_file
+        self.diff_ranges = diff_ranges
+        self.diff_min_rows = diff_min_rows
+        self.write_mode = write_mode
+        self.upsert_staging_rows = upsert_staging_rows
+        self.checkpoint = checkpoint
+        self.verify = verify
+        self.use_arrow = use_arrow
+        self.same_server = same_server
 
 
 class TransferProgress:
-    """Aktarım ilerlemesini takip eden sınıf"""
+    """Aktarım ilerlemesini takip eden sınıf (thread-safe)"""
+    
+    # Tablo durumları
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
     
-    def __init__(self, total_tables: int):
+    def __init__(self, total_tables: int, table_names: Optional[List[str]] = None):
         self.total_tables = total_tables
         self.current_table = 0
         self.current_table_name = ""
         self.current_rows = 0
         self.total_rows = 0
         self.errors = []
+        self.table_states: Dict[str, Dict] = {}
+        self.lock = threading.RLock()
+        
+        for table_name in table_names or []:
+            self.table_states[table_name] = self._new_state()
+    
+    @staticmethod
+    def _new_state() -> Dict:
+        return {'status': TransferProgress.STATUS_PENDING, 'rows': 0, 'total_rows': 0}
         
     def update(self, table_name: str, rows_transferred: int, total_rows: int):
         """İlerleme bilgisini günceller"""
-        self.current_table_name = table_name
-        self.current_rows = rows_transferred
-        self.total_rows = total_rows
+        with self.lock:
+            self.current_table_name = table_name
+            self.current_rows = rows_transferred
+            self.total_rows = total_rows
+            
+            state = self.table_states.setdefault(table_name, self._new_state())
+            state['status'] = self.STATUS_RUNNING
+            state['rows'] = rows_transferred
+            state['total_rows'] = total_rows
+        
+    def update_partition(self, table_name: str, partition: int, rows_transferred: int):
+        """Bir tablonun tek bir anahtar aralığına ait ilerlemesini kaydeder"""
+        with self.lock:
+            state = self.table_states.setdefault(table_name, self._new_state())
+            state.setdefault('partitions', {})[partition] = rows_transferred
         
-    def next_table(self):
+    def next_table(self, table_name: Optional[str] = None, status: str = STATUS_DONE):
         """Bir sonraki tabloya geç"""
-        self.current_table += 1
-        self.current_rows = 0
-        self.total_rows = 0
+        with self.lock:
+            self.current_table += 1
+            self.current_rows = 0
+            self.total_rows = 0
+            
+            if table_name is not None:
+                state = self.table_states.setdefault(table_name, self._new_state())
+                state['status'] = status
         
     def add_error(self, error: str):
         """Hata ekle"""
-        self.errors.append(error)
+        with self.lock:
+            self.errors.append(error)
+    
+    def set_verification(self, table_name: str, result: Dict):
+        """
+        Tablonun doğrulama sonucunu kaydeder; uyuşmazlık varsa hata ekler
+        
+        Args:
+            result: source_rows, target_rows, source_checksum, target_checksum
+                ve matched anahtarlarını içeren sözlük
+        """
+        with self.lock:
+            state = self.table_states.setdefault(table_name, self._new_state())
+            state['verification'] = result
+            if not result['matched']:
+                self.errors.append(
+                    f"{table_name} doğrulanamadı: kaynak {result['source_rows']} satır, "
+                    f"hedef {result['target_rows']} satır"
+                    + ("" if result['source_rows'] != result['target_rows'] else ", içerik özetleri farklı")
+                )
+    
+    def get_verification_failures(self) -> List[str]:
+        """Doğrulaması başarısız olan tablolar"""
+        with self.lock:
+            return [
+                table_name for table_name, state in self.table_states.items()
+                if 'verification' in state and not state['verification']['matched']
+            ]
+    
+    def get_transferred_rows(self) -> int:
+        """Tüm tablolarda aktarılan toplam satır sayısı"""
+        with self.lock:
+            return sum(state['rows'] for state in self.table_states.values())
         
     def get_percentage(self) -> float:
         """Toplam ilerleme yüzdesini hesaplar"""
@@ -67,22 +298,120 @@ class TransferProgress:
         return (self.current_table / self.total_tables) * 100
 
 
+class _CopyPipe:
+    """
+    COPY TO STDOUT çıktısını COPY FROM STDIN girişine bağlayan sınırlı tampon.
+    
+    psycopg2'nin copy_expert'i yazma tarafında her satır için write(), okuma
+    tarafında read() çağırır. Satırlar chunk_bytes boyutuna ulaşana kadar
+    yazan tarafta biriktirilir ve kuyruğa tek parça olarak konur; böylece
+    kuyruk kilidi satır başına değil parça başına bir kez alınır. Kuyruk
+    doluyken yazan taraf, boşken okuyan taraf bekler; iki taraf da hat
+    kapatıldığında beklemeyi bırakır.
+    """
+    
+    _END = object()
+    
+    def __init__(self, on_data: Optional[Callable] = None, max_chunks: int = 64, chunk_bytes: int = 256 * 1024):
+        self._queue = queue.Queue(maxsize=max_chunks)
+        self._closed = threading.Event()
+        self._finished = False
+        self._on_data = on_data
+        self._chunk_bytes = chunk_bytes
+        self._buffer = bytearray()
+        self._pending = memoryview(b'')
+    
+    def _put(self, item):
+        while not self._closed.is_set():
+            try:
+                self._queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _get(self):
+        while True:
+            try:
+                return self._queue.get(timeout=0.5)
+            except queue.Empty:
+                if self._closed.is_set():
+                    raise IOError("COPY hattı kapatıldı")
+    
+    def _flush(self):
+        if not self._buffer:
+            return
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        if not self._put(data):
+            raise IOError("COPY hattı okuyucu tarafından kapatıldı")
+        if self._on_data:
+            self._on_data(data.count(b'\n'))
+    
+    def write(self, data):
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        self._buffer += data
+        if len(self._buffer) >= self._chunk_bytes:
+            self._flush()
+        return len(data)
+    
+    def finish(self, error: Optional[Exception] = None):
+        """Yazma tarafının bittiğini (veya hata aldığını) bildirir"""
+        if error is None:
+            self._flush()
+        self._put(error if error is not None else self._END)
+    
+    def read(self, size: int = -1) -> bytes:
+        if not self._pending:
+            if self._finished:
+                return b''
+            item = self._get()
+            if item is self._END:
+                self._finished = True
+                return b''
+            if isinstance(item, Exception):
+                self._finished = True
+                raise item
+            self._pending = memoryview(item)
+        
+        if size is None or size < 0:
+            size = len(self._pending)
+        data = bytes(self._pending[:size])
+        self._pending = self._pending[size:]
+        return data
+    
+    def close(self):
+        """Okuma tarafı bittiğinde yazan tarafı serbest bırakır"""
+        self._closed.set()
+
+
 class DataTransferEngine:
     """Veri aktarım işlemlerini gerçekleştiren ana sınıf"""
     
-    def __init__(self, source: DatabaseConnection, target: DatabaseConnection):
+    # Artımlı aktarımda otomatik aranan zaman damgası sütunları (öncelik sırasıyla)
+    WATERMARK_COLUMN_NAMES = ['updated_at', 'modified_at', 'last_modified', 'last_updated', 'updated']
+    
+    # SQLite'ta kaynak dosyanın hedef bağlantıya bağlandığı şema adı
+    SQLITE_SOURCE_SCHEMA = "sqt_source"
+    
+    def __init__(self,
+                 source: Union[DatabaseConnection, FileSource],
+                 target: Union[DatabaseConnection, FileTarget]):
         """
         Args:
-            source: Kaynak veritabanı bağlantısı
-            target: Hedef veritabanı bağlantısı
+            source: Kaynak veritabanı bağlantısı veya yüklenecek dosyaları tanımlayan FileSource
+            target: Hedef veritabanı bağlantısı veya tabloların yazılacağı FileTarget
         """
         self.source = source
         self.target = target
+        self.state_store: Optional[TransferStateStore] = None
         
     def transfer_tables(self, 
                        table_names: List[str], 
                        options: TransferOptions,
-                       progress_callback: Optional[Callable] = None) -> TransferProgress:
+                       progress_callback: Optional[Callable] = None,
+                       resume: bool = False) -> TransferProgress:
         """
         Belirtilen tabloları aktarır
         
@@ -90,53 +419,553 @@ class DataTransferEngine:
             table_names: Aktarılacak tablo isimleri listesi
             options: Aktarım seçenekleri
             progress_callback: İlerleme bildirimi için callback fonksiyonu
+            resume: Kayıtlı kontrol noktalarından devam et (bkz. resume_transfer)
             
         Returns:
             TransferProgress nesnesi
         """
-        progress = TransferProgress(len(table_names))
+        if isinstance(self.target, FileTarget):
+            return self._export_tables(table_names, options, progress_callback)
+        if isinstance(self.source, FileSource):
+            return self._import_tables(table_names, options, progress_callback)
+        
+        progress = TransferProgress(len(table_names), table_names)
         
+        # Her çalıştırmada tablolar bir kez, toplu olarak yansıtılır
+        self._prepare_metadata(table_names)
+        
+        checkpoints = self._load_checkpoints(table_names, options, resume)
+        resumed = {
+            name for name, checkpoint in checkpoints.items()
+            if checkpoint.is_done() or checkpoint.can_resume()
+        }
+        
+        if progress_callback:
+            # Callback'ler farklı thread'lerden gelebileceği için sıraya sokulur
+            user_callback = progress_callback
+            
+            def progress_callback(p: TransferProgress):
+                with p.lock:
+                    user_callback(p)
+        
+        # Foreign key bağımlılıklarına göre zamanla; bağımsız dallar paralel çalışır
+        dependencies = {}
+        if options.order_by_foreign_keys:
+            dependencies = collect_dependencies([self.source, self.target], table_names)
+        scheduler = TableScheduler(table_names, dependencies)
+        
+        copies_data = options.mode != TransferOptions.SCHEMA_ONLY
+        deferred_foreign_keys = self._defer_cyclic_foreign_keys(scheduler) if copies_data else {}
+        precleared = set()
+        if options.mode in [TransferOptions.SCHEMA_AND_DATA, TransferOptions.DATA_ONLY]:
+            precleared = self._clear_linked_tables(scheduler, options, resumed)
+        
+        # Havuz, worker'lar başlamadan bir kez boyutlandırılır: her tablo worker'ı
+        # aralık başına bir okuyucu ve yazıcı bağlantısı kullanır (doğrulama ve
+        # fark karşılaştırması iki taraf için de en az iki bağlantı açar)
+        concurrent_tables = options.max_workers if len(table_names) > 1 else 1
+        connections_per_range = 1 + (max(1, options.writer_threads) if options.pipelined else 1)
+        connections_per_table = max(2, max(1, options.table_partitions) * connections_per_range)
+        self.source.ensure_pool_size(max(1, concurrent_tables) * connections_per_table)
+        self.target.ensure_pool_size(max(1, concurrent_tables) * connections_per_table)
+            
+        def transfer(table_name: str):
+            checkpoint = checkpoints.get(table_name)
+            if checkpoint is not None and checkpoint.is_done():
+                # Önceki çalıştırmada tamamlanmış tablo
+                logger.info(f"{table_name} önceki çalıştırmada tamamlanmış, atlanıyor")
+                progress.update(table_name, checkpoint.rows, checkpoint.rows)
+                progress.next_table(table_name)
+                if progress_callback:
+                    progress_callback(progress)
+                return
+            self._transfer_table(
+                table_name, options, progress, progress_callback,
+                clear_target=table_name not in precleared,
+                checkpoint=checkpoint
+            )
+        
+        try:
+            scheduler.run(transfer, options.max_workers)
+        finally:
+            for table_name, captured in deferred_foreign_keys.items():
+                try:
+                    table_operations.restore_deferrable_objects(self.target, table_name, captured)
+                except Exception as e:
+                    error_msg = f"{table_name} foreign key'leri yeniden eklenemedi: {str(e)}"
+                    logger.error(error_msg)
+                    progress.add_error(error_msg)
+                
+        return progress
+    
+    def resume_transfer(self,
+                        table_names: List[str],
+                        options: TransferOptions,
+                        progress_callback: Optional[Callable] = None) -> TransferProgress:
+        """
+        Kontrol noktalarıyla kaydedilmiş yarım kalan bir aktarımı devam ettirir.
+        
+        Tamamlanmış tablolar atlanır, yarıda kalan tablolar temizlenmeden son
+        commit edilen anahtardan sonrasından devam eder, hiç başlamamış
+        tablolar normal şekilde aktarılır. Aktarım, ilk çalıştırmadakiyle aynı
+        seçeneklerle (özellikle aynı state_file ile) çağrılmalıdır.
+        
+        Args:
+            table_names: Aktarılacak tablo isimleri listesi
+            options: Aktarım seçenekleri
+            progress_callback: İlerleme bildirimi için callback fonksiyonu
+            
+        Returns:
+            TransferProgress nesnesi
+        """
+        return self.transfer_tables(table_names, options, progress_callback, resume=True)
+    
+    def _load_checkpoints(self,
+                          table_names: List[str],
+                          options: TransferOptions,
+                          resume: bool) -> Dict[str, TableCheckpoint]:
+        """
+        Tam kopyalama modlarında tablo kontrol noktalarını hazırlar.
+        Devam ettirilmiyorsa önceki çalıştırmanın kayıtları silinir.
+        """
+        if not (options.checkpoint or resume):
+            return {}
+        if options.mode not in [TransferOptions.SCHEMA_AND_DATA, TransferOptions.DATA_ONLY]:
+            return {}
+        
+        store = self._get_state_store(options)
+        source_id = self.source.get_identity()
+        target_id = self.target.get_identity()
+        
+        checkpoints = {}
         for table_name in table_names:
+            saved = None
+            if resume:
+                saved = store.get_checkpoint(source_id, target_id, table_name)
+            else:
+                store.clear_checkpoint(source_id, target_id, table_name)
+            checkpoints[table_name] = TableCheckpoint(store, source_id, target_id, table_name, saved)
+        return checkpoints
+    
+    def _defer_cyclic_foreign_keys(self, scheduler: TableScheduler) -> Dict[str, Dict]:
+        """
+        Döngü oluşturan foreign key'leri hedefte tüm aktarım süresince kaldırır
+        
+        Returns:
+            {tablo: capture_foreign_keys çıktısı} (yeniden eklemek için)
+        """
+        referred_by_table: Dict[str, List[str]] = {}
+        for child, parent in scheduler.cyclic_edges:
+            referred_by_table.setdefault(child, []).append(parent)
+        
+        deferred = {}
+        target_tables = set(self.target.get_table_names())
+        for table_name, referred_tables in referred_by_table.items():
+            if table_name not in target_tables:
+                continue
+            captured = table_operations.capture_foreign_keys(self.target, table_name, referred_tables)
+            if captured['foreign_keys']:
+                table_operations.drop_deferrable_objects(self.target, table_name, captured)
+                deferred[table_name] = captured
+        return deferred
+    
+    def _clear_linked_tables(self,
+                             scheduler: TableScheduler,
+                             options: TransferOptions,
+                             exclude: Optional[set] = None) -> set:
+        """
+        Foreign key ile bağlı hedef tabloları, önce referans veren tablolar
+        olacak şekilde (ters topolojik sırada) yüklemeden önce temizler.
+        Aksi halde referans verilen bir tablo, yüklenmemiş alt tablodaki eski
+        satırlar yüzünden temizlenemez.
+        
+        Args:
+            exclude: Temizlenmeyecek tablolar (ör. kontrol noktasından devam edenler)
+        
+        Returns:
+            Temizlenen tablo isimleri (bunlar yüklenirken tekrar temizlenmez)
+        """
+        if not options.truncate_before_insert:
+            return set()
+        
+        linked = set()
+        for table_name, parents in scheduler.dependencies.items():
+            if parents:
+                linked.add(table_name)
+                linked.update(parents)
+        for child, parent in scheduler.cyclic_edges:
+            linked.update((child, parent))
+        
+        target_tables = set(self.target.get_table_names())
+        cleared = set()
+        for table_name in reversed(scheduler.order()):
+            if table_name not in linked or table_name not in target_tables:
+                continue
+            if exclude and table_name in exclude:
+                continue
             try:
-                logger.info(f"Tablo aktarılıyor: {table_name}")
-                
-                # Şema aktarımı
-                if options.mode in [TransferOptions.SCHEMA_ONLY, TransferOptions.SCHEMA_AND_DATA]:
-                    self._transfer_schema(table_name)
-                
-                # Veri aktarımı
-                if options.mode in [TransferOptions.SCHEMA_AND_DATA, TransferOptions.DATA_ONLY]:
-                    rows_transferred = self._transfer_data(
-                        table_name, 
-                        options, 
-                        progress,
-                        progress_callback
-                    )
-                    logger.info(f"{table_name}: {rows_transferred} satır aktarıldı")
-                
-                progress.next_table()
-                
+                if options.clear_strategy == TransferOptions.CLEAR_DELETE:
+                    table_operations.delete_rows(self.target, table_name)
+                else:
+                    table_operations.truncate_table(self.target, table_name)
+                cleared.add(table_name)
+                logger.info(f"{table_name} temizlendi")
+            except Exception as e:
+                # Tablo yüklenirken normal yoldan temizlenmeyi tekrar dener
+                logger.warning(f"{table_name} önceden temizlenemedi: {str(e)}")
+        return cleared
+    
+    def _export_tables(self,
+                       table_names: List[str],
+                       options: TransferOptions,
+                       progress_callback: Optional[Callable] = None) -> TransferProgress:
+        """
+        Tabloları FileTarget'a dosya olarak yazar. Tablolar arasında sıra
+        gerekmediği için max_workers kadar tablo aynı anda yazılır.
+        """
+        progress = TransferProgress(len(table_names), table_names)
+        
+        self.source.invalidate()
+        try:
+            source_tables = set(self.source.get_table_names())
+            self.source.reflect_tables([name for name in table_names if name in source_tables])
+        except Exception as e:
+            logger.warning(f"Toplu yansıtma başarısız: {str(e)}")
+        
+        if progress_callback:
+            user_callback = progress_callback
+            
+            def progress_callback(p: TransferProgress):
+                with p.lock:
+                    user_callback(p)
+        
+        if options.max_workers > 1 and len(table_names) > 1:
+            self.source.ensure_pool_size(options.max_workers)
+        
+        TableScheduler(table_names, {}).run(
+            lambda table_name: self._export_table(table_name, options, progress, progress_callback),
+            options.max_workers
+        )
+        return progress
+    
+    def _export_table(self,
+                      table_name: str,
+                      options: TransferOptions,
+                      progress: TransferProgress,
+                      progress_callback: Optional[Callable] = None):
+        """
+        Tek bir tabloyu akış halinde dosyaya yazar, hataları progress'e yazar.
+        Bellekte aynı anda yalnızca bir okuma parçası ve en fazla bir Parquet
+        row group'u tutulur.
+        """
+        file_writer = None
+        try:
+            logger.info(f"Tablo dışa aktarılıyor: {table_name}")
+            source_table = self.source.get_table(table_name)
+            column_names = [column.name for column in source_table.columns]
+            
+            if options.row_count_mode == TransferOptions.ROW_COUNT_EXACT:
+                total_rows = self.source.count_rows(table_name)
+            else:
+                total_rows = self.source.estimate_row_count(table_name) or 0
+            progress.update(table_name, 0, total_rows)
+            
+            key_columns = []
+            if options.pagination == TransferOptions.PAGINATION_KEYSET:
+                key_columns = self._get_key_columns(source_table)
+            
+            chunk_sizer = FixedChunkSizer(options.chunk_size)
+            use_arrow = options.use_arrow and arrow_batches.ARROW_AVAILABLE
+            if use_arrow:
+                batches = arrow_batches.read_arrow_batches(
+                    self.source, source_table, self._range_select(source_table, key_columns), chunk_sizer
+                )
+            else:
+                if options.read_strategy == TransferOptions.READ_STREAM:
+                    rows_batches = self._read_stream_batches(source_table, key_columns, chunk_sizer)
+                elif key_columns:
+                    rows_batches = self._read_keyset_batches(source_table, key_columns, chunk_sizer)
+                else:
+                    rows_batches = self._read_offset_batches(source_table, chunk_sizer)
+                arrow_types = [arrow_batches.arrow_type(column.type) for column in source_table.columns]
+                batches = (
+                    arrow_batches.rows_to_record_batch(rows, column_names, arrow_types)
+                    for rows in rows_batches
+                )
+            
+            file_writer = self.target.open_table(source_table)
+            for batch in batches:
+                file_writer.write(batch)
+                rows_written = file_writer.rows_written
+                progress.update(table_name, rows_written, max(total_rows, rows_written))
                 if progress_callback:
                     progress_callback(progress)
-                    
-            except Exception as e:
-                error_msg = f"{table_name} aktarılırken hata: {str(e)}"
-                logger.error(error_msg)
-                progress.add_error(error_msg)
-                progress.next_table()
-                
+            
+            rows_written = file_writer.rows_written
+            file_writer.close()
+            file_writer = None
+            
+            # Tahmin yerine kesin sonucu bildir
+            progress.update(table_name, rows_written, rows_written)
+            logger.info(f"{table_name}: {rows_written} satır {self.target.get_path(table_name)} dosyasına yazıldı")
+            
+            progress.next_table(table_name)
+            if progress_callback:
+                progress_callback(progress)
+            
+        except Exception as e:
+            if file_writer is not None:
+                file_writer.abort()
+            error_msg = f"{table_name} dışa aktarılırken hata: {str(e)}"
+            logger.error(error_msg)
+            progress.add_error(error_msg)
+            progress.next_table(table_name, TransferProgress.STATUS_FAILED)
+    
+    def _import_tables(self,
+                       table_names: List[str],
+                       options: TransferOptions,
+                       progress_callback: Optional[Callable] = None) -> TransferProgress:
+        """
+        FileSource'taki dosyaları hedef veritabanına yükler. Tablolar
+        arasında sıra gerekmediği için max_workers kadar tablo aynı anda yüklenir.
+        """
+        progress = TransferProgress(len(table_names), table_names)
+        
+        self.target.invalidate()
+        try:
+            target_tables = set(self.target.get_table_names())
+            self.target.reflect_tables([name for name in table_names if name in target_tables])
+        except Exception as e:
+            logger.warning(f"Toplu yansıtma başarısız: {str(e)}")
+        
+        if progress_callback:
+            user_callback = progress_callback
+            
+            def progress_callback(p: TransferProgress):
+                with p.lock:
+                    user_callback(p)
+        
+        if options.max_workers > 1 and len(table_names) > 1:
+            self.target.ensure_pool_size(options.max_workers * max(1, options.table_partitions))
+        
+        TableScheduler(table_names, {}).run(
+            lambda table_name: self._import_table(table_name, options, progress, progress_callback),
+            options.max_workers
+        )
         return progress
     
+    def _import_table(self,
+                      table_name: str,
+                      options: TransferOptions,
+                      progress: TransferProgress,
+                      progress_callback: Optional[Callable] = None):
+        """Bir tablonun şemasını oluşturur ve/veya dosyalarını yükler, hataları progress'e yazar"""
+        try:
+            logger.info(f"Dosyalar yükleniyor: {table_name}")
+            
+            # Şema dosyadan çıkarılır (veya column_types ile verilir)
+            if options.mode in [TransferOptions.SCHEMA_ONLY, TransferOptions.SCHEMA_AND_DATA]:
+                self._transfer_schema(table_name)
+            
+            if options.mode != TransferOptions.SCHEMA_ONLY:
+                rows_transferred = self._import_files(table_name, options, progress, progress_callback)
+                logger.info(f"{table_name}: {rows_transferred} satır yüklendi")
+            
+            progress.next_table(table_name)
+            if progress_callback:
+                progress_callback(progress)
+            
+        except Exception as e:
+            error_msg = f"{table_name} yüklenirken hata: {str(e)}"
+            logger.error(error_msg)
+            progress.add_error(error_msg)
+            progress.next_table(table_name, TransferProgress.STATUS_FAILED)
+    
+    def _import_files(self,
+                      table_name: str,
+                      options: TransferOptions,
+                      progress: TransferProgress,
+                      progress_callback: Optional[Callable] = None) -> int:
+        """
+        Tablonun dosyalarını parça parça okuyup hedefe yazar.
+        
+        Dosyalar pyarrow okuyucularıyla RecordBatch olarak okunur ve dialect'in
+        en hızlı yazıcısıyla (COPY, LOAD DATA, ADBC) yazılır. table_partitions
+        kadar dosya aynı anda, ayrı bağlantılarla aynı tabloya yüklenir.
+        
+        Returns:
+            Yüklenen satır sayısı
+        """
+        try:
+            source_table = self.source.get_table(table_name)
+            target_table = self.target.get_table(table_name)
+            column_names = [column.name for column in source_table.columns]
+            files = self.source.get_files(table_name)
+            
+            total_rows = self.source.estimate_row_count(table_name) or 0
+            progress.update(table_name, 0, total_rows)
+            
+            # Dosyadan yüklemede gölge tablo kullanılmaz
+            if options.truncate_before_insert:
+                if options.clear_strategy == TransferOptions.CLEAR_DELETE:
+                    table_operations.delete_rows(self.target, table_name)
+                else:
+                    table_operations.truncate_table(self.target, table_name)
+                logger.info(f"{table_name} temizlendi")
+            
+            deferred = None
+            if options.defer_indexes:
+                deferred = table_operations.capture_deferrable_objects(self.target, table_name)
+                table_operations.drop_deferrable_objects(self.target, table_name, deferred)
+            
+            upsert_keys = None
+            if options.write_mode == TransferOptions.WRITE_UPSERT:
+                upsert_keys = [column.name for column in self._get_key_columns(target_table)]
+                if not upsert_keys:
+                    raise Exception("Upsert için hedef tabloda birincil anahtar veya unique indeks gerekli")
+            
+            writer = create_writer(
+                self.target, target_table, column_names, options.bulk_load,
+                upsert_keys, options.upsert_staging_rows
+            )
+            arrow_writer = arrow_batches.ArrowWriter(
+                self.target, target_table, column_names, writer, ingest=not upsert_keys
+            )
+            plan = compile_plan(source_table, self.source.db_type, self.target.db_type)
+            
+            rows_transferred = 0
+            progress_lock = threading.Lock()
+            
+            def load_file(path: str):
+                nonlocal rows_transferred, total_rows
+                logger.info(f"{table_name}: {path} yükleniyor")
+                for batch in self.source.iter_batches(table_name, path, options.chunk_size):
+                    arrow_writer.write(arrow_batches.apply_plan(plan, batch))
+                    with progress_lock:
+                        rows_transferred += batch.num_rows
+                        total_rows = max(total_rows, rows_transferred)
+                        progress.update(table_name, rows_transferred, total_rows)
+                        if progress_callback:
+                            progress_callback(progress)
+            
+            file_workers = min(max(1, options.table_partitions), len(files))
+            try:
+                if file_workers <= 1:
+                    for path in files:
+                        load_file(path)
+                else:
+                    self.target.ensure_pool_size(file_workers)
+                    with ThreadPoolExecutor(max_workers=file_workers,
+                                            thread_name_prefix=f"import-{table_name}") as executor:
+                        for future in [executor.submit(load_file, path) for path in files]:
+                            future.result()
+            finally:
+                arrow_writer.close()
+                if deferred is not None:
+                    table_operations.restore_deferrable_objects(
+                        self.target, table_name, deferred, options.index_rebuild_workers
+                    )
+            
+            # Tahmin yerine kesin sonucu bildir
+            progress.update(table_name, rows_transferred, rows_transferred)
+            return rows_transferred
+            
+        except Exception as e:
+            raise Exception(f"Dosya yükleme hatası: {str(e)}")
+    
+    def _prepare_metadata(self, table_names: List[str]):
+        """Kaynak ve hedef yansıtma önbelleklerini tazeler ve tabloları toplu yansıtır"""
+        self.source.invalidate()
+        self.target.invalidate()
+        
+        try:
+            source_tables = set(self.source.get_table_names())
+            self.source.reflect_tables([name for name in table_names if name in source_tables])
+            
+            target_tables = set(self.target.get_table_names())
+            self.target.reflect_tables([name for name in table_names if name in target_tables])
+        except Exception as e:
+            # Toplu yansıtma başarısız olursa tablolar tek tek yansıtılır
+            logger.warning(f"Toplu yansıtma başarısız: {str(e)}")
+    
+    def _transfer_table(self,
+                        table_name: str,
+                        options: TransferOptions,
+                        progress: TransferProgress,
+                        progress_callback: Optional[Callable] = None,
+                        clear_target: bool = True,
+                        checkpoint: Optional[TableCheckpoint] = None):
+        """Tek bir tablonun şema ve/veya verisini aktarır, hataları progress'e yazar"""
+        try:
+            logger.info(f"Tablo aktarılıyor: {table_name}")
+            
+            # Şema aktarımı
+            if options.mode in [TransferOptions.SCHEMA_ONLY, TransferOptions.SCHEMA_AND_DATA,
+                                TransferOptions.INCREMENTAL, TransferOptions.DIFF]:
+                self._transfer_schema(table_name)
+            
+            # Artımlı aktarım: yalnızca watermark'tan sonraki satırlar
+            if options.mode == TransferOptions.INCREMENTAL:
+                rows_transferred = self._transfer_incremental(
+                    table_name,
+                    options,
+                    progress,
+                    progress_callback
+                )
+                logger.info(f"{table_name}: {rows_transferred} yeni/değişen satır aktarıldı")
+            
+            # Fark senkronizasyonu: yalnızca özeti farklı aralıklar
+            if options.mode == TransferOptions.DIFF:
+                rows_transferred = self._transfer_diff(
+                    table_name,
+                    options,
+                    progress,
+                    progress_callback
+                )
+                logger.info(f"{table_name}: {rows_transferred} satır yeniden kopyalandı")
+            
+            # Veri aktarımı
+            source_checksum = None
+            if options.mode in [TransferOptions.SCHEMA_AND_DATA, TransferOptions.DATA_ONLY]:
+                if options.verify == TransferOptions.VERIFY_CHECKSUM:
+                    # Kaynak özeti kopyalama sırasında okunan satırlardan çıkarılır
+                    source_checksum = RowChecksum()
+                rows_transferred = self._transfer_data(
+                    table_name, 
+                    options, 
+                    progress,
+                    progress_callback,
+                    clear_target,
+                    checkpoint,
+                    source_checksum
+                )
+                logger.info(f"{table_name}: {rows_transferred} satır aktarıldı")
+                if source_checksum is not None and source_checksum.row_count != rows_transferred:
+                    # Özet tüm satırları kapsamıyor (ör. doğrudan COPY veya devam eden aktarım)
+                    source_checksum = None
+            
+            if options.verify != TransferOptions.VERIFY_NONE and options.mode != TransferOptions.SCHEMA_ONLY:
+                self._verify_table(table_name, options, progress, source_checksum)
+            
+            progress.next_table(table_name)
+            
+            if progress_callback:
+                progress_callback(progress)
+                
+        except Exception as e:
+            error_msg = f"{table_name} aktarılırken hata: {str(e)}"
+            logger.error(error_msg)
+            progress.add_error(error_msg)
+            progress.next_table(table_name, TransferProgress.STATUS_FAILED)
+    
     def _transfer_schema(self, table_name: str):
         """Tablo şemasını aktarır"""
         try:
             # Kaynak tablodan şemayı al
-            source_metadata = MetaData()
-            source_table = Table(table_name, source_metadata, autoload_with=self.source.engine)
+            source_table = self.source.get_table(table_name)
             
             # Hedef veritabanında tablo var mı kontrol et
-            target_inspector = inspect(self.target.engine)
-            if table_name in target_inspector.get_table_names():
+            if table_name in self.target.get_table_names():
                 logger.info(f"{table_name} hedefte zaten var, şema aktarımı atlanıyor")
                 return
             
@@ -144,12 +973,16 @@ class DataTransferEngine:
             target_metadata = MetaData()
             target_table = Table(table_name, target_metadata)
             
-            # Sütunları kopyala
+            # Sütunları hedef dialect'e uygun tiplerle kopyala
+            plan = compile_plan(source_table, self.source.db_type, self.target.db_type)
             for column in source_table.columns:
-                target_table.append_column(column.copy())
+                target_column = column.copy()
+                target_column.type = plan.target_types[column.name]
+                target_table.append_column(target_column)
             
             # Tabloyu oluştur
             target_metadata.create_all(self.target.engine)
+            self.target.invalidate(table_name)
             logger.info(f"{table_name} şeması başarıyla oluşturuldu")
             
         except Exception as e:
@@ -159,74 +992,1165 @@ class DataTransferEngine:
                       table_name: str, 
                       options: TransferOptions,
                       progress: TransferProgress,
-                      progress_callback: Optional[Callable] = None) -> int:
+                      progress_callback: Optional[Callable] = None,
+                      clear_target: bool = True,
+                      checkpoint: Optional[TableCheckpoint] = None,
+                      checksum: Optional[RowChecksum] = None) -> int:
         """
         Tablo verilerini aktarır
         
+        Args:
+            clear_target: False ise hedef, önceden temizlendiği için tekrar temizlenmez
+            checkpoint: Verilirse ilerleme kaydedilir; devam ettirilebilir bir
+                kontrol noktasıysa hedef temizlenmeden kalınan yerden devam edilir
+            checksum: Verilirse kopyalanan kaynak satırları bu özete eklenir
+        
         Returns:
             Aktarılan satır sayısı
         """
         try:
-            # Kaynak tablodan veriyi oku
-            source_metadata = MetaData()
-            source_table = Table(table_name, source_metadata, autoload_with=self.source.engine)
-            
-            # Hedef tabloyu al
-            target_metadata = MetaData()
-            target_table = Table(table_name, target_metadata, autoload_with=self.target.engine)
+            # Kaynak ve hedef tabloları yansıtma önbelleğinden al
+            source_table = self.source.get_table(table_name)
+            target_table = self.target.get_table(table_name)
             
-            # Toplam satır sayısını al
-            with self.source.engine.connect() as conn:
-                total_rows = conn.execute(
-                    text(f"SELECT COUNT(*) FROM {table_name}")
-                ).scalar()
+            # Toplam satır sayısını al (varsayılan olarak katalogdan tahmin)
+            if options.row_count_mode == TransferOptions.ROW_COUNT_EXACT:
+                total_rows = self.source.count_rows(table_name)
+            else:
+                total_rows = self.source.estimate_row_count(table_name) or 0
             
             progress.update(table_name, 0, total_rows)
             
+            resuming = checkpoint is not None and checkpoint.can_resume()
+            if resuming:
+                logger.info(f"{table_name} kontrol noktasından devam ediyor ({checkpoint.rows} satır kopyalanmıştı)")
+            elif checkpoint is not None:
+                checkpoint.reset()
+            
             # Hedef tabloyu temizle (gerekirse)
-            if options.truncate_before_insert:
-                with self.target.engine.connect() as conn:
-                    conn.execute(text(f"DELETE FROM {table_name}"))
-                    conn.commit()
-                logger.info(f"{table_name} temizlendi")
+            shadow_table = None
+            if options.truncate_before_insert and clear_target and not resuming:
+                clear_strategy = options.clear_strategy
+                if (clear_strategy == TransferOptions.CLEAR_SWAP and
+                        table_operations.is_referenced_by_foreign_keys(self.target, table_name)):
+                    logger.warning(f"{table_name} foreign key ile referans edildiği için swap yerine TRUNCATE kullanılıyor")
+                    clear_strategy = TransferOptions.CLEAR_TRUNCATE
             
-            # Veriyi parçalar halinde aktar
-            rows_transferred = 0
-            offset = 0
+                if clear_strategy == TransferOptions.CLEAR_SWAP:
+                    shadow_table = table_operations.create_shadow_table(self.target, target_table)
+                elif clear_strategy == TransferOptions.CLEAR_DELETE:
+                    table_operations.delete_rows(self.target, table_name)
+                    logger.info(f"{table_name} temizlendi")
+                else:
+                    table_operations.truncate_table(self.target, table_name)
+                    logger.info(f"{table_name} temizlendi")
             
-            while True:
-                # Kaynak veriden bir parça al
+            # İndeks ve foreign key'leri yükleme sonrasına ertele (gerekirse).
+            # Gölge tablo zaten ikincil indeksler olmadan yüklenir.
+            deferred = None
+            if options.defer_indexes and shadow_table is None:
+                deferred = table_operations.capture_deferrable_objects(self.target, table_name)
+                table_operations.drop_deferrable_objects(self.target, table_name, deferred)
+            
+            # Upsert yalnızca mevcut tabloya yazarken anlamlıdır; gölge tablo boştur
+            upsert_keys = None
+            if options.write_mode == TransferOptions.WRITE_UPSERT and shadow_table is None:
+                upsert_keys = [column.name for column in self._get_key_columns(target_table)]
+                if not upsert_keys:
+                    raise Exception("Upsert için hedef tabloda birincil anahtar veya unique indeks gerekli")
+            
+            try:
+                rows_transferred = self._copy_table_rows(
+                    table_name, source_table, shadow_table if shadow_table is not None else target_table,
+                    total_rows, options, progress, progress_callback,
+                    upsert_keys=upsert_keys,
+                    # Gölge tablo hata durumunda silindiği için devam ettirilemez
+                    checkpoint=checkpoint if shadow_table is None else None,
+                    checksum=checksum
+                )
+            except Exception:
+                if shadow_table is not None:
+                    table_operations.drop_table(self.target, shadow_table.name)
+                raise
+            finally:
+                # Yükleme başarısız olsa bile hedef tablo eski yapısına döndürülür
+                if deferred is not None:
+                    table_operations.restore_deferrable_objects(
+                        self.target, table_name, deferred, options.index_rebuild_workers
+                    )
+            
+            if shadow_table is not None:
+                shadow_indexes = table_operations.build_shadow_indexes(self.target, target_table, shadow_table)
+                table_operations.swap_shadow_table(self.target, target_table, shadow_table, shadow_indexes)
+                self.target.invalidate(shadow_table.name)
+                self.target.invalidate(table_name)
+                logger.info(f"{table_name} gölge tablo ile değiştirildi")
+                # Kopyalama sırasında kontrol noktası tutulmadı; tablo ancak
+                # değiştirme başarılı olunca tamamlanmış sayılır
+                if checkpoint is not None:
+                    checkpoint.finish(rows_transferred)
+            
+            return rows_transferred
+            
+        except Exception as e:
+            raise Exception(f"Veri aktarım hatası: {str(e)}")
+    
+    def _verify_table(self,
+                      table_name: str,
+                      options: TransferOptions,
+                      progress: TransferProgress,
+                      source_checksum: Optional[RowChecksum] = None):
+        """
+        Aktarılan tablonun kaynak ve hedefte aynı olduğunu doğrular.
+        
+        Satır sayıları her zaman COUNT(*) ile kesin olarak alınır. checksum
+        modunda satır sırasından bağımsız içerik özetleri de karşılaştırılır:
+        aynı dialect'te (PostgreSQL/MySQL) özet iki tarafta SQL ile
+        hesaplanır; diğer durumlarda kaynak özeti kopyalama sırasında
+        biriktirilmişse yeniden okunmaz, hedef satırlar akış halinde okunup
+        hash'lenir. İki taraf eşzamanlı hesaplanır.
+        
+        Args:
+            source_checksum: Kopyalama sırasında biriktirilen kaynak özeti
+        """
+        try:
+            source_table = self.source.get_table(table_name)
+            target_table = self.target.get_table(table_name)
+            column_names = [column.name for column in source_table.columns]
+            use_checksum = options.verify == TransferOptions.VERIFY_CHECKSUM
+            use_sql = supports_sql_checksum(self.source, self.target)
+            # Kopyalama sırasında biriktirilen özet dönüştürülmüş satırlardan
+            # hesaplanır; kaynaktan yeniden okunurken de aynı plan uygulanır
+            plan = compile_plan(source_table, self.source.db_type, self.target.db_type)
+            
+            def summarize(connection: DatabaseConnection,
+                          table: Table,
+                          accumulated: Optional[RowChecksum],
+                          table_plan: Optional[ConversionPlan] = None):
+                if not use_checksum:
+                    return connection.count_rows(table.name), None
+                if accumulated is not None and not use_sql:
+                    return accumulated.result()
+                return compute_checksum(
+                    connection, table, column_names, None, use_sql, options.chunk_size, table_plan
+                )
+            
+            self.source.ensure_pool_size(2)
+            self.target.ensure_pool_size(2)
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix=f"verify-{table_name}") as executor:
+                source_future = executor.submit(summarize, self.source, source_table, source_checksum, plan)
+                target_future = executor.submit(summarize, self.target, target_table, None)
+                source_rows, source_sum = source_future.result()
+                target_rows, target_sum = target_future.result()
+            
+            result = {
+                'source_rows': source_rows,
+                'target_rows': target_rows,
+                'source_checksum': source_sum,
+                'target_checksum': target_sum,
+                'matched': source_rows == target_rows and source_sum == target_sum,
+            }
+            progress.set_verification(table_name, result)
+            if result['matched']:
+                logger.info(f"{table_name} doğrulandı: {source_rows} satır")
+            else:
+                logger.warning(f"{table_name} doğrulaması başarısız: {result}")
+            
+        except Exception as e:
+            raise Exception(f"Doğrulama hatası: {str(e)}")
+    
+    def _get_state_store(self, options: TransferOptions) -> TransferStateStore:
+        """Durum deposunu ilk kullanımda açar"""
+        if self.state_store is None or self.state_store.storage_file != options.state_file:
+            self.state_store = TransferStateStore(options.state_file)
+        return self.state_store
+    
+    def _get_watermark_column(self, table: Table, options: TransferOptions) -> Optional[Column]:
+        """
+        Artımlı aktarımda kullanılacak watermark sütununu seçer
+        
+        Öncelik sırası: watermark_columns seçeneği, tek sütunlu otomatik artan
+        tamsayı birincil anahtar, updated_at benzeri zaman damgası sütunu.
+        """
+        column_name = options.watermark_columns.get(table.name)
+        if column_name:
+            if column_name not in table.columns:
+                raise Exception(f"Watermark sütunu bulunamadı: {table.name}.{column_name}")
+            return table.columns[column_name]
+        
+        primary_key = list(table.primary_key.columns)
+        if (len(primary_key) == 1 and isinstance(primary_key[0].type, Integer) and
+                primary_key[0].autoincrement in (True, 'auto')):
+            return primary_key[0]
+        
+        for name in self.WATERMARK_COLUMN_NAMES:
+            for column in table.columns:
+                if column.name.lower() == name and isinstance(column.type, (DateTime, Date)):
+                    return column
+        return None
+    
+    def _transfer_incremental(self,
+                              table_name: str,
+                              options: TransferOptions,
+                              progress: TransferProgress,
+                              progress_callback: Optional[Callable] = None) -> int:
+        """
+        Watermark sütunu son kayıtlı değerden büyük olan satırları hedefe upsert eder
+        
+        Aktarılacak üst sınır (MAX) başta okunur ve satırlar (son değer, üst sınır]
+        aralığıyla sınırlanır; aktarım başarıyla biterse üst sınır yeni watermark
+        olarak kaydedilir. Böylece aktarım sırasında eklenen satırlar bir sonraki
+        çalıştırmaya kalır, yarıda kalan bir çalıştırma ise tekrarlanabilir.
+        
+        Returns:
+            Aktarılan satır sayısı
+        """
+        try:
+            source_table = self.source.get_table(table_name)
+            target_table = self.target.get_table(table_name)
+            
+            watermark_column = self._get_watermark_column(source_table, options)
+            if watermark_column is None:
+                raise Exception(
+                    "Watermark sütunu bulunamadı; watermark_columns seçeneği ile belirtin"
+                )
+            
+            upsert_keys = [column.name for column in self._get_key_columns(target_table)]
+            if not upsert_keys:
+                raise Exception("Upsert için hedef tabloda birincil anahtar veya unique indeks gerekli")
+            
+            store = self._get_state_store(options)
+            source_id = self.source.get_identity()
+            target_id = self.target.get_identity()
+            
+            last_value = None
+            saved = store.get_watermark(source_id, target_id, table_name)
+            if saved is not None:
+                if saved[0] == watermark_column.name:
+                    last_value = saved[1]
+                else:
+                    logger.warning(f"{table_name} watermark sütunu değişti, tablo baştan aktarılıyor")
+            
+            lower_condition = watermark_column > last_value if last_value is not None else None
+            with self.source.engine.connect() as source_conn:
+                max_stmt = select(func.max(watermark_column))
+                if lower_condition is not None:
+                    max_stmt = max_stmt.where(lower_condition)
+                high_value = source_conn.execute(max_stmt).scalar()
+            
+            if high_value is None:
+                logger.info(f"{table_name}: watermark'tan sonra yeni satır yok")
+                progress.update(table_name, 0, 0)
+                return 0
+            
+            row_filter = watermark_column <= high_value
+            if lower_condition is not None:
+                row_filter = and_(lower_condition, row_filter)
+            
+            if last_value is None and options.row_count_mode != TransferOptions.ROW_COUNT_EXACT:
+                total_rows = self.source.estimate_row_count(table_name) or 0
+            else:
                 with self.source.engine.connect() as source_conn:
-                    select_stmt = source_table.select().limit(options.chunk_size).offset(offset)
-                    rows = source_conn.execute(select_stmt).fetchall()
-                
-                if not rows:
-                    break
-                
-                # Hedef veritabanına ekle
-                with self.target.engine.connect() as target_conn:
-                    # Row nesnelerini dictionary'e çevir
-                    rows_dict = [dict(row._mapping) for row in rows]
+                    total_rows = source_conn.execute(
+                        select(func.count()).select_from(source_table).where(row_filter)
+                    ).scalar()
+            
+            progress.update(table_name, 0, total_rows)
+            
+            rows_transferred = self._copy_table_rows(
+                table_name, source_table, target_table, total_rows,
+                options, progress, progress_callback,
+                row_filter=row_filter, upsert_keys=upsert_keys
+            )
+            
+            store.set_watermark(source_id, target_id, table_name, watermark_column.name, high_value)
+            return rows_transferred
+            
+        except Exception as e:
+            raise Exception(f"Artımlı aktarım hatası: {str(e)}")
+    
+    def _transfer_diff(self,
+                       table_name: str,
+                       options: TransferOptions,
+                       progress: TransferProgress,
+                       progress_callback: Optional[Callable] = None) -> int:
+        """
+        Anahtar aralıklarının özetlerini karşılaştırarak yalnızca farklı
+        aralıkları yeniden kopyalar (tablolar için rsync yaklaşımı).
+        
+        Tablo diff_ranges aralığa bölünür; her aralığın satır sayısı ve
+        özeti kaynak ve hedefte eşzamanlı hesaplanır. Aynı dialect'te
+        (PostgreSQL/MySQL) özet SQL ile veritabanında, diğer durumlarda
+        satırlar okunarak Python'da hesaplanır. Farklı çıkan aralık
+        diff_min_rows satırdan büyükse tekrar bölünür, değilse hedefteki
+        satırları silinip kaynaktan yeniden kopyalanır.
+        
+        Returns:
+            Yeniden kopyalanan satır sayısı
+        """
+        try:
+            source_table = self.source.get_table(table_name)
+            target_table = self.target.get_table(table_name)
+            
+            key_columns = self._get_key_columns(source_table)
+            if not key_columns:
+                raise Exception("diff modu için birincil anahtar veya unique indeks gerekli")
+            target_key_columns = [target_table.columns[column.name] for column in key_columns]
+            
+            column_names = [column.name for column in source_table.columns]
+            use_sql = supports_sql_checksum(self.source, self.target)
+            
+            if options.row_count_mode == TransferOptions.ROW_COUNT_EXACT:
+                total_rows = self.source.count_rows(table_name)
+            else:
+                total_rows = self.source.estimate_row_count(table_name) or 0
+            progress.update(table_name, 0, total_rows)
+            
+            writer = create_writer(self.target, target_table, column_names, options.bulk_load)
+            plan = compile_plan(source_table, self.source.db_type, self.target.db_type)
+            chunk_sizer = FixedChunkSizer(options.chunk_size)
+            self.source.ensure_pool_size(2)
+            self.target.ensure_pool_size(2)
+            
+            def range_condition(columns: List[Column], lower_key, upper_key):
+                conditions = []
+                if lower_key is not None:
+                    conditions.append(self._key_condition(columns, lower_key, '>='))
+                if upper_key is not None:
+                    conditions.append(self._key_condition(columns, upper_key, '<'))
+                return and_(*conditions) if conditions else None
+            
+            rows_copied = 0
+            ranges_compared = 0
+            ranges_copied = 0
+            pending = self._compute_key_ranges(source_table, key_columns, options.diff_ranges, total_rows)
+            pending.reverse()
+            
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix=f"diff-{table_name}") as executor:
+                while pending:
+                    lower_key, upper_key = pending.pop()
+                    ranges_compared += 1
+                    
+                    source_future = executor.submit(
+                        compute_checksum, self.source, source_table, column_names,
+                        range_condition(key_columns, lower_key, upper_key), use_sql, options.chunk_size,
+                        plan
+                    )
+                    target_future = executor.submit(
+                        compute_checksum, self.target, target_table, column_names,
+                        range_condition(target_key_columns, lower_key, upper_key), use_sql, options.chunk_size
+                    )
+                    source_summary = source_future.result()
+                    target_summary = target_future.result()
+                    
+                    if source_summary == target_summary:
+                        continue
+                    
+                    source_rows = source_summary[0]
+                    if max(source_rows, target_summary[0]) > options.diff_min_rows:
+                        sub_ranges = self._compute_key_ranges(
+                            source_table, key_columns, options.diff_ranges, source_rows,
+                            lower_key, upper_key
+                        )
+                        if len(sub_ranges) > 1:
+                            pending.extend(reversed(sub_ranges))
+                            continue
                     
-                    if rows_dict:
-                        target_conn.execute(insert(target_table), rows_dict)
+                    # Aralığı hedefte silip kaynaktan yeniden kopyala. İkisi tek
+                    # transaction'da yapılır; kopyalama yarıda kalırsa silme de geri alınır.
+                    range_rows = 0
+                    with self.target.engine.connect() as target_conn:
+                        delete_stmt = target_table.delete()
+                        condition = range_condition(target_key_columns, lower_key, upper_key)
+                        if condition is not None:
+                            delete_stmt = delete_stmt.where(condition)
+                        target_conn.execute(delete_stmt)
+                        
+                        for rows in self._read_keyset_batches(
+                                source_table, key_columns, chunk_sizer, lower_key, upper_key):
+                            writer.write_in_transaction(target_conn.connection, plan.apply(rows))
+                            range_rows += len(rows)
                         target_conn.commit()
+                    
+                    rows_copied += range_rows
+                    ranges_copied += 1
+                    progress.update(table_name, rows_copied, max(total_rows, rows_copied))
+                    if progress_callback:
+                        progress_callback(progress)
+            
+            # Değişmeyen satırlar kopyalanmadığı için tablo burada tamamlanmış sayılır
+            progress.update(table_name, rows_copied, rows_copied)
+            if progress_callback:
+                progress_callback(progress)
+            
+            logger.info(
+                f"{table_name}: {ranges_compared} aralık karşılaştırıldı, "
+                f"{ranges_copied} aralık ({rows_copied} satır) yeniden kopyalandı"
+            )
+            return rows_copied
+            
+        except Exception as e:
+            raise Exception(f"Fark senkronizasyonu hatası: {str(e)}")
+    
+    def _copy_table_rows(self,
+                         table_name: str,
+                         source_table: Table,
+                         target_table: Table,
+                         total_rows: int,
+                         options: TransferOptions,
+                         progress: TransferProgress,
+                         progress_callback: Optional[Callable] = None,
+                         row_filter=None,
+                         upsert_keys: Optional[List[str]] = None,
+                         checkpoint: Optional[TableCheckpoint] = None,
+                         checksum: Optional[RowChecksum] = None) -> int:
+        """
+        Kaynak tablonun satırlarını hedef tabloya (veya gölge tabloya) kopyalar
+        
+        Args:
+            row_filter: Kaynak satırlarına uygulanacak ek WHERE koşulu
+            upsert_keys: Verilirse satırlar bu anahtara göre upsert edilir
+            checkpoint: Verilirse her commit edilen parçadan sonra aralığın son
+                anahtarı kaydedilir; devam ederken kayıtlı aralıklar kullanılır
+            checksum: Verilirse okunan satırlar yazılırken bu özete eklenir
+                (doğrudan COPY ile aktarılan satırlar eklenemez)
+        
+        Returns:
+            Aktarılan satır sayısı
+        """
+        # Veriyi parçalar halinde aktar
+        key_columns = None
+        if options.pagination == TransferOptions.PAGINATION_KEYSET:
+            key_columns = self._get_key_columns(source_table)
+            if not key_columns:
+                logger.info(f"{table_name} için anahtar bulunamadı, OFFSET sayfalamaya geçiliyor")
+        
+        # Tabloyu anahtar aralıklarına böl (gerekirse)
+        key_ranges = [(None, None)]
+        resuming = checkpoint is not None and checkpoint.can_resume() and key_columns
+        if resuming:
+            key_ranges = checkpoint.key_ranges
+        elif options.table_partitions > 1:
+            if key_columns:
+                if not total_rows:
+                    # Örnekleme için satır sayısı gerekir
+                    total_rows = self.source.count_rows(table_name)
+                key_ranges = self._compute_key_ranges(
+                    source_table, key_columns, options.table_partitions, total_rows
+                )
+            else:
+                logger.info(f"{table_name} anahtarsız olduğu için bölünmeden aktarılıyor")
+        
+        column_names = [column.name for column in source_table.columns]
+        rows_transferred = checkpoint.rows if resuming else 0
+        progress_lock = threading.Lock()
+        
+        def on_batch_written(row_count: int, partition: int, partition_rows: int):
+            nonlocal rows_transferred, total_rows
+            with progress_lock:
+                rows_transferred += row_count
                 
-                rows_transferred += len(rows)
-                offset += options.chunk_size
+                # Tahmin gerçek sayının altında kaldıysa düzelt
+                if rows_transferred > total_rows:
+                    total_rows = rows_transferred
                 
                 # İlerleme güncelle
+                if len(key_ranges) > 1:
+                    progress.update_partition(table_name, partition, partition_rows)
                 progress.update(table_name, rows_transferred, total_rows)
                 if progress_callback:
                     progress_callback(progress)
                 
                 logger.info(f"{table_name}: {rows_transferred}/{total_rows} satır aktarıldı")
+        
+        writer = create_writer(
+            self.target, target_table, column_names, options.bulk_load,
+            upsert_keys, options.upsert_staging_rows
+        )
+        # Kaynak ve hedef dialect farklıysa değerler parça parça dönüştürülür
+        plan = compile_plan(source_table, self.source.db_type, self.target.db_type)
+        
+        if options.adaptive_chunk_size:
+            chunk_sizer = AdaptiveChunkSizer(
+                source_table,
+                target_batch_bytes=options.target_batch_bytes,
+                max_chunk_size=options.max_chunk_size
+            )
+            logger.info(f"{table_name}: başlangıç parça boyutu {chunk_sizer.next_size()}")
+        else:
+            chunk_sizer = FixedChunkSizer(options.chunk_size)
+        
+        # Hedefe yazılan (dönüştürülmüş) satırları döndürür
+        def write_batch(rows):
+            started = time.monotonic()
+            converted = plan.apply(rows)
+            writer.write(converted)
+            chunk_sizer.record(rows, time.monotonic() - started)
+            return converted
+        
+        # PostgreSQL -> PostgreSQL: satırlar Python'a hiç çıkmadan COPY ile aktarılır
+        use_direct_copy = (
+            options.bulk_load and
+            not upsert_keys and
+            self.source.db_type == 'postgresql' and
+            self.target.db_type == 'postgresql'
+        )
+        
+        # Aynı sunucu: satırlar sunucu içinde INSERT ... SELECT ile kopyalanır
+        use_server_copy = (
+            options.same_server and
+            not upsert_keys and
+            row_filter is None and
+            self._is_same_server()
+        )
+        if use_server_copy:
+            use_direct_copy = False
+            logger.info(f"{table_name} aynı sunucuda, INSERT ... SELECT ile kopyalanıyor")
+        
+        # Sütun bazlı Arrow yolu (COPY ile doğrudan aktarım daha hızlı olduğu için onun yerine geçmez)
+        use_arrow = options.use_arrow and not use_direct_copy and not use_server_copy
+        if use_arrow and not arrow_batches.ARROW_AVAILABLE:
+            logger.warning("pyarrow kurulu değil, satır tabanlı aktarım kullanılıyor")
+            use_arrow = False
+        if use_arrow and not (
+                arrow_batches.adbc_available(self.source) or
+                (not upsert_keys and arrow_batches.adbc_available(self.target))):
+            # ADBC olmadan parçalar satır -> RecordBatch -> satır dönüşümünden geçer, kazanç yoktur
+            logger.info(f"{table_name}: ADBC sürücüsü bulunamadı, satır tabanlı aktarım kullanılıyor")
+            use_arrow = False
+        arrow_writer = None
+        if use_arrow:
+            arrow_writer = arrow_batches.ArrowWriter(
+                self.target, target_table, column_names, writer, ingest=not upsert_keys
+            )
+        
+        # Son anahtar yalnızca parçalar sırayla commit ediliyorsa kaydedilebilir
+        track_keys = bool(
+            checkpoint is not None and key_columns and not use_direct_copy and not use_server_copy and
+            (use_arrow or not options.pipelined or options.writer_threads <= 1)
+        )
+        key_positions = [column_names.index(column.name) for column in key_columns] if key_columns else []
+        if checkpoint is not None:
+            checkpoint.begin(key_ranges, resumable=track_keys)
+        
+        def copy_range(partition: int, lower_key, upper_key):
+            partition_rows = 0
+            after_key = None
+            if track_keys:
+                if checkpoint.is_partition_done(partition):
+                    return
+                after_key = checkpoint.last_key(partition)
             
-            return rows_transferred
+            def on_partition_batch_written(row_count: int):
+                nonlocal partition_rows
+                partition_rows += row_count
+                on_batch_written(row_count, partition, partition_rows)
             
-        except Exception as e:
-            raise Exception(f"Veri aktarım hatası: {str(e)}")
-
-
-# inspect import'unu ekleyelim
-from sqlalchemy import inspect
+            range_checksum = RowChecksum() if checksum is not None else None
+            checksum_lock = threading.Lock()
+            
+            def write_range_batch(rows):
+                written = write_batch(rows)
+                if range_checksum is not None:
+                    # Özet hedefle karşılaştırılacağı için dönüştürülmüş satırlardan
+                    # hesaplanır. Birden fazla yazıcı thread aynı aralığa yazabilir.
+                    with checksum_lock:
+                        range_checksum.add_rows(written)
+                if track_keys:
+                    last_row = rows[-1]
+                    checkpoint.record(partition, tuple(last_row[i] for i in key_positions), len(rows))
+            
+            if use_server_copy:
+                self._copy_same_server(
+                    source_table, target_table, column_names, key_columns,
+                    lower_key, upper_key, options.chunk_size, on_partition_batch_written
+                )
+                return
+            
+            if use_direct_copy:
+                self._copy_postgres_direct(
+                    source_table, target_table, column_names, key_columns,
+                    lower_key, upper_key, options.chunk_size, on_partition_batch_written,
+                    row_filter
+                )
+                return
+            
+            if use_arrow:
+                select_stmt = self._range_select(
+                    source_table, key_columns, lower_key, upper_key, row_filter, after_key
+                )
+                for batch in arrow_batches.read_arrow_batches(
+                        self.source, source_table, select_stmt, chunk_sizer):
+                    started = time.monotonic()
+                    arrow_writer.write(arrow_batches.apply_plan(plan, batch))
+                    if batch.num_rows:
+                        chunk_sizer.record_measured(
+                            batch.num_rows, batch.nbytes // batch.num_rows, time.monotonic() - started
+                        )
+                    if track_keys:
+                        last_index = batch.num_rows - 1
+                        last_key = tuple(batch.column(i)[last_index].as_py() for i in key_positions)
+                        checkpoint.record(partition, last_key, batch.num_rows)
+                    on_partition_batch_written(batch.num_rows)
+                if track_keys:
+                    checkpoint.finish_partition(partition)
+                return
+            
+            if options.read_strategy == TransferOptions.READ_STREAM:
+                batches = self._read_stream_batches(
+                    source_table, key_columns, chunk_sizer, lower_key, upper_key, row_filter, after_key
+                )
+            elif key_columns:
+                batches = self._read_keyset_batches(
+                    source_table, key_columns, chunk_sizer, lower_key, upper_key, row_filter, after_key
+                )
+            else:
+                batches = self._read_offset_batches(source_table, chunk_sizer, row_filter)
+            
+            if options.pipelined:
+                self._run_pipelined(batches, write_range_batch, on_partition_batch_written, options)
+            else:
+                for rows in batches:
+                    write_range_batch(rows)
+                    on_partition_batch_written(len(rows))
+            
+            if track_keys:
+                checkpoint.finish_partition(partition)
+            if range_checksum is not None:
+                with progress_lock:
+                    checksum.merge(range_checksum)
+        
+        try:
+            if len(key_ranges) == 1:
+                copy_range(0, *key_ranges[0])
+            else:
+                logger.info(f"{table_name} {len(key_ranges)} aralığa bölünerek aktarılıyor")
+                connections_per_range = 1 + (max(1, options.writer_threads) if options.pipelined else 1)
+                self.source.ensure_pool_size(len(key_ranges) * connections_per_range)
+                self.target.ensure_pool_size(len(key_ranges) * connections_per_range)
+            
+                with ThreadPoolExecutor(max_workers=len(key_ranges),
+                                        thread_name_prefix=f"transfer-{table_name}") as executor:
+                    futures = [
+                        executor.submit(copy_range, partition, lower_key, upper_key)
+                        for partition, (lower_key, upper_key) in enumerate(key_ranges)
+                    ]
+                    for future in futures:
+                        future.result()
+        finally:
+            if arrow_writer is not None:
+                arrow_writer.close()
+        
+        # Tahmin yerine kesin sonucu bildir
+        if total_rows != rows_transferred:
+            progress.update(table_name, rows_transferred, rows_transferred)
+            if progress_callback:
+                progress_callback(progress)
+        
+        if checkpoint is not None:
+            checkpoint.finish(rows_transferred)
+        
+        return rows_transferred
+    
+    def _is_same_server(self) -> bool:
+        """
+        Kaynak ve hedefin tek bir sorguyla birlikte okunabilir olup olmadığı.
+        
+        MySQL'de aynı sunucu ve kullanıcı ile farklı veritabanları
+        (veritabanı.tablo ile nitelenir), SQLite'ta iki farklı dosya (kaynak
+        ATTACH edilir) uygundur. PostgreSQL'de veritabanları arası sorgu
+        yapılamadığı için (dblink/postgres_fdw olmadan) bu yol kullanılmaz.
+        """
+        source, target = self.source, self.target
+        if not isinstance(source, DatabaseConnection) or not isinstance(target, DatabaseConnection):
+            return False
+        if source.db_type != target.db_type:
+            return False
+        if source.db_type == 'sqlite':
+            return os.path.abspath(source.database) != os.path.abspath(target.database)
+        if source.db_type == 'mysql':
+            return (
+                (source.host, source.port, source.username) == (target.host, target.port, target.username) and
+                source.database != target.database
+            )
+        return False
+    
+    def _copy_same_server(self,
+                          source_table: Table,
+                          target_table: Table,
+                          column_names: List[str],
+                          key_columns: List[Column],
+                          lower_key: Optional[Tuple[Any, ...]],
+                          upper_key: Optional[Tuple[Any, ...]],
+                          chunk_size: int,
+                          on_batch_written: Callable):
+        """
+        Aynı sunucudaki kaynak tablodan hedef tabloya INSERT ... SELECT ile
+        kopyalar; satırlar ağ üzerinden Python'a hiç gelmez.
+        
+        Anahtar varsa aralık, chunk_size satırlık alt aralıklara bölünür (her
+        sınır ORDER BY key OFFSET chunk_size ile indeks üzerinden bulunur) ve
+        her alt aralık ayrı bir transaction'da kopyalanır. Anahtar yoksa tablo
+        tek bir INSERT ... SELECT ile kopyalanır.
+        """
+        if self.source.db_type == 'sqlite':
+            # Hedef de main ile nitelenir; aksi halde bağlantının şema önbelleği
+            # eskiyse niteliksiz ad bağlanan kaynak dosyadaki tabloya çözülebilir
+            source_schema = self.SQLITE_SOURCE_SCHEMA
+            target_schema = 'main'
+        else:
+            source_schema = self.source.database
+            target_schema = None
+        
+        def qualify(table: Table, schema: Optional[str]) -> Table:
+            return Table(
+                table.name, MetaData(),
+                *[Column(column.name, column.type) for column in table.columns],
+                schema=schema
+            )
+        
+        # Kaynak tablonun hedef bağlantıdan nitelenmiş adla görünen kopyası
+        qualified = qualify(source_table, source_schema)
+        if target_schema is not None:
+            target_table = qualify(target_table, target_schema)
+        qualified_keys = [qualified.columns[column.name] for column in key_columns]
+        source_columns = [qualified.columns[name] for name in column_names]
+        
+        with self.target.engine.connect() as conn:
+            if self.source.db_type == 'sqlite':
+                conn.exec_driver_sql(
+                    f"ATTACH DATABASE ? AS {source_schema}", (os.path.abspath(self.source.database),)
+                )
+                conn.commit()
+            try:
+                chunk_lower = lower_key
+                while True:
+                    chunk_upper = upper_key
+                    if qualified_keys:
+                        boundary_stmt = select(*qualified_keys).order_by(*qualified_keys).offset(chunk_size).limit(1)
+                        if chunk_lower is not None:
+                            boundary_stmt = boundary_stmt.where(self._key_condition(qualified_keys, chunk_lower, '>='))
+                        if upper_key is not None:
+                            boundary_stmt = boundary_stmt.where(self._key_condition(qualified_keys, upper_key, '<'))
+                        boundary = conn.execute(boundary_stmt).first()
+                        if boundary is not None:
+                            chunk_upper = tuple(boundary)
+                    
+                    select_stmt = select(*source_columns)
+                    if qualified_keys:
+                        if chunk_lower is not None:
+                            select_stmt = select_stmt.where(self._key_condition(qualified_keys, chunk_lower, '>='))
+                        if chunk_upper is not None:
+                            select_stmt = select_stmt.where(self._key_condition(qualified_keys, chunk_upper, '<'))
+                    
+                    result = conn.execute(
+                        insert(target_table).from_select(column_names, select_stmt)
+                    )
+                    conn.commit()
+                    if result.rowcount and result.rowcount > 0:
+                        on_batch_written(result.rowcount)
+                    
+                    if not qualified_keys or chunk_upper == upper_key:
+                        break
+                    chunk_lower = chunk_upper
+            finally:
+                if self.source.db_type == 'sqlite':
+                    conn.rollback()
+                    conn.exec_driver_sql(f"DETACH DATABASE {source_schema}")
+    
+    def _copy_postgres_direct(self,
+                              source_table: Table,
+                              target_table: Table,
+                              column_names: List[str],
+                              key_columns: List[Column],
+                              lower_key: Optional[Tuple[Any, ...]],
+                              upper_key: Optional[Tuple[Any, ...]],
+                              chunk_size: int,
+                              on_batch_written: Callable,
+                              row_filter=None):
+        """
+        PostgreSQL kaynaktan PostgreSQL hedefe COPY TO STDOUT / COPY FROM STDIN
+        ile aktarım yapar.
+        
+        Kaynak COPY çıktısı bir thread'de sınırlı bir _CopyPipe tamponuna
+        yazılır, hedef COPY aynı tampondan okur. Satırlar hiçbir zaman Python
+        nesnesine dönüştürülmez; ilerleme akıştaki satır sonları sayılarak
+        chunk_size satırda bir bildirilir.
+        """
+        select_stmt = select(*[source_table.columns[name] for name in column_names])
+        if row_filter is not None:
+            select_stmt = select_stmt.where(row_filter)
+        if key_columns:
+            if lower_key is not None:
+                select_stmt = select_stmt.where(self._key_condition(key_columns, lower_key, '>='))
+            if upper_key is not None:
+                select_stmt = select_stmt.where(self._key_condition(key_columns, upper_key, '<'))
+        select_sql = str(select_stmt.compile(
+            dialect=self.source.engine.dialect,
+            compile_kwargs={"literal_binds": True}
+        ))
+        
+        preparer = self.target.engine.dialect.identifier_preparer
+        columns_sql = ', '.join(preparer.quote(name) for name in column_names)
+        copy_out_sql = f"COPY ({select_sql}) TO STDOUT"
+        copy_in_sql = f"COPY {preparer.format_table(target_table)} ({columns_sql}) FROM STDIN"
+        
+        pending_rows = 0
+        
+        def on_data(row_count: int):
+            nonlocal pending_rows
+            pending_rows += row_count
+            if pending_rows >= chunk_size:
+                on_batch_written(pending_rows)
+                pending_rows = 0
+        
+        pipe = _CopyPipe(on_data)
+        
+        def copy_out():
+            # Bağlantı alınamazsa da okuyan taraf hatayı kuyruktan almalı
+            raw_conn = None
+            try:
+                raw_conn = self.source.engine.raw_connection()
+                cursor = raw_conn.cursor()
+                cursor.copy_expert(copy_out_sql, pipe)
+                cursor.close()
+                raw_conn.commit()
+                pipe.finish()
+            except Exception as e:
+                pipe.finish(e)
+            finally:
+                if raw_conn is not None:
+                    raw_conn.close()
+        
+        reader = threading.Thread(target=copy_out, name="copy-reader", daemon=True)
+        raw_conn = self.target.engine.raw_connection()
+        try:
+            reader.start()
+            cursor = raw_conn.cursor()
+            cursor.copy_expert(copy_in_sql, pipe)
+            cursor.close()
+            raw_conn.commit()
+        except Exception:
+            raw_conn.rollback()
+            raise
+        finally:
+            pipe.close()
+            reader.join()
+            raw_conn.close()
+        
+        if pending_rows:
+            on_batch_written(pending_rows)
+    
+    def _run_pipelined(self,
+                       batches: Iterable,
+                       write_batch: Callable,
+                       on_batch_written: Callable,
+                       options: TransferOptions):
+        """
+        Okuma ve yazmayı sınırlı bir kuyruk üzerinden eşzamanlı çalıştırır.
+        
+        Bir okuyucu thread kaynaktan parçaları kuyruğa doldurur, bir veya daha
+        fazla yazıcı thread kuyruğu boşaltıp hedefe yazar. Kuyruk doluyken
+        okuyucu bekler; böylece bellekte en fazla queue_depth parça tutulur.
+        Herhangi bir thread'de oluşan ilk hata aktarımı durdurur ve yeniden
+        fırlatılır.
+        """
+        writer_count = max(1, options.writer_threads)
+        batch_queue = queue.Queue(maxsize=max(1, options.queue_depth))
+        stop_event = threading.Event()
+        errors = []
+        end_of_data = object()
+        
+        def reader():
+            try:
+                for rows in batches:
+                    if stop_event.is_set():
+                        break
+                    batch_queue.put(rows)
+            except Exception as e:
+                errors.append(e)
+                stop_event.set()
+            finally:
+                if hasattr(batches, 'close'):
+                    batches.close()
+                # Yazıcılar hata durumunda da kuyruğu boşaltmaya devam ettiği
+                # için bu put'lar kilitlenmez
+                for _ in range(writer_count):
+                    batch_queue.put(end_of_data)
+        
+        def writer():
+            while True:
+                rows = batch_queue.get()
+                if rows is end_of_data:
+                    break
+                if stop_event.is_set():
+                    continue
+                try:
+                    write_batch(rows)
+                    on_batch_written(len(rows))
+                except Exception as e:
+                    errors.append(e)
+                    stop_event.set()
+        
+        threads = [threading.Thread(target=reader, name="transfer-reader", daemon=True)]
+        for i in range(writer_count):
+            threads.append(threading.Thread(target=writer, name=f"transfer-writer-{i}", daemon=True))
+        
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        if errors:
+            raise errors[0]
+    
+    def _get_key_columns(self, table: Table) -> List[Column]:
+        """
+        Keyset sayfalama için kullanılacak anahtar sütunlarını bulur.
+        
+        Önce birincil anahtar, yoksa tüm sütunları NOT NULL olan bir unique
+        index/kısıt aranır. Uygun anahtar yoksa boş liste döner.
+        
+        Returns:
+            Sıralı anahtar sütunları listesi
+        """
+        if table.primary_key is not None and len(table.primary_key.columns) > 0:
+            return list(table.primary_key.columns)
+        
+        candidates = []
+        for index in table.indexes:
+            if index.unique:
+                candidates.append(list(index.columns))
+        for constraint in table.constraints:
+            if isinstance(constraint, UniqueConstraint):
+                candidates.append(list(constraint.columns))
+        
+        for columns in sorted(candidates, key=len):
+            if columns and all(not column.nullable for column in columns):
+                return columns
+        
+        return []
+    
+    def _compute_key_ranges(self,
+                            source_table: Table,
+                            key_columns: List[Column],
+                            partitions: int,
+                            total_rows: Optional[int],
+                            lower_key: Optional[Tuple[Any, ...]] = None,
+                            upper_key: Optional[Tuple[Any, ...]] = None) -> List[Tuple[Any, Any]]:
+        """
+        Tabloyu (veya verilen anahtar aralığını) yaklaşık eşit büyüklükte
+        anahtar aralıklarına böler.
+        
+        Tek sütunlu tamsayı anahtarlarda MIN/MAX arası eşit bölünür; diğer
+        anahtarlarda sıralı anahtardan her N'inci değer örneklenir.
+        
+        Args:
+            total_rows: Bölünecek aralıktaki satır sayısı (örnekleme için)
+            lower_key: Bölünecek aralığın alt sınırı (dahil)
+            upper_key: Bölünecek aralığın üst sınırı (hariç)
+        
+        Returns:
+            (alt_sınır_dahil, üst_sınır_hariç) anahtar demetleri listesi.
+            None sınırın açık olduğunu belirtir.
+        """
+        boundaries = []
+        conditions = []
+        if lower_key is not None:
+            conditions.append(self._key_condition(key_columns, lower_key, '>='))
+        if upper_key is not None:
+            conditions.append(self._key_condition(key_columns, upper_key, '<'))
+        
+        with self.source.engine.connect() as conn:
+            if len(key_columns) == 1 and isinstance(key_columns[0].type, Integer):
+                key = key_columns[0]
+                low, high = conn.execute(select(func.min(key), func.max(key)).where(*conditions)).one()
+                if low is None:
+                    return [(lower_key, upper_key)]
+                
+                step = (high - low + 1) / partitions
+                for i in range(1, partitions):
+                    boundaries.append((low + int(step * i),))
+            elif total_rows:
+                for i in range(1, partitions):
+                    row = conn.execute(
+                        select(*key_columns)
+                        .where(*conditions)
+                        .order_by(*key_columns)
+                        .limit(1)
+                        .offset(total_rows * i // partitions)
+                    ).first()
+                    if row is not None:
+                        boundaries.append(tuple(row))
+        
+        # Tekrarlanan sınırları kaldır (küçük veya çarpık tablolar)
+        unique_boundaries = []
+        for boundary in boundaries:
+            if lower_key is not None and boundary <= tuple(lower_key):
+                continue
+            if not unique_boundaries or boundary > unique_boundaries[-1]:
+                unique_boundaries.append(boundary)
+        
+        key_ranges = []
+        for boundary in unique_boundaries:
+            key_ranges.append((lower_key, boundary))
+            lower_key = boundary
+        key_ranges.append((lower_key, upper_key))
+        return key_ranges
+    
+    def _key_condition(self, key_columns: List[Column], values: Tuple[Any, ...], operator: str):
+        """
+        (k1, k2, ...) <op> (v1, v2, ...) karşılaştırmasını tüm dialect'lerde
+        çalışan OR/AND zincirine açar. operator: '>', '>=' veya '<'
+        """
+        clauses = []
+        for i, column in enumerate(key_columns):
+            equals = [key_columns[j] == values[j] for j in range(i)]
+            if operator == '<':
+                clauses.append(and_(*equals, column < values[i]))
+            else:
+                clauses.append(and_(*equals, column > values[i]))
+        if operator == '>=':
+            clauses.append(and_(*[column == values[i] for i, column in enumerate(key_columns)]))
+        return or_(*clauses)
+    
+    def _read_keyset_batches(self,
+                             source_table: Table,
+                             key_columns: List[Column],
+                             chunk_sizer,
+                             lower_key: Optional[Tuple[Any, ...]] = None,
+                             upper_key: Optional[Tuple[Any, ...]] = None,
+                             row_filter=None,
+                             after_key: Optional[Tuple[Any, ...]] = None):
+        """
+        Kaynak tabloyu WHERE key > son_anahtar ORDER BY key ile parça parça okur.
+        Her parça indeks üzerinden başladığı için önceki satırlar yeniden taranmaz.
+        lower_key (dahil) ve upper_key (hariç) verilirse yalnızca o aralık,
+        row_filter verilirse yalnızca koşulu sağlayan satırlar okunur.
+        after_key verilirse okuma bu anahtardan sonra başlar (devam ederken).
+        """
+        column_names = [column.name for column in source_table.columns]
+        key_positions = [column_names.index(column.name) for column in key_columns]
+        last_key = after_key
+        
+        while True:
+            chunk_size = chunk_sizer.next_size()
+            select_stmt = source_table.select().order_by(*key_columns).limit(chunk_size)
+            if row_filter is not None:
+                select_stmt = select_stmt.where(row_filter)
+            if last_key is not None:
+                select_stmt = select_stmt.where(self._key_condition(key_columns, last_key, '>'))
+            elif lower_key is not None:
+                select_stmt = select_stmt.where(self._key_condition(key_columns, lower_key, '>='))
+            if upper_key is not None:
+                select_stmt = select_stmt.where(self._key_condition(key_columns, upper_key, '<'))
+            
+            with self.source.engine.connect() as source_conn:
+                rows = source_conn.execute(select_stmt).fetchall()
+            
+            if not rows:
+                break
+            
+            yield rows
+            
+            if len(rows) < chunk_size:
+                break
+            
+            last_row = rows[-1]
+            last_key = tuple(last_row[i] for i in key_positions)
+    
+    def _read_offset_batches(self, source_table: Table, chunk_sizer, row_filter=None):
+        """Anahtarı olmayan tablolar için LIMIT/OFFSET ile parça parça okur"""
+        offset = 0
+        
+        while True:
+            chunk_size = chunk_sizer.next_size()
+            with self.source.engine.connect() as source_conn:
+                select_stmt = source_table.select().limit(chunk_size).offset(offset)
+                if row_filter is not None:
+                    select_stmt = select_stmt.where(row_filter)
+                rows = source_conn.execute(select_stmt).fetchall()
+            
+            if not rows:
+                break
+            
+            yield rows
+            offset += len(rows)
+    
+    def _range_select(self,
+                      source_table: Table,
+                      key_columns: List[Column],
+                      lower_key: Optional[Tuple[Any, ...]] = None,
+                      upper_key: Optional[Tuple[Any, ...]] = None,
+                      row_filter=None,
+                      after_key: Optional[Tuple[Any, ...]] = None):
+        """
+        Bir anahtar aralığını anahtar sırasıyla okuyan tek SELECT'i oluşturur.
+        after_key verilirse lower_key yerine bu anahtardan sonrası okunur.
+        """
+        select_stmt = source_table.select()
+        if row_filter is not None:
+            select_stmt = select_stmt.where(row_filter)
+        if key_columns:
+            select_stmt = select_stmt.order_by(*key_columns)
+            if after_key is not None:
+                select_stmt = select_stmt.where(self._key_condition(key_columns, after_key, '>'))
+            elif lower_key is not None:
+                select_stmt = select_stmt.where(self._key_condition(key_columns, lower_key, '>='))
+            if upper_key is not None:
+                select_stmt = select_stmt.where(self._key_condition(key_columns, upper_key, '<'))
+        return select_stmt
+    
+    def _read_stream_batches(self,
+                             source_table: Table,
+                             key_columns: List[Column],
+                             chunk_sizer,
+                             lower_key: Optional[Tuple[Any, ...]] = None,
+                             upper_key: Optional[Tuple[Any, ...]] = None,
+                             row_filter=None,
+                             after_key: Optional[Tuple[Any, ...]] = None):
+        """
+        Tabloyu tek bir sorgu ve açık kalan tek bir cursor ile okur.
+        after_key verilirse okuma bu anahtardan sonra başlar.
+        
+        PostgreSQL için psycopg2 named cursor (stream_results), MySQL için
+        unbuffered cursor, SQLite için düz cursor iterasyonu kullanılır.
+        Bellekte aynı anda yalnızca bir parça tutulur.
+        """
+        select_stmt = self._range_select(
+            source_table, key_columns, lower_key, upper_key, row_filter, after_key
+        )
+        
+        if self.source.db_type == 'mysql':
+            # SQLAlchemy'nin mysqlconnector dialect'i buffered cursor kullanır,
+            # bu yüzden ham bağlantı üzerinden unbuffered cursor açılır
+            compiled = select_stmt.compile(dialect=self.source.engine.dialect)
+            params = compiled.construct_params()
+            if compiled.positional:
+                params = tuple(params[name] for name in compiled.positiontup)
+            raw_conn = self.source.engine.raw_connection()
+            try:
+                cursor = raw_conn.cursor(buffered=False)
+                try:
+                    cursor.execute(str(compiled), params)
+                    while True:
+                        rows = cursor.fetchmany(chunk_sizer.next_size())
+                        if not rows:
+                            break
+                        yield rows
+                finally:
+                    cursor.close()
+            finally:
+                raw_conn.close()
+            return
+        
+        with self.source.engine.connect() as source_conn:
+            result = source_conn.execution_options(
+                stream_results=True,
+                yield_per=chunk_sizer.next_size()
+            ).execute(select_stmt)
+            while True:
+                rows = result.fetchmany(chunk_sizer.next_size())
+                if not rows:
+                    break
+                yield rows
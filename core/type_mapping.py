@@ -0,0 +1,286 @@
+"""
+Tip Eşleme Modülü
+Bu modül, kaynak dialect'e özgü sütun tiplerini hedef dialect'te karşılığı
+olan tiplere çeviren kayıt defterini ve tablo başına bir kez derlenen,
+satırlara parça parça uygulanan değer dönüştürme planını içerir.
+"""
+
+from sqlalchemy import Table
+from sqlalchemy.types import (
+    TypeEngine, Boolean, SmallInteger, Integer, BigInteger, Numeric, Float,
+    String, Text, Enum, DateTime, Time, LargeBinary, JSON, ARRAY, Uuid
+)
+from sqlalchemy.dialects import mysql, postgresql
+from sqlalchemy.sql import sqltypes
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Değer dönüştürücü: None olmayan tek bir değeri hedefin beklediği değere çevirir
+Converter = Callable[[Any], Any]
+
+# Eşleme kuralı: kaynak tipi alır, (hedef tip, dönüştürücü) veya uygulanamıyorsa None döndürür
+MappingRule = Callable[[TypeEngine], Optional[Tuple[TypeEngine, Optional[Converter]]]]
+
+
+class TypeMappingRegistry:
+    """
+    (kaynak dialect, hedef dialect, tip sınıfı) anahtarlı tip eşleme kuralları.
+    
+    Bir tip için kurallar, tipin sınıf hiyerarşisinde en özel sınıftan
+    başlanarak aranır; aynı sınıfta dialect'i tam eşleşen kurallar '*'
+    kurallarından önce denenir. Hiçbir kural uygulanmazsa dialect'e özgü tip
+    genel SQLAlchemy karşılığına (as_generic) çevrilir. Kaynak ve hedef aynı
+    dialect'teyse tipler olduğu gibi kullanılır.
+    """
+    
+    ANY = '*'
+    
+    def __init__(self):
+        self._rules: Dict[Tuple[str, str, type], List[MappingRule]] = {}
+    
+    def register(self, source_dialect: str, target_dialect: str, type_class: type, rule: MappingRule):
+        """
+        Yeni bir eşleme kuralı ekler (aynı anahtarda sonra eklenen önce denenir)
+        
+        Args:
+            source_dialect: Kaynak dialect adı veya '*'
+            target_dialect: Hedef dialect adı veya '*'
+            type_class: Kuralın uygulanacağı tip sınıfı (alt sınıfları da kapsar)
+            rule: Kaynak tipi alıp (hedef tip, dönüştürücü) döndüren fonksiyon
+        """
+        self._rules.setdefault((source_dialect, target_dialect, type_class), []).insert(0, rule)
+    
+    def map_type(self,
+                 source_type: TypeEngine,
+                 source_dialect: str,
+                 target_dialect: str) -> Tuple[TypeEngine, Optional[Converter]]:
+        """
+        Kaynak tipin hedefteki karşılığını ve gerekiyorsa değer dönüştürücüsünü bulur
+        
+        Returns:
+            (hedef tip, dönüştürücü veya None)
+        """
+        if source_dialect == target_dialect:
+            return source_type, None
+        
+        keys = [
+            (source_dialect, target_dialect),
+            (source_dialect, self.ANY),
+            (self.ANY, target_dialect),
+            (self.ANY, self.ANY),
+        ]
+        for type_class in type(source_type).__mro__:
+            for source_key, target_key in keys:
+                for rule in self._rules.get((source_key, target_key, type_class), ()):
+                    mapped = rule(source_type)
+                    if mapped is not None:
+                        return mapped
+        
+        try:
+            return source_type.as_generic(), None
+        except NotImplementedError:
+            logger.warning(f"{source_type!r} için genel tip bulunamadı, tip olduğu gibi kullanılıyor")
+            return source_type, None
+
+
+class ConversionPlan:
+    """
+    Bir tablo için bir kez derlenen sütun bazında dönüştürme planı.
+    
+    Dönüştürücüsü olmayan sütunlara hiç dokunulmaz; dönüştürülecek sütun
+    yoksa parçalar olduğu gibi geri döner. Aksi halde parça sütunlara
+    ayrılır, her dönüştürücü kendi sütununa tek bir döngüde uygulanır ve
+    satırlar yeniden birleştirilir.
+    """
+    
+    def __init__(self, target_types: Dict[str, TypeEngine], converters: List[Tuple[int, Converter]]):
+        """
+        Args:
+            target_types: {sütun adı: hedef tip}
+            converters: (sütun sırası, dönüştürücü) listesi
+        """
+        self.target_types = target_types
+        self.converters = converters
+    
+    def is_noop(self) -> bool:
+        return not self.converters
+    
+    def apply(self, rows):
+        """Bir parça satıra dönüştürücüleri uygular"""
+        if not self.converters or not rows:
+            return rows
+        
+        columns = list(zip(*rows))
+        for index, convert in self.converters:
+            columns[index] = [None if value is None else convert(value) for value in columns[index]]
+        return list(zip(*columns))
+
+
+def compile_plan(table: Table,
+                 source_dialect: str,
+                 target_dialect: str,
+                 registry: Optional[TypeMappingRegistry] = None) -> ConversionPlan:
+    """
+    Tablonun sütunları için hedef tipleri ve dönüştürme planını derler
+    
+    Args:
+        table: Kaynak tablo (sütun sırası satırlardaki sırayla aynıdır)
+        source_dialect: Kaynak dialect adı
+        target_dialect: Hedef dialect adı
+        registry: Kullanılacak kayıt defteri (varsayılan: default_registry)
+    
+    Returns:
+        ConversionPlan nesnesi
+    """
+    registry = registry or default_registry
+    target_types = {}
+    converters = []
+    for index, column in enumerate(table.columns):
+        target_type, converter = registry.map_type(column.type, source_dialect, target_dialect)
+        target_types[column.name] = target_type
+        if converter is not None:
+            converters.append((index, converter))
+    
+    if converters:
+        names = ', '.join(table.columns[index].name for index, _ in converters)
+        logger.info(f"{table.name} için dönüştürülecek sütunlar: {names}")
+    return ConversionPlan(target_types, converters)
+
+
+def _to_naive_utc(value):
+    """Saat dilimli zaman damgasını saat dilimsiz UTC'ye çevirir"""
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _to_json_compatible(value):
+    """Dizi elemanlarını JSON'a yazılabilir değerlere çevirir"""
+    if isinstance(value, (list, tuple)):
+        return [_to_json_compatible(item) for item in value]
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex()
+    if value is None or isinstance(value, (bool, int, float, str, dict)):
+        return value
+    return str(value)
+
+
+def _bit_to_int(value):
+    # Sürücü BIT değerini ham bayt olarak da döndürebilir
+    if isinstance(value, (bytes, bytearray)):
+        return int.from_bytes(value, 'big')
+    return int(value)
+
+
+def _bit_to_bytes(value):
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    return int(value).to_bytes(8, 'big')
+
+
+def _set_to_text(value):
+    if isinstance(value, (set, frozenset)):
+        return ','.join(sorted(value))
+    return value
+
+
+# MySQL işaretsiz tamsayıları hedefte bir üst genişliğe taşınır
+_UNSIGNED_WIDENING = [
+    (mysql.BIGINT, lambda: Numeric(20, 0)),
+    (mysql.INTEGER, BigInteger),
+    (mysql.MEDIUMINT, Integer),
+    (mysql.SMALLINT, Integer),
+    (mysql.TINYINT, SmallInteger),
+]
+
+
+def _mysql_unsigned(source_type):
+    if not getattr(source_type, 'unsigned', False):
+        return None
+    for type_class, factory in _UNSIGNED_WIDENING:
+        if isinstance(source_type, type_class):
+            return factory(), None
+    return None
+
+
+def _mysql_tinyint(source_type):
+    # TINYINT(1) MySQL'de boolean olarak kullanılır ve sürücüden int olarak gelir
+    if source_type.display_width == 1:
+        return Boolean(), bool
+    return None
+
+
+def _mysql_bit(source_type):
+    # BIT(1) bayrak olarak kullanılır; BIGINT'e sığmayan BIT(64) ham bayt olarak taşınır
+    length = source_type.length or 1
+    if length == 1:
+        return Boolean(), lambda value: bool(_bit_to_int(value))
+    if length < 64:
+        return BigInteger(), _bit_to_int
+    return LargeBinary(), _bit_to_bytes
+
+
+def _any_string_to_mysql(source_type):
+    # MySQL VARCHAR uzunluk ister ve TEXT 64KB ile sınırlıdır;
+    # uzunluksuz metin sütunları LONGTEXT olur
+    if source_type.length is None and not isinstance(source_type, Enum):
+        return mysql.LONGTEXT(), None
+    return None
+
+
+def _any_numeric_to_mysql(source_type):
+    # Hassasiyetsiz NUMERIC MySQL'de DECIMAL(10,0) olur ve kesirler kaybolur
+    if source_type.precision is None and not isinstance(source_type, Float):
+        return mysql.DECIMAL(65, 30), None
+    return None
+
+
+def _any_datetime_to_mysql(source_type):
+    # MySQL DATETIME varsayılan olarak mikrosaniyeleri atar
+    if getattr(source_type, 'timezone', False):
+        return mysql.DATETIME(fsp=6), _to_naive_utc
+    return mysql.DATETIME(fsp=6), None
+
+
+def _any_datetime_to_sqlite(source_type):
+    # SQLite saat dilimi saklamaz; offset atılıp yerel saat yazılmasın diye UTC'ye çevrilir
+    if getattr(source_type, 'timezone', False):
+        return DateTime(), _to_naive_utc
+    return None
+
+
+default_registry = TypeMappingRegistry()
+
+default_registry.register('mysql', '*', Integer, _mysql_unsigned)
+default_registry.register('mysql', '*', mysql.TINYINT, _mysql_tinyint)
+default_registry.register('mysql', '*', mysql.YEAR, lambda source_type: (SmallInteger(), None))
+default_registry.register('mysql', '*', mysql.SET, lambda source_type: (Text(), _set_to_text))
+default_registry.register('mysql', '*', mysql.ENUM, lambda source_type: (String(source_type.length), None))
+default_registry.register('mysql', '*', mysql.BIT, _mysql_bit)
+default_registry.register('mysql', '*', sqltypes._Binary, lambda source_type: (LargeBinary(), bytes))
+
+default_registry.register('postgresql', '*', postgresql.JSON, lambda source_type: (JSON(), None))
+default_registry.register('postgresql', '*', ARRAY, lambda source_type: (JSON(), _to_json_compatible))
+default_registry.register('postgresql', '*', Uuid, lambda source_type: (String(36), str))
+default_registry.register('postgresql', '*', postgresql.INET, lambda source_type: (String(43), str))
+default_registry.register('postgresql', '*', postgresql.CIDR, lambda source_type: (String(43), str))
+default_registry.register('postgresql', '*', postgresql.MACADDR, lambda source_type: (String(17), str))
+default_registry.register('postgresql', '*', LargeBinary, lambda source_type: (LargeBinary(), bytes))
+default_registry.register('postgresql', 'mysql', LargeBinary, lambda source_type: (mysql.LONGBLOB(), bytes))
+
+default_registry.register('*', 'mysql', String, _any_string_to_mysql)
+default_registry.register('*', 'mysql', Numeric, _any_numeric_to_mysql)
+default_registry.register('*', 'mysql', DateTime, _any_datetime_to_mysql)
+default_registry.register('*', 'mysql', Time, lambda source_type: (mysql.TIME(fsp=6), None))
+default_registry.register('*', 'mysql', LargeBinary, lambda source_type: (mysql.LONGBLOB(), None))
+
+default_registry.register('*', 'sqlite', DateTime, _any_datetime_to_sqlite)
@@ -0,0 +1,84 @@
+"""
+Sağlama toplamı testleri: dönüştürülen sütunlarda kaynak özeti, hedefe
+yazılan değerlerle hesaplanmalıdır.
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from sqlalchemy.types import String, Text
+
+from core.checksum import compute_checksum
+from core.database_connection import DatabaseConnection
+from core.type_mapping import TypeMappingRegistry, compile_plan
+
+
+def _set_like_text(value):
+    # MySQL SET dönüştürücüsü gibi: sıralanmış, virgülle ayrılmış metin
+    return ','.join(sorted(value.split('|')))
+
+
+class ComputeChecksumPlanTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.connections = []
+        rows = [(1, 'b|a'), (2, 'c'), (3, None), (4, 'c|b|a')]
+        self.source = self._connect('source.db', [(key, value) for key, value in rows])
+        self.target = self._connect('target.db', [
+            (key, None if value is None else _set_like_text(value)) for key, value in rows
+        ])
+        
+        registry = TypeMappingRegistry()
+        registry.register('sqlite', 'mysql', String, lambda source_type: (Text(), _set_like_text))
+        self.source_table = self.source.get_table('items')
+        self.target_table = self.target.get_table('items')
+        self.plan = compile_plan(self.source_table, 'sqlite', 'mysql', registry)
+        self.column_names = [column.name for column in self.source_table.columns]
+    
+    def tearDown(self):
+        for connection in self.connections:
+            connection.close()
+        self.directory.cleanup()
+    
+    def _connect(self, file_name, rows):
+        path = os.path.join(self.directory.name, file_name)
+        with sqlite3.connect(path) as raw:
+            raw.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, tags VARCHAR(20))")
+            raw.executemany("INSERT INTO items VALUES (?, ?)", rows)
+        raw.close()
+        connection = DatabaseConnection('sqlite', '', 0, '', '', path)
+        self.assertTrue(connection.connect())
+        self.connections.append(connection)
+        return connection
+    
+    def test_plan_makes_converted_column_match(self):
+        self.assertFalse(self.plan.is_noop())
+        source_summary = compute_checksum(
+            self.source, self.source_table, self.column_names, chunk_size=2, plan=self.plan
+        )
+        target_summary = compute_checksum(self.target, self.target_table, self.column_names, chunk_size=2)
+        self.assertEqual(source_summary, target_summary)
+    
+    def test_raw_source_values_do_not_match(self):
+        source_summary = compute_checksum(self.source, self.source_table, self.column_names)
+        target_summary = compute_checksum(self.target, self.target_table, self.column_names)
+        self.assertEqual(source_summary[0], target_summary[0])
+        self.assertNotEqual(source_summary[1], target_summary[1])
+    
+    def test_condition_limits_rows_with_plan(self):
+        condition = self.source_table.c.id >= 3
+        source_summary = compute_checksum(
+            self.source, self.source_table, self.column_names, condition, plan=self.plan
+        )
+        target_summary = compute_checksum(
+            self.target, self.target_table, self.column_names, self.target_table.c.id >= 3
+        )
+        self.assertEqual(source_summary[0], 2)
+        self.assertEqual(source_summary, target_summary)
+
+
+if __name__ == '__main__':
+    unittest.main()